@@ -13,9 +13,9 @@ log.info("Authentication admin config loading...")
 class ApiClientAdmin(admin.ModelAdmin):  # type: ignore
     """Admin configuration for the shoppingstore app."""
 
-    list_display = ("name", "user", "is_active")
+    list_display = ("name", "user", "key_id", "is_active")
     list_display_links = ("name",)
-    search_fields = ("name",)
+    search_fields = ("name", "key_id")
     list_filter = ("is_active",)
     list_per_page = 10
 
@@ -14,5 +14,9 @@ class AuthenticationConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "authentication"
 
+    def ready(self) -> None:
+        """Connect the signal receivers."""
+        from authentication import signals  # noqa: F401
+
 
 log.info("Authentication config loaded.")
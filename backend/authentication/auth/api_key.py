@@ -4,10 +4,12 @@ import logging
 from os import getenv
 
 from django.contrib.auth.hashers import check_password
-from django.contrib.auth.models import AnonymousUser
+from django.contrib.auth.models import AnonymousUser, User
 from django.http import HttpRequest
 from ninja.security import APIKeyHeader
 
+from authentication.auth import key_cache, keys
+from authentication.database.client_repository import get_active_client
 from authentication.database.user_repository import is_user_authenticated
 from authentication.models import ApiClient
 
@@ -15,32 +17,74 @@ log = logging.getLogger(__name__)
 log.info("Loading ninja API key auth...")
 
 
+def _use_client_user(request: HttpRequest, user: User) -> None:
+    """
+    Make the owner of the API client the user of the request, without loading the session.
+
+    Args:
+        request (HttpRequest): The request.
+        user (User): The owner of the API client.
+    """
+
+    async def auser() -> User:
+        return user
+
+    request.user = user
+    request.auser = auser
+
+
 class ApiKey(APIKeyHeader):
     """API key authentication class."""
 
     param_name = "X-API-Key"
 
-    async def authenticate(
-        self, request: HttpRequest, key: str | None
-    ) -> ApiClient | AnonymousUser | None:
-        """Authenticate the user."""
-        if getenv("TESTS_ENVIRONMENT", "False").lower() == "true":
-            return AnonymousUser()
+    async def _authenticate_legacy(self, request: HttpRequest, key: str) -> ApiClient | None:
+        """
+        Authenticate a key issued before key ids, which needs the session of the user.
 
+        Keys that were recently verified are not hashed again, the client must still be active.
+        """
         user = await request.auser()
         if not is_user_authenticated(user):
             return None
 
-        if key is None:
-            return None
-
         try:
-            client = await ApiClient.objects.aget(user=user, is_active=True)
+            client = await ApiClient.objects.aget(user=user, is_active=True, key_id__isnull=True)
+            if key_cache.is_verified(client.id, key, client.client_secret):
+                return client
             if check_password(key, client.client_secret):
+                key_cache.mark_verified(client.id, key, client.client_secret)
                 return client
             return None
         except ApiClient.DoesNotExist:
             return None
 
+    async def authenticate(
+        self, request: HttpRequest, key: str | None
+    ) -> ApiClient | AnonymousUser | None:
+        """
+        Authenticate the user.
+
+        Keys with a key id are checked with one indexed lookup and a keyed digest, the owner of
+        the client becomes the user of the request without a session.
+        """
+        if getenv("TESTS_ENVIRONMENT", "False").lower() == "true":
+            return AnonymousUser()
+
+        if key is None:
+            return None
+
+        parsed = keys.parse_key(key)
+        if parsed is None:
+            return await self._authenticate_legacy(request, key)
+
+        key_id, secret = parsed
+        client = await get_active_client(key_id)
+        if client is None or not keys.verify_secret(secret, client.secret_digest):
+            return None
+
+        _use_client_user(request, client.user)
+        return client
+
 
 log.info("Loaded ninja API key auth.")
@@ -0,0 +1,175 @@
+"""Contains the password hashing pool."""
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, TypeVar
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import hashers
+
+from authentication.errors.api_exceptions import PasswordHashingBusy
+
+log = logging.getLogger(__name__)
+log.info("Loading password hashing pool...")
+
+T = TypeVar("T")
+
+RETRY_AFTER_SECONDS = 1
+
+_executor: Executor | None = None
+_executor_broken = False
+_executor_lock = threading.Lock()
+_pending = 0
+_pending_lock = threading.Lock()
+
+
+def _hash_password(password: str) -> str:
+    """
+    Hash a password with the preferred hasher, run inside the pool.
+
+    Args:
+        password (str): The raw password.
+
+    Returns:
+        str: The encoded password.
+    """
+    return hashers.make_password(password)
+
+
+def _check_password(password: str, encoded: str) -> tuple[bool, bool]:
+    """
+    Check a password against its encoded form, run inside the pool.
+
+    Args:
+        password (str): The raw password.
+        encoded (str): The stored encoded password.
+
+    Returns:
+        tuple[bool, bool]: If the password matches, and if the encoded password should be
+            hashed again with the preferred hasher.
+    """
+    outdated: list[str] = []
+    valid = hashers.check_password(password, encoded, setter=outdated.append)
+    return valid, bool(outdated)
+
+
+def _get_executor() -> Executor | None:
+    """
+    Get the process pool, starting it on first use.
+
+    The pool is started with a fork server, since forking a worker that already runs threads
+    can copy locks held by those threads.
+
+    Returns:
+        Executor | None: The pool, or None if PASSWORD_HASHING_WORKERS is 0 or the pool broke.
+    """
+    global _executor
+    if settings.PASSWORD_HASHING_WORKERS <= 0 or _executor_broken:
+        return None
+
+    with _executor_lock:
+        if _executor is None:
+            log.info(f"Starting {settings.PASSWORD_HASHING_WORKERS} password hashing processes.")
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASHING_WORKERS,
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+        return _executor
+
+
+def _discard_executor(executor: Executor) -> None:
+    """
+    Stop using a broken pool, later calls run in threads instead.
+
+    A pool breaks when its processes die, for example when they import a main module without a
+    main guard, which starts the application again inside every process.
+
+    Args:
+        executor (Executor): The broken pool.
+    """
+    global _executor, _executor_broken
+    log.error("Password hashing processes stopped, hashing passwords in threads from now on.")
+    with _executor_lock:
+        _executor_broken = True
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run(function: Callable[..., T], *args: Any) -> T:
+    """
+    Run a hashing call in the pool, refusing it when the queue is full.
+
+    Without processes, the call runs in a thread outside the thread sensitive executor, so it
+    does not hold up the ORM calls of other requests either. The same happens once the pool
+    broke, so logins keep working.
+
+    Args:
+        function (Callable[..., T]): The module level function to run.
+        args (Any): The arguments of the function.
+
+    Raises:
+        PasswordHashingBusy: If PASSWORD_HASHING_QUEUE_LIMIT calls are already pending.
+
+    Returns:
+        T: The result of the function.
+    """
+    global _pending
+    with _pending_lock:
+        if _pending >= settings.PASSWORD_HASHING_QUEUE_LIMIT:
+            log.warning(f"Password hashing queue is full with {_pending} calls.")
+            raise PasswordHashingBusy()
+        _pending += 1
+
+    try:
+        executor = _get_executor()
+        if executor is not None:
+            try:
+                return await asyncio.get_running_loop().run_in_executor(executor, function, *args)
+            except BrokenProcessPool:
+                _discard_executor(executor)
+        return await sync_to_async(function, thread_sensitive=False)(*args)
+    finally:
+        with _pending_lock:
+            _pending -= 1
+
+
+async def make_password(password: str) -> str:
+    """
+    Hash a password in the pool.
+
+    Args:
+        password (str): The raw password.
+
+    Raises:
+        PasswordHashingBusy: If the hashing queue is full.
+
+    Returns:
+        str: The encoded password.
+    """
+    return await _run(_hash_password, password)
+
+
+async def check_password(password: str, encoded: str) -> tuple[bool, bool]:
+    """
+    Check a password in the pool.
+
+    Args:
+        password (str): The raw password.
+        encoded (str): The stored encoded password.
+
+    Raises:
+        PasswordHashingBusy: If the hashing queue is full.
+
+    Returns:
+        tuple[bool, bool]: If the password matches, and if it should be hashed again.
+    """
+    return await _run(_check_password, password, encoded)
+
+
+log.info("Loaded password hashing pool.")
@@ -0,0 +1,74 @@
+"""Contains the cache of verified API keys."""
+
+import logging
+
+from django.conf import settings
+from django.utils.crypto import constant_time_compare, salted_hmac
+
+from shoppingapp.utilities.cache import register
+
+log = logging.getLogger(__name__)
+log.info("Loading API key cache...")
+
+KEY_SALT = "authentication.auth.key_cache"
+
+# Keyed by the client id and an HMAC of the presented key, the plain key is never stored.
+# The value is the stored hash the key was verified against, so a new secret never matches.
+_verified_keys = register("api_keys", settings.API_KEY_CACHE_SIZE, settings.API_KEY_CACHE_TTL)
+
+
+def _cache_key(client_id: int, key: str) -> tuple[int, str]:
+    """
+    Get the cache key of a presented API key.
+
+    Args:
+        client_id (int): The id of the API client.
+        key (str): The presented API key.
+
+    Returns:
+        tuple[int, str]: The client id and the HMAC of the key.
+    """
+    digest = salted_hmac(KEY_SALT, f"{client_id}:{key}", algorithm="sha256").hexdigest()
+    return client_id, digest
+
+
+def is_verified(client_id: int, key: str, client_secret: str) -> bool:
+    """
+    Check if the key was recently verified against the current secret of the client.
+
+    Args:
+        client_id (int): The id of the API client.
+        key (str): The presented API key.
+        client_secret (str): The stored hash of the client secret.
+
+    Returns:
+        bool: True if the key was verified against this secret and has not expired.
+    """
+    verified_secret: str | None = _verified_keys.get(_cache_key(client_id, key))
+    return verified_secret is not None and constant_time_compare(verified_secret, client_secret)
+
+
+def mark_verified(client_id: int, key: str, client_secret: str) -> None:
+    """
+    Remember that the key matched the secret of the client.
+
+    Args:
+        client_id (int): The id of the API client.
+        key (str): The presented API key.
+        client_secret (str): The stored hash of the client secret.
+    """
+    _verified_keys.set(_cache_key(client_id, key), client_secret)
+
+
+def invalidate_client(client_id: int) -> None:
+    """
+    Forget every verified key of a client.
+
+    Args:
+        client_id (int): The id of the API client.
+    """
+    removed = _verified_keys.invalidate_where(lambda cache_key: cache_key[0] == client_id)
+    log.info(f"Removed {removed} verified API keys of client '{client_id}'.")
+
+
+log.info("Loaded API key cache.")
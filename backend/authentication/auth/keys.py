@@ -0,0 +1,80 @@
+"""Contains the API key format functions."""
+
+import logging
+import secrets
+
+from django.utils.crypto import constant_time_compare, salted_hmac
+
+log = logging.getLogger(__name__)
+log.info("Loading API key format...")
+
+KEY_PREFIX = "sla_"
+KEY_SEPARATOR = "."
+KEY_ID_BYTES = 8
+SECRET_BYTES = 16
+DIGEST_SALT = "authentication.auth.keys"
+
+
+def generate_key() -> tuple[str, str, str]:
+    """
+    Generate a new API key.
+
+    The key is made of a public key id, used to find the client, and a 128 bit random secret.
+
+    Returns:
+        tuple[str, str, str]: The key id, the secret and the full key handed to the user.
+    """
+    key_id = secrets.token_hex(KEY_ID_BYTES)
+    secret = secrets.token_hex(SECRET_BYTES)
+    return key_id, secret, f"{KEY_PREFIX}{key_id}{KEY_SEPARATOR}{secret}"
+
+
+def parse_key(key: str) -> tuple[str, str] | None:
+    """
+    Split an API key into its key id and secret.
+
+    Args:
+        key (str): The presented API key.
+
+    Returns:
+        tuple[str, str] | None: The key id and secret, or None if the key is not in this format.
+    """
+    if not key.startswith(KEY_PREFIX):
+        return None
+
+    key_id, separator, secret = key.removeprefix(KEY_PREFIX).partition(KEY_SEPARATOR)
+    if not separator or len(key_id) != KEY_ID_BYTES * 2 or not secret:
+        return None
+    return key_id, secret
+
+
+def digest_secret(secret: str) -> str:
+    """
+    Digest a secret for storage.
+
+    The secret is random and long enough that a keyed digest is as safe as a slow password hash.
+
+    Args:
+        secret (str): The secret part of an API key.
+
+    Returns:
+        str: The hex digest of the secret.
+    """
+    return salted_hmac(DIGEST_SALT, secret, algorithm="sha256").hexdigest()
+
+
+def verify_secret(secret: str, secret_digest: str) -> bool:
+    """
+    Check a secret against its stored digest in constant time.
+
+    Args:
+        secret (str): The secret part of the presented API key.
+        secret_digest (str): The stored digest.
+
+    Returns:
+        bool: True if the secret matches.
+    """
+    return bool(secret_digest) and constant_time_compare(digest_secret(secret), secret_digest)
+
+
+log.info("Loaded API key format.")
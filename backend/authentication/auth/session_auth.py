@@ -19,7 +19,10 @@ class SessionAuth(APIKeyCookie):
     param_name: str = settings.SESSION_COOKIE_NAME
 
     async def authenticate(self, request: HttpRequest, key: Optional[str]) -> Optional[Any]:
-        """Authenticate the user."""
+        """Authenticate the user, stateless API requests have no session user."""
+        if not hasattr(request, "auser"):
+            return None
+
         user = await request.auser()
         if is_user_authenticated(user):
             return user
@@ -27,4 +30,16 @@ class SessionAuth(APIKeyCookie):
         return None
 
 
+class StaffSessionAuth(SessionAuth):
+    """Django session authentication restricted to staff users."""
+
+    async def authenticate(self, request: HttpRequest, key: Optional[str]) -> Optional[Any]:
+        """Authenticate the user, if they are a member of staff."""
+        user = await super().authenticate(request, key)
+        if user is not None and user.is_staff:
+            return user
+
+        return None
+
+
 log.info("Loaded ninja session auth.")
@@ -0,0 +1,59 @@
+"""Contains the authentication backends."""
+
+import logging
+from copy import copy
+
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import User
+
+from shoppingapp.utilities.cache import register
+
+log = logging.getLogger(__name__)
+log.info("Loading authentication backends...")
+
+_user_cache = register("users", settings.USER_CACHE_SIZE, settings.USER_CACHE_TTL)
+
+
+def invalidate_user(user_id: int) -> None:
+    """
+    Forget the cached user object of a user in this worker.
+
+    Args:
+        user_id (int): The id of the user.
+    """
+    _user_cache.invalidate(user_id)
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    Model backend that keeps the users of sessions in a local cache.
+
+    The user of a session is resolved on every page load. Users are cached for USER_CACHE_TTL
+    seconds and invalidated when they are saved, deleted or log out in this worker. Other
+    workers keep their cached user, including the old password hash, until it expires. Sessions
+    from before a password change or deactivation therefore stay valid there for up to
+    USER_CACHE_TTL seconds, which is why the TTL is kept short.
+    """
+
+    def get_user(self, user_id: int) -> User | None:
+        """
+        Get an active user by id, from the cache when possible.
+
+        Args:
+            user_id (int): The id of the user.
+
+        Returns:
+            User | None: A copy of the user, or None if the user is not active.
+        """
+        user: User | None = _user_cache.get(user_id)
+        if user is None:
+            user = super().get_user(user_id)
+            if user is None:
+                return None
+            _user_cache.set(user_id, user)
+
+        return copy(user)
+
+
+log.info("Loaded authentication backends.")
@@ -16,9 +16,38 @@ async def enable_for_user(user: User | AbstractBaseUser | AnonymousUser) -> str:
     return client_secret
 
 
+async def get_active_client(key_id: str) -> ApiClient | None:
+    """
+    Get the active client of a key id, along with its user, in a single query.
+
+    Args:
+        key_id (str): The public key id of the API key.
+
+    Returns:
+        ApiClient | None: The client, or None if no active client of an active user has the key.
+    """
+    clients = ApiClient.objects.select_related("user").filter(
+        key_id=key_id, is_active=True, user__is_active=True
+    )
+    return await clients.afirst()
+
+
+async def create_key_for_user(
+    user: User | AbstractBaseUser | AnonymousUser, name: str | None = None
+) -> str:
+    """Create an additional API key, used to rotate keys."""
+    key = await ApiClient.create_key(user, name=name)
+    return key
+
+
 async def disable_for_user(user: User | AbstractBaseUser | AnonymousUser) -> None:
     """Disable a client."""
     await ApiClient.disable_client(user)
 
 
+async def revoke_key_for_user(user: User | AbstractBaseUser | AnonymousUser, key_id: str) -> None:
+    """Revoke a single API key, used to finish a key rotation."""
+    await ApiClient.revoke_key(user, key_id)
+
+
 log.info("Loaded client repository.")
@@ -2,10 +2,14 @@
 
 import logging
 
+from django.conf import settings
 from django.contrib.auth import alogin, alogout
 from django.contrib.auth.models import AbstractBaseUser, AnonymousUser, User
+from django.contrib.auth.signals import user_login_failed
 from django.http import HttpRequest
 
+from authentication.auth import hashing
+
 log = logging.getLogger(__name__)
 log.info("Loading user respository...")
 
@@ -27,17 +31,76 @@ async def create_user(
         last_name (str): The last name of the user.
         email (str): The email of the user.
 
+    Raises:
+        PasswordHashingBusy: If too many passwords are waiting to be hashed.
+
     Returns:
         User: The created user.
     """
+    encoded_password = await hashing.make_password(password)
     user = await User.objects.acreate(
         username=username,
         email=email,
         first_name=first_name,
         last_name=last_name,
+        password=encoded_password,
+    )
+    return user
+
+
+async def _login_failed(username: str | None, request: HttpRequest | None) -> None:
+    """
+    Send the user_login_failed signal, without the password.
+
+    Args:
+        username (str | None): The username of the login attempt.
+        request (HttpRequest | None): The request of the login attempt.
+    """
+    await user_login_failed.asend(
+        sender=__name__, credentials={"username": username}, request=request
     )
-    user.set_password(password)
-    await user.asave()
+
+
+async def authenticate_user(
+    username: str | None, password: str | None, request: HttpRequest | None = None
+) -> User | None:
+    """
+    Authenticate a user by username and password, checking the password in the hashing pool.
+
+    As with the model backend, a password is hashed even when the user does not exist, so the
+    response time does not reveal which usernames exist. Failed attempts send the
+    user_login_failed signal, as aauthenticate does.
+
+    Args:
+        username (str | None): The username of the user.
+        password (str | None): The password of the user.
+        request (HttpRequest | None): The request of the login attempt.
+
+    Raises:
+        PasswordHashingBusy: If too many passwords are waiting to be hashed.
+
+    Returns:
+        User | None: The active user, or None if the credentials are invalid.
+    """
+    if username is None or password is None:
+        await _login_failed(username, request)
+        return None
+
+    user = await User.objects.filter(username=username).afirst()
+    if user is None:
+        await hashing.make_password(password)
+        await _login_failed(username, request)
+        return None
+
+    valid, outdated = await hashing.check_password(password, user.password)
+    if not valid or not user.is_active:
+        await _login_failed(username, request)
+        return None
+
+    if outdated:
+        user.password = await hashing.make_password(password)
+        await user.asave(update_fields=["password"])
+
     return user
 
 
@@ -85,13 +148,13 @@ def is_user_authenticated(user: AbstractBaseUser | AnonymousUser | User) -> bool
 
 async def login_user(request: HttpRequest, user: User) -> None:
     """
-    Login a user.
+    Login a user, the session resolves the user with the first authentication backend.
 
     Args:
         request (HttpRequest): The request.
         user (User): The user to login.
     """
-    await alogin(request, user)
+    await alogin(request, user, backend=settings.AUTHENTICATION_BACKENDS[0])
 
 
 async def logout_user(request: HttpRequest) -> None:
@@ -70,4 +70,12 @@ class ApiClientAlreadyRegistered(Exception):
         super().__init__("Api Client is already registered.")
 
 
+class PasswordHashingBusy(Exception):
+    """Exception raised when too many passwords are waiting to be hashed."""
+
+    def __init__(self) -> None:
+        """Exception raised when too many passwords are waiting to be hashed."""
+        super().__init__("Too many login attempts at once, please try again shortly.")
+
+
 log.info("Loaded auth API exceptions.")
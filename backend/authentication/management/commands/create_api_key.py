@@ -0,0 +1,40 @@
+"""Contains the create API key command."""
+
+import logging
+from typing import Any
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from authentication.database.client_repository import create_key_for_user
+
+log = logging.getLogger(__name__)
+log.info("Loading django create API key command...")
+
+
+class Command(BaseCommand):
+    """Create an additional API key for a user, so their keys can be rotated."""
+
+    help = (
+        "Create an API key for a user. The existing keys of the user stay active until they are "
+        "disabled, so clients can move to the new key first."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command arguments."""
+        parser.add_argument("--user", required=True, help="The username of the key owner.")
+        parser.add_argument("--name", help="The name of the API client.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Handle the command."""
+        try:
+            user = User.objects.get(username=options["user"])
+        except User.DoesNotExist:
+            raise CommandError(f"User '{options['user']}' does not exist.")
+
+        key = async_to_sync(create_key_for_user)(user, name=options["name"])
+        self.stdout.write(self.style.SUCCESS(f"Created API key: {key}"))
+
+
+log.info("Loaded django create API key command.")
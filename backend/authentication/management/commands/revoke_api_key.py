@@ -0,0 +1,45 @@
+"""Contains the revoke API key command."""
+
+import logging
+from typing import Any
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from authentication.database.client_repository import revoke_key_for_user
+from authentication.models import ApiClient
+
+log = logging.getLogger(__name__)
+log.info("Loading django revoke API key command...")
+
+
+class Command(BaseCommand):
+    """Revoke a single API key of a user, so a key rotation can be finished."""
+
+    help = (
+        "Revoke the API key with the given key id. The other keys of the user stay active, so "
+        "the old key can be revoked once clients have moved to a new one."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command arguments."""
+        parser.add_argument("--user", required=True, help="The username of the key owner.")
+        parser.add_argument("--key-id", required=True, help="The key id of the API key.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Handle the command."""
+        try:
+            user = User.objects.get(username=options["user"])
+        except User.DoesNotExist:
+            raise CommandError(f"User '{options['user']}' does not exist.")
+
+        try:
+            async_to_sync(revoke_key_for_user)(user, options["key_id"])
+        except ApiClient.DoesNotExist:
+            raise CommandError(f"User '{user.username}' has no active key '{options['key_id']}'.")
+
+        self.stdout.write(self.style.SUCCESS(f"Revoked API key: {options['key_id']}"))
+
+
+log.info("Loaded django revoke API key command.")
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="apiclient",
+            name="key_id",
+            field=models.CharField(blank=True, max_length=16, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name="apiclient",
+            name="secret_digest",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+        migrations.AlterField(
+            model_name="apiclient",
+            name="client_secret",
+            field=models.CharField(blank=True, default="", max_length=255),
+        ),
+    ]
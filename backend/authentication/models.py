@@ -1,12 +1,11 @@
 """Contains the models for the authentication app."""
 
 import logging
-from uuid import uuid4
 
-from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import AbstractBaseUser, AnonymousUser, User
 from django.db.models import CASCADE, BooleanField, CharField, ForeignKey, Model
 
+from authentication.auth import key_cache, keys
 from authentication.errors.api_exceptions import ApiClientAlreadyRegistered
 
 log = logging.getLogger(__name__)
@@ -14,53 +13,112 @@ log.info("Auth app models loading...")
 
 
 class ApiClient(Model):
-    """Model for an API client."""
+    """
+    Model for an API client.
+
+    Every client holds one API key. A user may have several active clients, so keys can be
+    rotated without downtime. Clients created before key ids were introduced only have a
+    password hashed client_secret.
+    """
 
     name = CharField(max_length=255)
     user = ForeignKey(User, on_delete=CASCADE)
     is_active = BooleanField(default=False)
-    client_secret = CharField(max_length=255)
+    client_secret = CharField(max_length=255, blank=True, default="")
+    key_id = CharField(max_length=16, unique=True, null=True, blank=True)
+    secret_digest = CharField(max_length=64, blank=True, default="")
 
     def __str__(self) -> str:
         """Return the string representation of the model."""
         return f"ApiClient for {self.user.username}"
 
+    @classmethod
+    async def create_key(
+        cls, user: User | AbstractBaseUser | AnonymousUser, name: str | None = None
+    ) -> str:
+        """
+        Create an active client with a new API key, leaving the other clients of the user active.
+
+        Args:
+            user: The user to create the key for.
+            name: The name of the client.
+
+        Returns:
+            The API key (Not accessible as plain text to the user after this).
+        """
+        key_id, secret, key = keys.generate_key()
+        await cls.objects.acreate(
+            name=name or f"{user.username}'s API Client",  # type: ignore
+            user=user,
+            is_active=True,
+            key_id=key_id,
+            secret_digest=keys.digest_secret(secret),
+        )
+        return key
+
     @classmethod
     async def enable_client(cls, user: User | AbstractBaseUser | AnonymousUser) -> str:
         """
-        Enable a client.
+        Enable a client, unless the user already has an active one.
 
         Args:
             user: The user to enable the client for.
 
+        Raises:
+            ApiClientAlreadyRegistered: If the user has an active client.
+
         Returns:
-            The client secret (Not accessible as plain text to the user after this).
+            The API key (Not accessible as plain text to the user after this).
         """
-        client_secret = uuid4().hex
-
-        if await cls.objects.filter(user=user).aexists():
+        if await cls.objects.filter(user=user, is_active=True).aexists():
             raise ApiClientAlreadyRegistered()
 
-        client = await cls.objects.acreate(
-            name=f"{user.username}'s API Client",  # type: ignore
-            user=user,
-            is_active=True,
-            client_secret=make_password(client_secret),
-        )
-        await client.asave()
-        return client_secret
+        return await cls.create_key(user)
 
     @classmethod
     async def disable_client(cls, user: User | AbstractBaseUser | AnonymousUser) -> None:
         """
-        Disable a client.
+        Disable every client of a user, their verified keys are forgotten by this worker.
+
+        Args:
+            user: The user to disable the clients for.
+
+        Raises:
+            ApiClient.DoesNotExist: If the user has no clients.
+        """
+        client_ids = [
+            client_id
+            async for client_id in cls.objects.filter(user=user).values_list("id", flat=True)
+        ]
+        if not client_ids:
+            raise cls.DoesNotExist()
+
+        await cls.objects.filter(id__in=client_ids).aupdate(is_active=False)
+        for client_id in client_ids:
+            key_cache.invalidate_client(client_id)
+
+    @classmethod
+    async def revoke_key(cls, user: User | AbstractBaseUser | AnonymousUser, key_id: str) -> None:
+        """
+        Disable the client of a single key, the other clients of the user stay active.
 
         Args:
-            user: The user to disable the client for.
+            user: The owner of the key.
+            key_id: The public key id of the API key.
+
+        Raises:
+            ApiClient.DoesNotExist: If the user has no active client with the key id.
         """
-        client = await cls.objects.aget(user=user)
-        client.is_active = False
-        await client.asave()
+        client_id = await (
+            cls.objects.filter(user=user, key_id=key_id, is_active=True)
+            .values_list("id", flat=True)
+            .afirst()
+        )
+        if client_id is None:
+            raise cls.DoesNotExist()
+
+        await cls.objects.filter(id=client_id).aupdate(is_active=False)
+        key_cache.invalidate_client(client_id)
 
 
 log.info("Auth app models loaded.")
@@ -2,11 +2,11 @@
 
 import logging
 
-from django.contrib.auth import aauthenticate
 from django.contrib.auth.models import AbstractBaseUser, AnonymousUser, User
 from django.http import HttpRequest
 
 from authentication.database.user_repository import (
+    authenticate_user,
     create_user,
     does_email_exist,
     does_username_exist,
@@ -49,7 +49,7 @@ async def login(request: HttpRequest, username: str, password: str) -> GeneralRe
         raise UserAlreadyLoggedIn()
 
     log.info("Checking user credentials...")
-    user = await aauthenticate(request=request, username=username, password=password)
+    user = await authenticate_user(username, password, request)
     if user is None:
         log.warning("CRITICAL - Invalid credentials provided for user!")
         raise InvalidCredentials()
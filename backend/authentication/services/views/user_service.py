@@ -2,11 +2,11 @@
 
 import logging
 
-from django.contrib.auth import aauthenticate
 from django.http import HttpRequest
 
 from authentication.constants import INPUT_MAPPING
 from authentication.database.user_repository import (
+    authenticate_user,
     create_user,
     does_email_exist,
     does_username_exist,
@@ -145,7 +145,7 @@ async def login(request: HttpRequest) -> None:
     password = request.POST.get(password_input)
 
     log.info("Authenticating user...")
-    user = await aauthenticate(request=request, username=username, password=password)
+    user = await authenticate_user(username, password, request)
     if user is None:
         log.warning("Invalid credentails.")
         raise InvalidCredentials()
@@ -0,0 +1,76 @@
+"""Contains the cached database session engine."""
+
+import logging
+from typing import Any
+
+from django.conf import settings
+from django.contrib.sessions.backends import cached_db
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+
+log = logging.getLogger(__name__)
+log.info("Loading cached session engine...")
+
+
+class _ShortLivedCache:
+    """Forward to the session cache, keeping entries for at most the given number of seconds."""
+
+    def __init__(self, cache: BaseCache, ttl: int) -> None:
+        """
+        Wrap a cache.
+
+        Args:
+            cache (BaseCache): The session cache.
+            ttl (int): The maximum number of seconds an entry is kept.
+        """
+        self._cache = cache
+        self._ttl = ttl
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward everything else to the session cache."""
+        return getattr(self._cache, name)
+
+    def __contains__(self, key: str) -> bool:
+        """Check if the session cache has an entry."""
+        return key in self._cache
+
+    def _timeout(self, timeout: float | None) -> float:
+        """Cap a timeout to the time to live."""
+        if timeout is None or timeout > self._ttl:
+            return self._ttl
+        return timeout
+
+    def set(self, key: str, value: Any, timeout: float | None = None) -> None:
+        """Set an entry with a capped timeout."""
+        self._cache.set(key, value, self._timeout(timeout))
+
+    async def aset(self, key: str, value: Any, timeout: float | None = None) -> None:
+        """Set an entry with a capped timeout."""
+        await self._cache.aset(key, value, self._timeout(timeout))
+
+
+class SessionStore(cached_db.SessionStore):
+    """
+    Sessions read from the cache and written through to the database.
+
+    The default cache is local to each worker, so a session that is changed or flushed in one
+    worker stays cached in the others. Entries are therefore only kept for SESSION_CACHE_TTL
+    seconds instead of the lifetime of the session.
+    """
+
+    cache_key_prefix = "authentication.session_store"
+
+    def __init__(self, session_key: str | None = None) -> None:
+        """
+        Create a session store.
+
+        Args:
+            session_key (str | None): The key of the session.
+        """
+        super().__init__(session_key)
+        self._cache = _ShortLivedCache(
+            caches[settings.SESSION_CACHE_ALIAS], settings.SESSION_CACHE_TTL
+        )
+
+
+log.info("Loaded cached session engine.")
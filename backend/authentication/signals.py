@@ -0,0 +1,31 @@
+"""Contains the signal receivers of the authentication app."""
+
+import logging
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.contrib.auth.signals import user_logged_out
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from authentication.backends import invalidate_user
+
+log = logging.getLogger(__name__)
+log.info("Loading authentication signals...")
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_changed_user(sender: type[User], instance: User, **kwargs: Any) -> None:
+    """Forget the cached user when it is saved or deleted, including password changes."""
+    invalidate_user(instance.pk)
+
+
+@receiver(user_logged_out)
+def invalidate_logged_out_user(sender: type[User], user: User | None, **kwargs: Any) -> None:
+    """Forget the cached user when it logs out."""
+    if user is not None:
+        invalidate_user(user.pk)
+
+
+log.info("Loaded authentication signals.")
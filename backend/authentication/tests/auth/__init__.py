@@ -0,0 +1 @@
+"""Contains tests for the authentication classes."""
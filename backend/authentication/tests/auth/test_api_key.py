@@ -0,0 +1,196 @@
+"""Contains tests for the API key authentication class."""
+
+from os import environ
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.hashers import check_password, make_password
+from django.contrib.auth.models import User
+from django.http import HttpRequest
+from django.test import RequestFactory, TestCase
+
+from authentication.auth import key_cache, keys
+from authentication.auth.api_key import ApiKey
+from authentication.models import ApiClient
+
+KEY = "secret-key"
+
+
+class TestApiKey(TestCase):
+    """Test the API key authentication class with keys issued before key ids."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.user = User.objects.create_user(username="apiuser", password="testpassword")
+        self.client_model = ApiClient.objects.create(
+            name="Test Client",
+            user=self.user,
+            is_active=True,
+            client_secret=make_password(KEY),
+        )
+        environment = patch.dict(environ, {"TESTS_ENVIRONMENT": "False"})
+        environment.start()
+        self.addCleanup(environment.stop)
+        check = patch("authentication.auth.api_key.check_password", wraps=check_password)
+        self.check_password = check.start()
+        self.addCleanup(check.stop)
+        return super().setUp()
+
+    def _request(self) -> HttpRequest:
+        """Create a request made by the user."""
+        request = RequestFactory().get("/api/v1/stores")
+
+        async def auser() -> User:
+            return self.user
+
+        request.auser = auser
+        return request
+
+    async def test_verified_key_not_hashed_again(self) -> None:
+        """Test that a verified key is only hashed once."""
+        auth = ApiKey()
+        first = await auth.authenticate(self._request(), KEY)
+        second = await auth.authenticate(self._request(), KEY)
+
+        self.assertEqual(first, self.client_model)
+        self.assertEqual(second, self.client_model)
+        self.assertEqual(self.check_password.call_count, 1)
+        self.assertEqual(key_cache._verified_keys.stats()["hits"], 1)
+
+    async def test_invalid_key_not_cached(self) -> None:
+        """Test that keys that do not match are checked every time."""
+        auth = ApiKey()
+        self.assertIsNone(await auth.authenticate(self._request(), "wrong-key"))
+        self.assertIsNone(await auth.authenticate(self._request(), "wrong-key"))
+        self.assertEqual(self.check_password.call_count, 2)
+
+    async def test_disable_client_invalidates(self) -> None:
+        """Test that disabling a client forgets its verified keys."""
+        auth = ApiKey()
+        await auth.authenticate(self._request(), KEY)
+        await ApiClient.disable_client(self.user)
+
+        self.assertIsNone(await auth.authenticate(self._request(), KEY))
+        await ApiClient.objects.filter(id=self.client_model.id).aupdate(is_active=True)
+        self.assertEqual(await auth.authenticate(self._request(), KEY), self.client_model)
+        self.assertEqual(self.check_password.call_count, 2)
+
+    async def test_new_secret_not_verified(self) -> None:
+        """Test that a key verified against an older secret is hashed again."""
+        auth = ApiKey()
+        await auth.authenticate(self._request(), KEY)
+        await ApiClient.objects.filter(id=self.client_model.id).aupdate(
+            client_secret=make_password("new-key")
+        )
+
+        self.assertIsNone(await auth.authenticate(self._request(), KEY))
+        self.assertEqual(self.check_password.call_count, 2)
+
+    def test_cache_does_not_store_key(self) -> None:
+        """Test that the plain key is not part of the cache key."""
+        client_id, digest = key_cache._cache_key(self.client_model.id, KEY)
+        self.assertEqual(client_id, self.client_model.id)
+        self.assertNotIn(KEY, digest)
+        self.assertNotEqual(digest, key_cache._cache_key(self.client_model.id + 1, KEY)[1])
+
+
+class TestPrefixedApiKey(TestCase):
+    """Test the API key authentication class with keys that carry a key id."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.user = User.objects.create_user(username="apiuser", password="testpassword")
+        self.key = async_to_sync(ApiClient.create_key)(self.user)
+        environment = patch.dict(environ, {"TESTS_ENVIRONMENT": "False"})
+        environment.start()
+        self.addCleanup(environment.stop)
+        return super().setUp()
+
+    def _authenticate(self, key: str) -> tuple[HttpRequest, ApiClient | None]:
+        """Authenticate a request without a session."""
+        request = RequestFactory().get("/api/v1/stores")
+        client = async_to_sync(ApiKey().authenticate)(request, key)
+        return request, client  # type: ignore
+
+    def test_authenticate_single_query(self) -> None:
+        """Test that a prefixed key is checked with one query and without the session."""
+        with self.assertNumQueries(1):
+            request, client = self._authenticate(self.key)
+
+        self.assertIsNotNone(client)
+        self.assertEqual(request.user, self.user)
+        self.assertEqual(async_to_sync(request.auser)(), self.user)
+
+    def test_authenticate_wrong_secret(self) -> None:
+        """Test that a key with a known key id and the wrong secret is rejected."""
+        key_id, _ = keys.parse_key(self.key)  # type: ignore
+        _, client = self._authenticate(f"{keys.KEY_PREFIX}{key_id}{keys.KEY_SEPARATOR}wrong")
+        self.assertIsNone(client)
+
+    def test_authenticate_unknown_key_id(self) -> None:
+        """Test that a key with an unknown key id is rejected."""
+        _, _, key = keys.generate_key()
+        _, client = self._authenticate(key)
+        self.assertIsNone(client)
+
+    def test_multiple_active_keys(self) -> None:
+        """Test that a new key works alongside the previous one until it is disabled."""
+        second_key = async_to_sync(ApiClient.create_key)(self.user, name="Rotated")
+
+        self.assertIsNotNone(self._authenticate(self.key)[1])
+        self.assertIsNotNone(self._authenticate(second_key)[1])
+
+        async_to_sync(ApiClient.disable_client)(self.user)
+        self.assertIsNone(self._authenticate(self.key)[1])
+        self.assertIsNone(self._authenticate(second_key)[1])
+
+    def test_rotate_key(self) -> None:
+        """Test that revoking the old key after a rotation leaves the new key working."""
+        self._authenticate(self.key)
+        second_key = async_to_sync(ApiClient.create_key)(self.user, name="Rotated")
+        key_id, _ = keys.parse_key(self.key)  # type: ignore
+
+        async_to_sync(ApiClient.revoke_key)(self.user, key_id)
+
+        self.assertIsNone(self._authenticate(self.key)[1])
+        self.assertIsNotNone(self._authenticate(second_key)[1])
+
+    def test_revoke_key_of_other_user(self) -> None:
+        """Test that a user can not revoke the key of another user."""
+        other_user = User.objects.create_user(username="otheruser", password="testpassword")
+        key_id, _ = keys.parse_key(self.key)  # type: ignore
+
+        with self.assertRaises(ApiClient.DoesNotExist):
+            async_to_sync(ApiClient.revoke_key)(other_user, key_id)
+        self.assertIsNotNone(self._authenticate(self.key)[1])
+
+    def test_inactive_user_rejected(self) -> None:
+        """Test that keys of deactivated users are rejected."""
+        User.objects.filter(id=self.user.id).update(is_active=False)
+        self.assertIsNone(self._authenticate(self.key)[1])
+
+    def test_secret_not_stored(self) -> None:
+        """Test that only the digest of the secret is stored."""
+        _, secret = keys.parse_key(self.key)  # type: ignore
+        client = ApiClient.objects.get(user=self.user)
+        self.assertNotIn(secret, client.secret_digest)
+        self.assertEqual(client.client_secret, "")
+        self.assertTrue(keys.verify_secret(secret, client.secret_digest))
+
+
+class TestKeyFormat(TestCase):
+    """Test the API key format functions."""
+
+    def test_generate_and_parse(self) -> None:
+        """Test that generated keys are parsed back into their key id and secret."""
+        key_id, secret, key = keys.generate_key()
+        self.assertTrue(key.startswith(keys.KEY_PREFIX))
+        self.assertEqual(keys.parse_key(key), (key_id, secret))
+        self.assertEqual(len(secret), 32)
+
+    def test_parse_invalid_keys(self) -> None:
+        """Test that keys in other formats are not parsed."""
+        self.assertIsNone(keys.parse_key("0123456789abcdef0123456789abcdef"))
+        self.assertIsNone(keys.parse_key(f"{keys.KEY_PREFIX}short.secret"))
+        self.assertIsNone(keys.parse_key(f"{keys.KEY_PREFIX}0123456789abcdef"))
+        self.assertIsNone(keys.parse_key(f"{keys.KEY_PREFIX}0123456789abcdef."))
@@ -0,0 +1,107 @@
+"""Contains tests for the cached authentication backend."""
+
+from time import monotonic
+from unittest.mock import patch
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from authentication.backends import CachedModelBackend, _user_cache, invalidate_user
+
+
+class TestCachedModelBackend(TestCase):
+    """Test the cached model backend."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.user = User.objects.create_user(username="cacheduser", password="testpassword")
+        self.backend = CachedModelBackend()
+        return super().setUp()
+
+    def test_get_user_cached(self) -> None:
+        """Test that a user is only loaded once."""
+        first = self.backend.get_user(self.user.pk)
+        with self.assertNumQueries(0):
+            second = self.backend.get_user(self.user.pk)
+
+        self.assertEqual(first, self.user)
+        self.assertEqual(second, self.user)
+        self.assertIsNot(first, second)
+
+    def test_get_user_returns_copy(self) -> None:
+        """Test that changing a returned user does not change the cached user."""
+        user = self.backend.get_user(self.user.pk)
+        assert user is not None
+        user.first_name = "Changed"
+
+        cached = self.backend.get_user(self.user.pk)
+        assert cached is not None
+        self.assertEqual(cached.first_name, "")
+
+    def test_get_inactive_user_not_cached(self) -> None:
+        """Test that an inactive user is not returned or cached."""
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertIsNone(self.backend.get_user(self.user.pk))
+        self.assertIsNone(_user_cache.get_expired(self.user.pk))
+
+    def test_save_invalidates_user(self) -> None:
+        """Test that saving a user, such as changing its password, forgets the cached user."""
+        self.backend.get_user(self.user.pk)
+        self.user.set_password("newpassword")
+        self.user.save()
+
+        self.assertIsNone(_user_cache.get_expired(self.user.pk))
+        user = self.backend.get_user(self.user.pk)
+        assert user is not None
+        self.assertTrue(user.check_password("newpassword"))
+
+    def test_update_without_signal_served_stale(self) -> None:
+        """Test that a change made elsewhere is only seen once the cached user is gone."""
+        self.backend.get_user(self.user.pk)
+        User.objects.filter(pk=self.user.pk).update(first_name="Changed")
+
+        user = self.backend.get_user(self.user.pk)
+        assert user is not None
+        self.assertEqual(user.first_name, "")
+
+        with patch(
+            "shoppingapp.utilities.cache.time.monotonic",
+            return_value=monotonic() + settings.USER_CACHE_TTL + 1,
+        ):
+            user = self.backend.get_user(self.user.pk)
+        assert user is not None
+        self.assertEqual(user.first_name, "Changed")
+
+    def test_password_change_without_signal_keeps_session(self) -> None:
+        """Test that a session survives a password change made in another worker until expiry."""
+        self.client.force_login(self.user)
+        self.client.get("/stores/create")
+        User.objects.filter(pk=self.user.pk).update(password=make_password("newpassword"))
+
+        self.assertEqual(self.client.get("/stores/create").status_code, 200)
+
+        invalidate_user(self.user.pk)
+        response = self.client.get("/stores/create")
+        self.assertEqual(response.status_code, 302)
+
+    def test_delete_invalidates_user(self) -> None:
+        """Test that a deleted user is not returned from the cache."""
+        user_id = self.user.pk
+        self.backend.get_user(user_id)
+        self.user.delete()
+
+        self.assertIsNone(self.backend.get_user(user_id))
+
+    def test_logout_invalidates_user(self) -> None:
+        """Test that logging out forgets the cached user."""
+        self.client.force_login(self.user)
+        self.client.get("/stores/create")
+        self.assertIsNotNone(_user_cache.get_expired(self.user.pk))
+
+        self.client.logout()
+
+        self.assertIsNone(_user_cache.get_expired(self.user.pk))
@@ -0,0 +1,81 @@
+"""Contains tests for the password hashing pool."""
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth import hashers
+from django.test import SimpleTestCase, override_settings
+
+from authentication.auth import hashing
+from authentication.errors.api_exceptions import PasswordHashingBusy
+
+
+class TestPasswordHashing(SimpleTestCase):
+    """Test the password hashing pool without processes."""
+
+    async def test_make_and_check_password(self) -> None:
+        """Test that a hashed password can be checked."""
+        encoded = await hashing.make_password("password")
+
+        self.assertEqual(await hashing.check_password("password", encoded), (True, False))
+        self.assertEqual(await hashing.check_password("wrong", encoded), (False, False))
+
+    async def test_check_outdated_password(self) -> None:
+        """Test that a password hashed with outdated parameters is flagged to be hashed again."""
+        encoded = hashers.make_password("password", salt="short")
+
+        self.assertEqual(await hashing.check_password("password", encoded), (True, True))
+        self.assertEqual(await hashing.check_password("wrong", encoded), (False, False))
+
+    @override_settings(PASSWORD_HASHING_QUEUE_LIMIT=0)
+    async def test_queue_full(self) -> None:
+        """Test that calls beyond the queue limit are refused."""
+        with self.assertRaises(PasswordHashingBusy):
+            await hashing.make_password("password")
+
+        self.assertEqual(hashing._pending, 0)
+
+    async def test_pending_released_on_error(self) -> None:
+        """Test that a failed call no longer counts towards the queue limit."""
+        with patch.object(hashing, "_hash_password", side_effect=ValueError):
+            with self.assertRaises(ValueError):
+                await hashing.make_password("password")
+
+        self.assertEqual(hashing._pending, 0)
+
+
+@override_settings(PASSWORD_HASHING_WORKERS=1)
+class TestPasswordHashingProcesses(SimpleTestCase):
+    """Test the password hashing pool with processes."""
+
+    def tearDown(self) -> None:
+        """Tear down the tests."""
+        if hashing._executor is not None:
+            hashing._executor.shutdown()
+            hashing._executor = None
+        hashing._executor_broken = False
+        return super().tearDown()
+
+    async def test_make_and_check_password(self) -> None:
+        """Test that passwords are hashed and checked in the pool."""
+        encoded = await hashing.make_password("password")
+
+        self.assertIsNotNone(hashing._executor)
+        self.assertTrue(hashers.check_password("password", encoded))
+        self.assertEqual(await hashing.check_password("password", encoded), (True, False))
+        self.assertEqual(await hashing.check_password("wrong", encoded), (False, False))
+
+    async def test_broken_pool_falls_back_to_threads(self) -> None:
+        """Test that a broken pool is dropped and passwords are hashed in threads instead."""
+        broken = MagicMock(spec=ProcessPoolExecutor)
+        broken.submit.side_effect = BrokenProcessPool()
+        hashing._executor = broken
+
+        encoded = await hashing.make_password("password")
+
+        self.assertTrue(hashers.check_password("password", encoded))
+        broken.shutdown.assert_called_once()
+        self.assertIsNone(hashing._executor)
+        self.assertTrue(hashing._executor_broken)
+        self.assertEqual(await hashing.check_password("password", encoded), (True, False))
@@ -0,0 +1,62 @@
+"""Contains tests for the cached session engine."""
+
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+from authentication.session_store import SessionStore
+
+LOCAL_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCAL_CACHES, SESSION_CACHE_TTL=60)
+class TestSessionStore(TestCase):
+    """Test the cached session engine."""
+
+    def tearDown(self) -> None:
+        """Tear down the tests."""
+        caches["default"].clear()
+        return super().tearDown()
+
+    def test_session_written_through(self) -> None:
+        """Test that a session is saved to the database and read back from the cache."""
+        session = SessionStore()
+        session["key"] = "value"
+        session.create()
+
+        with self.assertNumQueries(0):
+            loaded = SessionStore(session.session_key)
+            self.assertEqual(loaded["key"], "value")
+        self.assertTrue(SessionStore.get_model_class().objects.filter(pk=session.session_key))
+
+    def test_cache_timeout_capped(self) -> None:
+        """Test that sessions are only kept in the cache for SESSION_CACHE_TTL seconds."""
+        cache = caches["default"]
+        with patch.object(cache, "set", wraps=cache.set) as cache_set:
+            session = SessionStore()
+            session.set_expiry(3600)
+            session.create()
+
+        self.assertEqual(cache_set.call_args.args[2], 60)
+
+    def test_short_expiry_kept(self) -> None:
+        """Test that a session expiring before SESSION_CACHE_TTL keeps its own timeout."""
+        cache = caches["default"]
+        with patch.object(cache, "set", wraps=cache.set) as cache_set:
+            session = SessionStore()
+            session.set_expiry(10)
+            session.create()
+
+        self.assertEqual(cache_set.call_args.args[2], 10)
+
+    def test_logged_in_page_without_queries(self) -> None:
+        """Test that a page only needing the user makes no queries once the session is cached."""
+        user = User.objects.create_user(username="sessionuser", password="testpassword")
+        self.client.force_login(user)
+        self.client.get("/stores/create")
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/stores/create")
+        self.assertEqual(response.status_code, 200)
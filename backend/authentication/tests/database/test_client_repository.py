@@ -3,7 +3,14 @@
 from django.contrib.auth.models import User
 from django.test import Client, TestCase
 
-from authentication.database.client_repository import enable_for_user
+from authentication.auth.keys import parse_key
+from authentication.database.client_repository import (
+    create_key_for_user,
+    disable_for_user,
+    enable_for_user,
+    get_active_client,
+    revoke_key_for_user,
+)
 from authentication.errors.api_exceptions import ApiClientAlreadyRegistered
 
 from ..helpers import create_test_user
@@ -34,3 +41,46 @@ class TestUserRepository(TestCase):
         await enable_for_user(self.user)
         with self.assertRaises(ApiClientAlreadyRegistered):
             await enable_for_user(self.user)
+
+    async def test_enable_client_after_disable(self) -> None:
+        """Test enabling a client again after the previous one was disabled."""
+        first = await enable_for_user(self.user)
+        await disable_for_user(self.user)
+
+        second = await enable_for_user(self.user)
+        self.assertNotEqual(first, second)
+        key_id, _ = parse_key(second)  # type: ignore
+        self.assertIsNotNone(await get_active_client(key_id))
+
+    async def test_enable_client_key_format(self) -> None:
+        """Test that enabled clients are given a key with a key id."""
+        key = await enable_for_user(self.user)
+        self.assertIsNotNone(parse_key(key))
+
+    async def test_create_key_for_user(self) -> None:
+        """Test creating additional keys for a user who already has a client."""
+        first = await enable_for_user(self.user)
+        second = await create_key_for_user(self.user, name="Rotated")
+        self.assertNotEqual(first, second)
+
+        key_id, _ = parse_key(second)  # type: ignore
+        client = await get_active_client(key_id)
+        self.assertIsNotNone(client)
+        self.assertEqual(client.name, "Rotated")  # type: ignore
+        self.assertEqual(client.user, self.user)  # type: ignore
+
+    async def test_revoke_key_for_user(self) -> None:
+        """Test revoking the first key of a rotation."""
+        first = await enable_for_user(self.user)
+        second = await create_key_for_user(self.user)
+        first_key_id, _ = parse_key(first)  # type: ignore
+        second_key_id, _ = parse_key(second)  # type: ignore
+
+        await revoke_key_for_user(self.user, first_key_id)
+
+        self.assertIsNone(await get_active_client(first_key_id))
+        self.assertIsNotNone(await get_active_client(second_key_id))
+
+    async def test_get_active_client_unknown(self) -> None:
+        """Test getting the client of an unknown key id."""
+        self.assertIsNone(await get_active_client("0123456789abcdef"))
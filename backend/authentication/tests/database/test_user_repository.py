@@ -1,9 +1,16 @@
 """Contains tests for the database module."""
 
+from typing import Any
+from unittest.mock import patch
+
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import AnonymousUser
-from django.test import Client, TestCase
+from django.contrib.auth.signals import user_login_failed
+from django.test import Client, RequestFactory, TestCase
 
+from authentication.auth import hashing
 from authentication.database.user_repository import (
+    authenticate_user,
     create_user,
     does_email_exist,
     does_username_exist,
@@ -36,6 +43,7 @@ class TestUserRepository(TestCase):
         self.assertEqual(user.email, email)
         self.assertEqual(user.first_name, first_name)
         self.assertEqual(user.last_name, last_name)
+        self.assertTrue(user.check_password(password))
 
     def test_user_is_authenticated(self) -> None:
         """Test the is_user_authenticated method."""
@@ -68,3 +76,59 @@ class TestUserRepository(TestCase):
         """Test the does_email_exist method."""
         email_exists = await does_email_exist("thisshouldnotexist@gmail.com")
         self.assertFalse(email_exists)
+
+    async def test_authenticate_user(self) -> None:
+        """Test the authenticate_user method."""
+        user = await authenticate_user("test", "test")
+        self.assertEqual(user, self.user)
+
+    async def test_authenticate_user_invalid_password(self) -> None:
+        """Test the authenticate_user method with an invalid password."""
+        user = await authenticate_user("test", "wrong")
+        self.assertIsNone(user)
+
+    async def test_authenticate_user_inactive(self) -> None:
+        """Test the authenticate_user method with an inactive user."""
+        self.user.is_active = False
+        await self.user.asave()
+        user = await authenticate_user("test", "test")
+        self.assertIsNone(user)
+
+    async def test_authenticate_user_missing_still_hashes(self) -> None:
+        """Test the authenticate_user method hashes a password for a missing user."""
+        with patch.object(hashing, "make_password", wraps=hashing.make_password) as hash_password:
+            user = await authenticate_user("thisshouldnotexist", "test")
+        self.assertIsNone(user)
+        hash_password.assert_called_once_with("test")
+
+    async def test_authenticate_user_sends_login_failed(self) -> None:
+        """Test the authenticate_user method signals failed logins without the password."""
+        received: list[dict[str, Any]] = []
+
+        def receiver(**kwargs: Any) -> None:
+            received.append(kwargs)
+
+        user_login_failed.connect(receiver)
+        self.addCleanup(user_login_failed.disconnect, receiver)
+        request = RequestFactory().post("/login")
+
+        await authenticate_user("test", "wrong", request)
+        await authenticate_user("thisshouldnotexist", "test")
+        self.assertIsNotNone(await authenticate_user("test", "test"))
+
+        self.assertEqual(len(received), 2)
+        self.assertEqual(received[0]["credentials"], {"username": "test"})
+        self.assertIs(received[0]["request"], request)
+        self.assertEqual(received[1]["credentials"], {"username": "thisshouldnotexist"})
+
+    async def test_authenticate_user_updates_outdated_password(self) -> None:
+        """Test the authenticate_user method hashes an outdated password again."""
+        self.user.password = make_password("test", salt="short")
+        await self.user.asave()
+
+        user = await authenticate_user("test", "test")
+        assert user is not None
+        self.assertNotEqual(user.password, self.user.password)
+        await self.user.arefresh_from_db()
+        self.assertEqual(self.user.password, user.password)
+        self.assertTrue(self.user.check_password("test"))
@@ -0,0 +1 @@
+"""Contains tests for the management commands of the authentication app."""
@@ -0,0 +1,34 @@
+"""Contains tests for the create API key management command."""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from authentication.auth.keys import KEY_PREFIX
+from authentication.models import ApiClient
+from authentication.tests.helpers import create_test_user
+
+
+class TestCreateApiKeyCommand(TestCase):
+    """Test the create API key management command."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.user = create_test_user()
+        return super().setUp()
+
+    def test_create_api_key(self) -> None:
+        """Test that a key is created next to the existing keys of the user."""
+        for _ in range(2):
+            out = StringIO()
+            call_command("create_api_key", "--user", "test", stdout=out)
+            self.assertIn(f"Created API key: {KEY_PREFIX}", out.getvalue())
+
+        self.assertEqual(ApiClient.objects.filter(user=self.user, is_active=True).count(), 2)
+
+    def test_create_api_key_unknown_user(self) -> None:
+        """Test that an unknown user is reported."""
+        with self.assertRaises(CommandError):
+            call_command("create_api_key", "--user", "unknown", stdout=StringIO())
@@ -0,0 +1,47 @@
+"""Contains tests for the revoke API key management command."""
+
+from io import StringIO
+
+from asgiref.sync import async_to_sync
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from authentication.auth.keys import parse_key
+from authentication.models import ApiClient
+from authentication.tests.helpers import create_test_user
+
+
+class TestRevokeApiKeyCommand(TestCase):
+    """Test the revoke API key management command."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.user = create_test_user()
+        self.key_id, _ = parse_key(async_to_sync(ApiClient.create_key)(self.user))  # type: ignore
+        return super().setUp()
+
+    def test_revoke_api_key(self) -> None:
+        """Test that only the given key is revoked."""
+        async_to_sync(ApiClient.create_key)(self.user)
+        out = StringIO()
+        call_command("revoke_api_key", "--user", "test", "--key-id", self.key_id, stdout=out)
+
+        self.assertIn(f"Revoked API key: {self.key_id}", out.getvalue())
+        self.assertFalse(ApiClient.objects.get(key_id=self.key_id).is_active)
+        self.assertEqual(ApiClient.objects.filter(user=self.user, is_active=True).count(), 1)
+
+    def test_revoke_api_key_unknown_key(self) -> None:
+        """Test that an unknown or already revoked key is reported."""
+        call_command("revoke_api_key", "--user", "test", "--key-id", self.key_id, stdout=StringIO())
+        with self.assertRaises(CommandError):
+            call_command(
+                "revoke_api_key", "--user", "test", "--key-id", self.key_id, stdout=StringIO()
+            )
+
+    def test_revoke_api_key_unknown_user(self) -> None:
+        """Test that an unknown user is reported."""
+        with self.assertRaises(CommandError):
+            call_command(
+                "revoke_api_key", "--user", "unknown", "--key-id", self.key_id, stdout=StringIO()
+            )
@@ -1,7 +1,7 @@
 """Contains tests for the authentication routes."""
 
 from django.contrib.auth.models import User
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.test.client import Client
 
 REGISTER_ENDPOINT = "/api/v1/auth/register"
@@ -260,6 +260,25 @@ class TestAuthentication(TestCase):
         self.assertEqual(response.status_code, 400)
         self.assertEqual(response.json(), {"detail": "Invalid Credentials."})
 
+    def test_login_when_hashing_busy(self) -> None:
+        """Test the login endpoint is refused when the password hashing queue is full."""
+        User.objects.create_user(username="test-busy", email=TEST_EMAIL, password="testpassword")
+        client = Client()
+
+        with override_settings(PASSWORD_HASHING_QUEUE_LIMIT=0):
+            response = client.post(
+                LOGIN_ENDPOINT,
+                {"username": "test-busy", "password": "testpassword"},
+                content_type=CONTENT_TYPE,
+            )
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "1")
+        self.assertEqual(
+            response.json(),
+            {"detail": "Too many login attempts at once, please try again shortly."},
+        )
+
     def test_logout(self) -> None:
         """Test the logout endpoint."""
         client = Client()
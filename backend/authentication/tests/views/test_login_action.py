@@ -1,7 +1,7 @@
 """Contains tests for the login view."""
 
 from django.contrib.auth.models import User
-from django.test import Client, TestCase
+from django.test import Client, TestCase, override_settings
 
 from authentication.constants import INPUT_MAPPING
 from authentication.views import DASHBOARD_ROUTE, LOGIN_ACTION_ROUTE, LOGIN_ROUTE
@@ -65,3 +65,13 @@ class TestLoginView(TestCase):
             404,
             fetch_redirect_response=False,
         )
+
+    @override_settings(PASSWORD_HASHING_QUEUE_LIMIT=0)
+    def test_login_action_endpoint_when_hashing_busy(self) -> None:
+        """Test the login action endpoint is refused when the password hashing queue is full."""
+        response = self.client.post(
+            f"/{LOGIN_ACTION_ROUTE}",
+            {USERNAME_INPUT: "testuser", PASSWORD_INPUT: "testpassword"},
+        )
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "1")
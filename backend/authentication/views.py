@@ -6,12 +6,14 @@ from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
 from django.shortcuts import render
 from django.views.decorators.http import require_http_methods
 
+from authentication.auth.hashing import RETRY_AFTER_SECONDS
 from authentication.decorators import async_login_required, async_redirect_if_logged_in
 from authentication.errors.api_exceptions import (
     EmailAlreadyExists,
     InvalidCredentials,
     InvalidUserDetails,
     NonMatchingCredentials,
+    PasswordHashingBusy,
     UsernameAlreadyExists,
 )
 from authentication.services.views.client_service import disable_client, enable_client
@@ -39,6 +41,20 @@ log = logging.getLogger(__name__)
 log.info("Auth Views loading...")
 
 
+def _busy_response(error: PasswordHashingBusy) -> HttpResponse:
+    """
+    Create the response for a request shed because the password hashing queue is full.
+
+    Args:
+        error (PasswordHashingBusy): The error.
+
+    Returns:
+        HttpResponse: A 503 response asking the client to retry shortly.
+    """
+    log.warning(f"Shedding request: {error}")
+    return HttpResponse(str(error), status=503, headers={"Retry-After": str(RETRY_AFTER_SECONDS)})
+
+
 @require_http_methods(["POST"])
 @async_redirect_if_logged_in
 async def login_action(request: HttpRequest) -> HttpResponse:
@@ -58,6 +74,8 @@ async def login_action(request: HttpRequest) -> HttpResponse:
     except InvalidCredentials as error:
         log.warning(f"Error with login: {error}")
         return HttpResponseRedirect(f"/{LOGIN_ROUTE}?error={error}")
+    except PasswordHashingBusy as error:
+        return _busy_response(error)
 
 
 @require_http_methods(["GET"])
@@ -135,6 +153,8 @@ async def register_action(request: HttpRequest) -> HttpResponse:
     ) as error:
         log.warning(f"Registration error: {error}")
         return HttpResponseRedirect(f"/{REGISTER_ROUTE}?error={error}")
+    except PasswordHashingBusy as error:
+        return _busy_response(error)
 
 
 @require_http_methods(["GET"])
@@ -1,5 +1,18 @@
 """Configuration for pytest."""
 
 from os import environ
+from typing import Iterator
+
+import pytest
 
 environ["TESTS_ENVIRONMENT"] = "True"
+
+
+@pytest.fixture(autouse=True)
+def clear_local_caches() -> Iterator[None]:
+    """Clear the process local caches, rolled back rows may otherwise still be cached."""
+    from shoppingapp.utilities.cache import clear_all
+
+    clear_all()
+    yield
+    clear_all()
@@ -11,7 +11,7 @@ from dashboard.schemas.output import (
     DashboardOverview,
     DashboardRecentItems,
 )
-from dashboard.schemas.sub_output import BarChartDataset
+from dashboard.services import dashboard_service
 
 log = logging.getLogger(__name__)
 log.info("Dashboard router loading...")
@@ -38,28 +38,9 @@ async def dashboard_recent_items(request: HttpRequest) -> DashboardRecentItems:
 
 @dashboard_router.get("/history")
 async def dashboard_history(request: HttpRequest) -> DashboardHistory:
-    """Get the dashboard history."""
-    DATA_SET_PRICE = BarChartDataset(
-        label="Price",
-        data=[65, 59, 80, 81, 56, 55],
-    )
-
-    DATA_SET_BUDGET = BarChartDataset(
-        label="Budget",
-        data=[28, 48, 40, 19, 86, 27],
-    )
-
-    return DashboardHistory(
-        labels=[
-            "January",
-            "February",
-            "March",
-            "April",
-            "May",
-            "June",
-        ],
-        data=[DATA_SET_PRICE, DATA_SET_BUDGET],
-    )
+    """Get the monthly price history of the user's items for the last six months."""
+    user = await request.auser()
+    return await dashboard_service.get_history(user=user)
 
 
 log.info("Dashboard router loaded.")
@@ -0,0 +1,6 @@
+"""Contains services for the dashboard app."""
+
+import logging
+
+log = logging.getLogger(__name__)
+log.info("Dashboard services loading...")
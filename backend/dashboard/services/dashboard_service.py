@@ -0,0 +1,75 @@
+"""Contains the dashboard service functions."""
+
+import calendar
+import logging
+from datetime import date
+
+from django.contrib.auth.models import AbstractBaseUser, AnonymousUser, User
+from django.utils import timezone
+
+from dashboard.schemas.output import DashboardHistory
+from dashboard.schemas.sub_output import BarChartDataset
+from items.database import price_history_repo
+
+log = logging.getLogger(__name__)
+log.info("Dashboard service loading...")
+
+HISTORY_MONTHS = 6
+
+
+def _last_months(months: int) -> list[date]:
+    """
+    Get the first day of the last months, ending with the current month.
+
+    Args:
+        months (int): The number of months.
+
+    Returns:
+        list[date]: The first days of the months, oldest first.
+    """
+    current = price_history_repo.month_start(timezone.now())
+    index = current.year * 12 + current.month - 1
+    return [
+        date(year=offset // 12, month=offset % 12 + 1, day=1)
+        for offset in range(index - months + 1, index + 1)
+    ]
+
+
+async def get_history(
+    user: User | AbstractBaseUser | AnonymousUser,
+    months: int = HISTORY_MONTHS,
+) -> DashboardHistory:
+    """
+    Get the monthly price history of a user's items from the pre-aggregated rollups.
+
+    Args:
+        user (User): The user that owns the items.
+        months (int): The number of months, ending with the current month.
+
+    Returns:
+        DashboardHistory: The average new price and the number of price changes per month.
+    """
+    month_starts = _last_months(months)
+    rollups = await price_history_repo.get_monthly_rollups(user_id=user.pk, since=month_starts[0])
+
+    prices = []
+    changes = []
+    for month in month_starts:
+        rollup = rollups.get(month)
+        if rollup is None or not rollup.changes:
+            prices.append(0)
+            changes.append(0)
+            continue
+        prices.append(round(rollup.total_price / rollup.changes))
+        changes.append(rollup.changes)
+
+    return DashboardHistory(
+        labels=[calendar.month_name[month.month] for month in month_starts],
+        data=[
+            BarChartDataset(label="Price", data=prices),
+            BarChartDataset(label="Changes", data=changes),
+        ],
+    )
+
+
+log.info("Dashboard service loaded.")
@@ -1,7 +1,10 @@
 """Contains tests for the dashboard router."""
 
+from asgiref.sync import async_to_sync
 from django.test import Client
+from django.utils import timezone
 
+from items.database import item_repo
 from items.tests.base.base_test_case import BaseTestCase
 
 
@@ -43,27 +46,30 @@ class TestDeleteEndpoint(BaseTestCase):
         self.assertEqual(response.status_code, 200)
 
         response_body = response.json()
-        self.assertEqual(
-            response_body["labels"],
-            [
-                "January",
-                "February",
-                "March",
-                "April",
-                "May",
-                "June",
-            ],
-        )
+        self.assertEqual(len(response_body["labels"]), 6)
+        self.assertEqual(response_body["labels"][-1], timezone.localdate().strftime("%B"))
         self.assertEqual(
             response_body["data"],
             [
                 {
                     "label": "Price",
-                    "data": [65, 59, 80, 81, 56, 55],
+                    "data": [0, 0, 0, 0, 0, 0],
                 },
                 {
-                    "label": "Budget",
-                    "data": [28, 48, 40, 19, 86, 27],
+                    "label": "Changes",
+                    "data": [0, 0, 0, 0, 0, 0],
                 },
             ],
         )
+
+    def test_session_history_api_with_price_changes(self) -> None:
+        """Test the history API reports the price changes of the current month."""
+        async_to_sync(item_repo.update_item)(item_id=self.item.id, user=self.user, price=150)
+        async_to_sync(item_repo.update_item)(item_id=self.item.id, user=self.user, price=250)
+
+        response = self.client.get("/api/v1/dashboard/history")
+        self.assertEqual(response.status_code, 200)
+
+        price, changes = response.json()["data"]
+        self.assertEqual(price["data"][-1], 200)
+        self.assertEqual(changes["data"][-1], 2)
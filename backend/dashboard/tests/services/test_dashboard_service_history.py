@@ -0,0 +1,50 @@
+"""Contains tests for the dashboard history service."""
+
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from asgiref.sync import async_to_sync
+from django.utils import timezone
+
+from dashboard.services import dashboard_service
+from items.database import price_history_repo
+from items.tests.base.base_test_case import BaseTestCase
+
+
+class TestDashboardHistoryService(BaseTestCase):
+    """Test the dashboard history service."""
+
+    def _record(self, price: int, recorded_at: datetime) -> None:
+        """Record a price change of the test item."""
+        price_history_repo.record_change(
+            item_id=self.item.id,
+            user_id=self.user.id,
+            old_price=Decimal(100),
+            new_price=Decimal(price),
+            recorded_at=recorded_at,
+        )
+
+    async def test_history_labels(self) -> None:
+        """Test the history covers the last six months, ending with the current month."""
+        history = await dashboard_service.get_history(user=self.user)
+
+        self.assertEqual(len(history.labels), 6)
+        self.assertEqual(history.labels[-1], timezone.localdate().strftime("%B"))
+        self.assertEqual([dataset.label for dataset in history.data], ["Price", "Changes"])
+
+    def test_history_reads_monthly_rollups(self) -> None:
+        """Test the price changes are bucketed per month."""
+        now = timezone.now()
+        last_month = timezone.localdate().replace(day=1) - timedelta(days=1)
+        last_month_at = timezone.make_aware(datetime.combine(last_month, time.min))
+        self._record(price=120, recorded_at=now)
+        self._record(price=180, recorded_at=now)
+        self._record(price=90, recorded_at=last_month_at)
+        self._record(price=100, recorded_at=last_month_at)  # Unchanged price, not recorded
+
+        history = async_to_sync(dashboard_service.get_history)(user=self.user)
+
+        price, changes = history.data
+        self.assertEqual(price.data[-2:], [90, 150])
+        self.assertEqual(changes.data[-2:], [1, 2])
+        self.assertEqual(sum(changes.data), 3)
@@ -14,5 +14,14 @@ class ItemsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "items"
 
+    def ready(self) -> None:
+        """Register the custom lookups used by the repositories and connect the signals."""
+        from items import signals  # noqa: F401
+        from shoppingapp.database.lookups import register_lookups
+
+        # The items app owns the lookups of shoppingapp.database, which is not an app itself.
+        # They are registered on CharField and TextField, so the stores app can use them too.
+        register_lookups()
+
 
 log.info("Items app config loaded.")
@@ -0,0 +1,346 @@
+"""Contains item aggregate repository functions."""
+
+import logging
+from decimal import Decimal
+from typing import Any
+
+from django.db import transaction
+from django.db.models import Case, Count, F, Max, Min, Q, Sum, Value, When
+
+from items.models import ShoppingItem as Item
+from items.models import ShoppingItemAggregate as ItemAggregate
+
+log = logging.getLogger(__name__)
+log.info("Item aggregate repository loading...")
+
+EMPTY_AGGREGATION: dict[str, Any] = {
+    "total_items": 0,
+    "total_price": None,
+    "average_price": None,
+    "max_price": None,
+    "min_price": None,
+}
+
+
+def _to_decimal(value: float | Decimal) -> Decimal:
+    """
+    Convert a price to a decimal so it can be combined with the decimal columns.
+
+    Args:
+        value (float | Decimal): The price.
+
+    Returns:
+        Decimal: The price as a decimal.
+    """
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
+
+def live_totals(user_ids: list[int] | None = None) -> dict[int, dict[str, Any]]:
+    """
+    Compute the aggregate columns from the item table.
+
+    Args:
+        user_ids (list[int] | None): The users to compute the totals for, all users if None.
+
+    Returns:
+        dict[int, dict[str, Any]]: The totals keyed by user id.
+    """
+    items = Item.objects.all()
+    if user_ids is not None:
+        items = items.filter(user_id__in=user_ids)
+
+    rows = (
+        items.values("user_id")
+        .annotate(
+            total_items=Count("id"),
+            total_price=Sum("price"),
+            max_price=Max("price"),
+            min_price=Min("price"),
+        )
+        .order_by()
+    )
+    return {row.pop("user_id"): row for row in rows}
+
+
+def ensure(user_id: int) -> bool:
+    """
+    Make sure the aggregate row for the user exists, building it from the item table if not.
+
+    Should be called before the user's items are changed in the same transaction, so the rebuilt
+    row does not already contain the change that is about to be recorded. When it is called
+    after the change, the change must only be recorded if no row was built.
+
+    Args:
+        user_id (int): The user id.
+
+    Returns:
+        bool: True if the row was built, false if it already existed.
+    """
+    if ItemAggregate.objects.filter(user_id=user_id).exists():
+        return False
+
+    log.info(f"Building missing item aggregate for user '{user_id}'.")
+    totals = live_totals(user_ids=[user_id]).get(user_id, {})
+    ItemAggregate.objects.bulk_create(
+        [ItemAggregate(user_id=user_id, **totals)],
+        ignore_conflicts=True,
+    )
+    return True
+
+
+def record_created(user_id: int, price: float | Decimal) -> None:
+    """
+    Record that an item was created.
+
+    Args:
+        user_id (int): The user who owns the item.
+        price (float | Decimal): The price of the item.
+    """
+    record_added(
+        user_id=user_id,
+        total_items=1,
+        total_price=price,
+        max_price=price,
+        min_price=price,
+    )
+
+
+def record_added(
+    user_id: int,
+    total_items: int,
+    total_price: float | Decimal,
+    max_price: float | Decimal,
+    min_price: float | Decimal,
+) -> None:
+    """
+    Record that items were added.
+
+    Args:
+        user_id (int): The user who owns the items.
+        total_items (int): The number of items added.
+        total_price (float | Decimal): The sum of the added prices.
+        max_price (float | Decimal): The highest added price.
+        min_price (float | Decimal): The lowest added price.
+    """
+    max_price = _to_decimal(max_price)
+    min_price = _to_decimal(min_price)
+    ItemAggregate.objects.filter(user_id=user_id).update(
+        total_items=F("total_items") + total_items,
+        total_price=F("total_price") + _to_decimal(total_price),
+        max_price=Case(
+            When(Q(max_price__isnull=True) | Q(max_price__lt=max_price), then=Value(max_price)),
+            default=F("max_price"),
+        ),
+        min_price=Case(
+            When(Q(min_price__isnull=True) | Q(min_price__gt=min_price), then=Value(min_price)),
+            default=F("min_price"),
+        ),
+    )
+
+
+def record_updated(user_id: int, old_price: float | Decimal, new_price: float | Decimal) -> None:
+    """
+    Record that the price of an item changed.
+
+    Args:
+        user_id (int): The user who owns the item.
+        old_price (float | Decimal): The previous price of the item.
+        new_price (float | Decimal): The new price of the item.
+    """
+    old_price = _to_decimal(old_price)
+    new_price = _to_decimal(new_price)
+    if old_price == new_price:
+        return
+
+    ItemAggregate.objects.filter(user_id=user_id).update(
+        total_price=F("total_price") + (new_price - old_price),
+        max_price=Case(
+            When(Q(max_price__isnull=True) | Q(max_price__lt=new_price), then=Value(new_price)),
+            default=F("max_price"),
+        ),
+        min_price=Case(
+            When(Q(min_price__isnull=True) | Q(min_price__gt=new_price), then=Value(new_price)),
+            default=F("min_price"),
+        ),
+        extremes_stale=Case(
+            When(
+                Q(max_price=old_price, max_price__gt=new_price)
+                | Q(min_price=old_price, min_price__lt=new_price),
+                then=Value(True),
+            ),
+            default=F("extremes_stale"),
+        ),
+    )
+
+
+def record_removed(
+    user_id: int,
+    total_items: int,
+    total_price: float | Decimal,
+    max_price: float | Decimal,
+    min_price: float | Decimal,
+) -> None:
+    """
+    Record that items were removed.
+
+    The extremes are flagged as stale when a removed item could have been the current minimum
+    or maximum, they are recomputed the next time the row is read.
+
+    Args:
+        user_id (int): The user who owned the items.
+        total_items (int): The number of items removed.
+        total_price (float | Decimal): The sum of the removed prices.
+        max_price (float | Decimal): The highest removed price.
+        min_price (float | Decimal): The lowest removed price.
+    """
+    ItemAggregate.objects.filter(user_id=user_id).update(
+        total_items=F("total_items") - total_items,
+        total_price=F("total_price") - _to_decimal(total_price),
+        extremes_stale=Case(
+            When(
+                Q(max_price__lte=_to_decimal(max_price)) | Q(min_price__gte=_to_decimal(min_price)),
+                then=Value(True),
+            ),
+            default=F("extremes_stale"),
+        ),
+    )
+
+
+def record_store_deleted(store_id: int) -> None:
+    """
+    Record the removal of the items stocked at a store that is about to be deleted.
+
+    Used when a store is deleted through the ORM, such as from the admin or when its owner is
+    deleted, since the items are then removed by the cascade instead of the repository.
+
+    Args:
+        store_id (int): The id of the store.
+    """
+    rows = (
+        Item.objects.filter(store_id=store_id)
+        .values("user_id")
+        .annotate(
+            total_items=Count("id"),
+            total_price=Sum("price"),
+            max_price=Max("price"),
+            min_price=Min("price"),
+        )
+        .order_by()
+    )
+    for row in rows:
+        record_removed(**row)
+
+
+def get_aggregation(user_id: int) -> dict[str, Any]:
+    """
+    Get the item aggregation for a user from the aggregate table.
+
+    A missing row is built and stale extremes are refreshed in writes that commit on their own,
+    so this is safe to call on a separate connection through gather_reads.
+
+    Args:
+        user_id (int): The user id.
+
+    Returns:
+        dict[str, Any]: The aggregation of the user's items.
+    """
+    ensure(user_id=user_id)
+    aggregate = ItemAggregate.objects.get(user_id=user_id)
+
+    if not aggregate.total_items:
+        return dict(EMPTY_AGGREGATION)
+
+    if aggregate.extremes_stale:
+        aggregate = refresh_extremes(user_id=user_id)
+
+    return {
+        "total_items": aggregate.total_items,
+        "total_price": aggregate.total_price,
+        "average_price": aggregate.total_price / aggregate.total_items,
+        "max_price": aggregate.max_price,
+        "min_price": aggregate.min_price,
+    }
+
+
+@transaction.atomic
+def refresh_extremes(user_id: int) -> ItemAggregate:
+    """
+    Recompute the minimum and maximum price of a user's items.
+
+    Args:
+        user_id (int): The user id.
+
+    Returns:
+        ItemAggregate: The refreshed aggregate row.
+    """
+    aggregate = ItemAggregate.objects.select_for_update().get(user_id=user_id)
+    if not aggregate.extremes_stale:
+        return aggregate
+
+    log.info(f"Recomputing stale item price extremes for user '{user_id}'.")
+    extremes = Item.objects.filter(user_id=user_id).aggregate(
+        max_price=Max("price"),
+        min_price=Min("price"),
+    )
+    aggregate.max_price = extremes["max_price"]
+    aggregate.min_price = extremes["min_price"]
+    aggregate.extremes_stale = False
+    aggregate.save(update_fields=["max_price", "min_price", "extremes_stale", "updated_at"])
+    return aggregate
+
+
+def find_mismatches() -> list[int]:
+    """
+    Compare the aggregate rows against the item table.
+
+    Stale extremes are not reported, they are expected to differ until the row is next read.
+
+    Returns:
+        list[int]: The ids of the users whose aggregate row is missing or out of date.
+    """
+    totals = live_totals()
+    mismatches = []
+
+    for aggregate in ItemAggregate.objects.all().order_by("user_id"):
+        expected = totals.pop(aggregate.user_id, {})
+        fields = ["total_items", "total_price"]
+        if not aggregate.extremes_stale:
+            fields.extend(["max_price", "min_price"])
+
+        for field in fields:
+            default = 0 if field.startswith("total") else None
+            if getattr(aggregate, field) != expected.get(field, default):
+                mismatches.append(aggregate.user_id)
+                break
+
+    mismatches.extend(sorted(totals))
+    return mismatches
+
+
+@transaction.atomic
+def rebuild(user_ids: list[int] | None = None) -> int:
+    """
+    Rebuild aggregate rows from the item table.
+
+    Args:
+        user_ids (list[int] | None): The users to rebuild, all users with rows or items if None.
+
+    Returns:
+        int: The number of rows rebuilt.
+    """
+    totals = live_totals(user_ids=user_ids)
+    existing = ItemAggregate.objects.all()
+    if user_ids is not None:
+        existing = existing.filter(user_id__in=user_ids)
+
+    affected = set(totals) | set(existing.values_list("user_id", flat=True))
+    rows = [ItemAggregate(user_id=user_id, **totals.get(user_id, {})) for user_id in affected]
+
+    existing.delete()
+    ItemAggregate.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
+
+
+log.info("Item aggregate repository loaded.")
@@ -0,0 +1,251 @@
+"""Contains item import repository functions."""
+
+import logging
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import partial
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+
+from items.database import aggregate_repo
+from items.models import ShoppingItem as Item
+from stores.database import store_repo
+from stores.models import ShoppingStore as Store
+
+log = logging.getLogger(__name__)
+log.info("Item import repository loading...")
+
+IMPORT_BATCH_SIZE = 5000
+STAGING_TABLE = "item_import_staging"
+
+
+@dataclass
+class ImportRow:
+    """A single item to import, along with the store it is stocked at."""
+
+    store_name: str
+    store_type: int
+    name: str
+    description: str
+    price: Decimal
+
+
+@dataclass
+class ImportResult:
+    """The number of rows read and created by an import."""
+
+    rows: int = 0
+    stores_created: int = 0
+    items_created: int = 0
+
+
+ProgressCallback = Callable[[int], None]
+
+
+def _batches(rows: Iterable[ImportRow], batch_size: int) -> Iterator[list[ImportRow]]:
+    """
+    Split the rows into lists of at most batch_size rows.
+
+    Args:
+        rows (Iterable[ImportRow]): The rows.
+        batch_size (int): The maximum size of a batch.
+
+    Yields:
+        list[ImportRow]: The next batch of rows.
+    """
+    iterator = iter(rows)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def _copy_import(
+    rows: Iterable[ImportRow],
+    user: User,
+    batch_size: int,
+    progress: ProgressCallback | None,
+) -> ImportResult:
+    """
+    Import the rows with COPY into a staging table and merge them with set-based statements.
+
+    Args:
+        rows (Iterable[ImportRow]): The rows to import.
+        user (User): The user who will own the created stores and items.
+        batch_size (int): How often progress is reported, in rows.
+        progress (ProgressCallback | None): Called with the number of rows read so far.
+
+    Returns:
+        ImportResult: The number of rows read and created.
+    """
+    result = ImportResult()
+    quote = connection.ops.quote_name
+    store_table = quote(Store._meta.db_table)
+    item_table = quote(Item._meta.db_table)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {STAGING_TABLE} ("
+            "store_name varchar(100) NOT NULL, "
+            "store_type integer NOT NULL, "
+            "name varchar(100) NOT NULL, "
+            "description text NOT NULL, "
+            "price numeric(10, 2) NOT NULL"
+            ") ON COMMIT DROP"
+        )
+
+        copy_sql = (
+            f"COPY {STAGING_TABLE} (store_name, store_type, name, description, price) FROM STDIN"
+        )
+        with cursor.copy(copy_sql) as copy:
+            for row in rows:
+                copy.write_row(
+                    (row.store_name, row.store_type, row.name, row.description, row.price)
+                )
+                result.rows += 1
+                if progress and result.rows % batch_size == 0:
+                    progress(result.rows)
+
+        if progress and result.rows % batch_size:
+            progress(result.rows)
+
+        cursor.execute(
+            f"INSERT INTO {store_table} "
+            "(name, store_type, description, created_at, updated_at, user_id) "
+            "SELECT DISTINCT ON (store_name) store_name, store_type, '', now(), now(), %s "
+            f"FROM {STAGING_TABLE} ORDER BY store_name "
+            "ON CONFLICT (name) DO NOTHING",
+            [user.pk],
+        )
+        result.stores_created = cursor.rowcount
+
+        cursor.execute(
+            f"INSERT INTO {item_table} "
+            "(name, description, price, created_at, updated_at, store_id, user_id) "
+            "SELECT DISTINCT ON (store.id, staged.name) "
+            "staged.name, staged.description, staged.price, now(), now(), store.id, %s "
+            f"FROM {STAGING_TABLE} staged "
+            f"JOIN {store_table} store ON store.name = staged.store_name "
+            f"WHERE NOT EXISTS (SELECT 1 FROM {item_table} item "
+            "WHERE item.store_id = store.id AND item.name = staged.name) "
+            "ORDER BY store.id, staged.name "
+            "ON CONFLICT (store_id, name) DO NOTHING",
+            [user.pk],
+        )
+        result.items_created = cursor.rowcount
+
+    return result
+
+
+def _batch_import(
+    rows: Iterable[ImportRow],
+    user: User,
+    batch_size: int,
+    progress: ProgressCallback | None,
+) -> ImportResult:
+    """
+    Import the rows in batches with bulk_create, for databases without COPY.
+
+    Every batch resolves its stores and existing items with one query each.
+
+    Args:
+        rows (Iterable[ImportRow]): The rows to import.
+        user (User): The user who will own the created stores and items.
+        batch_size (int): The number of rows per batch.
+        progress (ProgressCallback | None): Called with the number of rows read so far.
+
+    Returns:
+        ImportResult: The number of rows read and created.
+    """
+    result = ImportResult()
+
+    for batch in _batches(rows, batch_size):
+        result.rows += len(batch)
+        store_names = {row.store_name for row in batch}
+        stores = {store.name: store for store in Store.objects.filter(name__in=store_names)}
+
+        new_stores: dict[str, Store] = {}
+        for row in batch:
+            if row.store_name not in stores and row.store_name not in new_stores:
+                new_stores[row.store_name] = Store(
+                    name=row.store_name,
+                    store_type=row.store_type,
+                    description="",
+                    user=user,
+                )
+        if new_stores:
+            Store.objects.bulk_create(new_stores.values(), batch_size=batch_size)
+            stores.update(new_stores)
+            result.stores_created += len(new_stores)
+
+        existing = set(
+            Item.objects.filter(
+                store__in=stores.values(), name__in={row.name for row in batch}
+            ).values_list("store_id", "name")
+        )
+        new_items = []
+        for row in batch:
+            store = stores[row.store_name]
+            key = (store.id, row.name)
+            if key in existing:
+                continue
+            existing.add(key)
+            new_items.append(
+                Item(
+                    name=row.name,
+                    description=row.description,
+                    price=row.price,
+                    store=store,
+                    user=user,
+                )
+            )
+
+        Item.objects.bulk_create(new_items, batch_size=batch_size)
+        result.items_created += len(new_items)
+
+        if progress:
+            progress(result.rows)
+
+    return result
+
+
+def import_items(
+    rows: Iterable[ImportRow],
+    user: User,
+    batch_size: int = IMPORT_BATCH_SIZE,
+    progress: ProgressCallback | None = None,
+) -> ImportResult:
+    """
+    Import items, creating the stores they reference when they do not exist yet.
+
+    Items that already exist at their store, by name, are skipped. The import runs in a single
+    transaction and the aggregate of the user is rebuilt once it is done.
+
+    Args:
+        rows (Iterable[ImportRow]): The rows to import.
+        user (User): The user who will own the created stores and items.
+        batch_size (int): The number of rows per batch, and how often progress is reported.
+        progress (ProgressCallback | None): Called with the number of rows read so far.
+
+    Returns:
+        ImportResult: The number of rows read and created.
+    """
+    with transaction.atomic():
+        if connection.vendor == "postgresql":
+            result = _copy_import(rows, user, batch_size, progress)
+        else:
+            result = _batch_import(rows, user, batch_size, progress)
+
+        aggregate_repo.rebuild(user_ids=[user.pk])
+        if result.stores_created:
+            transaction.on_commit(partial(store_repo.invalidate_aggregates, user_id=user.pk))
+
+    log.info(
+        f"Imported {result.items_created} items and {result.stores_created} stores "
+        f"from {result.rows} rows."
+    )
+    return result
+
+
+log.info("Item import repository loaded.")
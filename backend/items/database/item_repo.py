@@ -1,26 +1,67 @@
 """Contains item repository functions."""
 
 import logging
-from typing import Any, no_type_check
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, no_type_check
 
 from asgiref.sync import sync_to_async
 from django.contrib.auth.models import AbstractBaseUser, AnonymousUser, User
-from django.core.paginator import Paginator
-from django.db.models import Avg, Count, Max, Min, QuerySet, Sum
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Avg, Count, Max, Min, Q, QuerySet, Sum
+from django.utils import timezone
 
+from items.database import aggregate_repo, price_history_repo
+from items.errors.exceptions import InvalidCursor
 from items.models import ShoppingItem as Item
 from items.schemas.input import ItemSearchSchema
-from items.schemas.output import ItemPaginationSchema, ItemSchema
+from items.schemas.output import BulkItemStatus, ItemPaginationSchema, ItemSchema
+from shoppingapp.database.errors import is_unique_violation
+from shoppingapp.database.filters import date_range
+from shoppingapp.database.pagination import paginate
 from stores.models import ShoppingStore as Store
 
 log = logging.getLogger(__name__)
 log.info("Item repository loading...")
 
+BULK_CREATE_BATCH_SIZE = 500
+
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_FIELDS = (
+    "id",
+    "name",
+    "description",
+    "price",
+    "store_id",
+    "user_id",
+    "created_at",
+    "updated_at",
+)
+
+SCHEMA_FIELDS = (
+    "id",
+    "name",
+    "description",
+    "price",
+    "created_at",
+    "updated_at",
+    "store__id",
+    "store__name",
+    "store__store_type",
+    "store__description",
+    "store__created_at",
+    "store__updated_at",
+    "user__id",
+    "user__username",
+)
+
 
 def _filter(
     name: str | None = None,
-    store: Store | None = None,
-    stores: list[Store] | None = None,
+    store: Store | int | None = None,
+    store_ids: list[int] | None = None,
     user: Any | None = None,
     search: ItemSearchSchema | None = None,
 ) -> QuerySet[Item]:
@@ -41,10 +82,10 @@ def _filter(
         updated_on (date | None): The date the item was updated.
         updated_after (date | None): The date the item was updated after.
         updated_before (date | None): The date the item was updated before.
-        store (Store | None): The store where the item is stocked.
+        store (Store | int | None): The store, or its id, where the item is stocked.
         user (User | AbstractBaseUser | AnonymousUser | None): The user who created the item.
         ids (list[int] | None): The item ids to filter off of.
-        stores (list[Store] | None): The stores to filter off of.
+        store_ids (list[int] | None): The ids of the stores to filter off of.
 
     Returns:
         list[Item]: The filtered items.
@@ -52,21 +93,37 @@ def _filter(
     items = Item.objects.all()
 
     if name:
-        items = items.filter(name__icontains=name)
+        items = items.filter(name__trigram_icontains=name)
     if store:
         items = items.filter(store=store)
-    if stores:
-        items = items.filter(store__in=stores)
+    if store_ids:
+        items = items.filter(store_id__in=store_ids)
     if user:
         items = items.filter(user=user)
     if search:
         items = _search(items=items, search=search)
 
-    items = items.order_by("-updated_at")
+    items = items.order_by("-updated_at", "-id")
 
     return items
 
 
+def _select_for_schema(items: QuerySet[Item]) -> QuerySet[Item]:
+    """
+    Load the store and user of the items in the same query as the items.
+
+    Only the columns needed by the item schema are selected, so serialising a page of items
+    does not trigger a lazy query per item for the nested store and user.
+
+    Args:
+        items (QuerySet[Item]): The query set to load the relations for.
+
+    Returns:
+        QuerySet[Item]: The query set with the relations joined in.
+    """
+    return items.select_related("store", "user").only(*SCHEMA_FIELDS)
+
+
 def _search(items: QuerySet[Item], search: ItemSearchSchema) -> QuerySet[Item]:
     """
     Search items using the search schema object.
@@ -79,25 +136,27 @@ def _search(items: QuerySet[Item], search: ItemSearchSchema) -> QuerySet[Item]:
         items (QuerySet[Item]): The search result.
     """
     if search.description:
-        items = items.filter(description__icontains=search.description)
+        items = items.filter(description__trigram_icontains=search.description)
     if search.price:
         items = items.filter(price=search.price)
     if search.price_is_gt:
         items = items.filter(price__gt=search.price_is_gt)
     if search.price_is_lt:
         items = items.filter(price__lt=search.price_is_lt)
-    if search.created_on:
-        items = items.filter(created_at__date=search.created_on)
-    if search.created_after:
-        items = items.filter(created_at__date__gt=search.created_after)
-    if search.created_before:
-        items = items.filter(created_at__date__lt=search.created_before)
-    if search.updated_on:
-        items = items.filter(updated_at__date=search.updated_on)
-    if search.updated_after:
-        items = items.filter(updated_at__date__gt=search.updated_after)
-    if search.updated_before:
-        items = items.filter(updated_at__date__lt=search.updated_before)
+    items = items.filter(
+        date_range(
+            "created_at",
+            on=search.created_on,
+            before=search.created_before,
+            after=search.created_after,
+        ),
+        date_range(
+            "updated_at",
+            on=search.updated_on,
+            before=search.updated_before,
+            after=search.updated_after,
+        ),
+    )
     if search.ids:
         items = items.filter(id__in=search.ids)
 
@@ -109,10 +168,11 @@ def _paginate(
     page_number: int = 1,
     items_per_page: int = 10,
     user: User | AbstractBaseUser | AnonymousUser | None = None,
-    store: Store | None = None,
-    stores: list[Store] | None = None,
+    store: Store | int | None = None,
+    store_ids: list[int] | None = None,
     name: str | None = None,
     search: ItemSearchSchema | None = None,
+    include_total: bool = True,
 ) -> ItemPaginationSchema:
     """
     Paginate the items.
@@ -123,10 +183,10 @@ def _paginate(
         page_number (int): The page number.
         items_per_page (int): The number of items per page.
         user (User): The user to filter off.
-        store (Store): Specific store to filter off.
+        store (Store | int): Specific store, or its id, to filter off.
         name (int): The full or partial name of the item to filter by.
         ids (list[int]): The items to filter off of.
-        stores (list[Store]): The stores to filter off.
+        store_ids (list[int]): The ids of the stores to filter off.
         created_on (date): The date the store was created on.
         created_before (date): All items created before this date.
         created_after (date): All items created after this date.
@@ -137,34 +197,114 @@ def _paginate(
         price (float): The price of the item.
         price_is_lt (float): Items where the price is less than this.
         price_is_get (float): Items where the price is greater than this.
+        include_total (bool): Whether to count the total number of items.
+
+    Returns:
+        ItemPaginationSchema: The paginated items.
+    """
+    records = _filter(user=user, store=store, name=name, search=search, store_ids=store_ids)
+    records = _select_for_schema(records)
+
+    page_records, pagination = paginate(
+        records,
+        page_number=page_number,
+        per_page=items_per_page,
+        include_total=include_total,
+    )
+    items = [ItemSchema.from_orm(record) for record in page_records]
+    return ItemPaginationSchema(items=items, **pagination)
+
+
+def _encode_cursor(item: Item) -> str:
+    """
+    Encode the position of an item into an opaque cursor.
+
+    Args:
+        item (Item): The last item on the current page.
+
+    Returns:
+        str: The cursor pointing to the item.
+    """
+    position = f"{item.updated_at.isoformat()}|{item.id}"
+    return urlsafe_b64encode(position.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decode an opaque cursor into the position of an item.
+
+    Args:
+        cursor (str): The cursor to decode.
+
+    Returns:
+        tuple[datetime, int]: The updated date and id of the item the cursor points to.
+
+    Raises:
+        InvalidCursor: If the cursor can not be decoded.
+    """
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        position = urlsafe_b64decode(f"{cursor}{padding}".encode()).decode()
+        updated_at, item_id = position.split("|")
+        return datetime.fromisoformat(updated_at), int(item_id)
+    except ValueError:
+        log.warning(f"Failed to decode cursor: {cursor}")
+        raise InvalidCursor(cursor=cursor)
+
+
+@sync_to_async
+def _keyset_paginate(
+    cursor: str = "",
+    items_per_page: int = 10,
+    user: User | AbstractBaseUser | AnonymousUser | None = None,
+    store: Store | int | None = None,
+    store_ids: list[int] | None = None,
+    name: str | None = None,
+    search: ItemSearchSchema | None = None,
+) -> ItemPaginationSchema:
+    """
+    Paginate the items using a cursor.
+
+    Seeks directly to the rows after the cursor using the (updated_at, id) ordering instead of
+    counting and offsetting, which keeps the cost of a page the same regardless of how deep the
+    client pages. The total and total pages are not calculated in this mode.
+
+    Args:
+        cursor (str): The cursor returned with the previous page, empty for the first page.
+        items_per_page (int): The number of items per page.
+        user (User): The user to filter off.
+        store (Store | int): Specific store, or its id, to filter off.
+        store_ids (list[int]): The ids of the stores to filter off.
+        name (int): The full or partial name of the item to filter by.
+        search (ItemSearchSchema): The search filters to apply.
 
     Returns:
         ItemPaginationSchema: The paginated items.
+
+    Raises:
+        InvalidCursor: If the cursor can not be decoded.
     """
-    records = _filter(user=user, store=store, name=name, search=search, stores=stores)
+    records = _filter(user=user, store=store, name=name, search=search, store_ids=store_ids)
+    records = _select_for_schema(records)
 
-    paginator = Paginator(records, items_per_page)
-    paginated_page = paginator.get_page(page_number)
-    paginated_items = paginated_page.object_list
+    if cursor:
+        updated_at, item_id = _decode_cursor(cursor)
+        records = records.filter(
+            Q(updated_at__lt=updated_at) | Q(updated_at=updated_at, id__lt=item_id)
+        )
 
-    items = [ItemSchema.from_orm(record) for record in paginated_items]
-    total = paginator.count
-    page = paginated_page.number
-    total_pages = paginator.num_pages
-    has_previous = paginated_page.has_previous()
-    previous_page = paginated_page.previous_page_number() if has_previous else None
-    has_next = paginated_page.has_next()
-    next_page = paginated_page.next_page_number() if has_next else None
+    page = list(records[: items_per_page + 1])
+    has_next = len(page) > items_per_page
+    page = page[:items_per_page]
+    next_cursor = _encode_cursor(page[-1]) if has_next else None
 
     return ItemPaginationSchema(
-        items=items,
-        total=total,
-        page_number=page,
-        total_pages=total_pages,
-        has_previous=has_previous,
-        previous_page=previous_page,
+        items=[ItemSchema.from_orm(record) for record in page],
+        total=None,
+        total_pages=None,
+        has_previous=bool(cursor),
         has_next=has_next,
-        next_page=next_page,
+        next_cursor=next_cursor,
     )
 
 
@@ -183,7 +323,8 @@ async def does_item_exist(name: str, store: Store) -> bool:
     return item_exists
 
 
-async def create_item(
+@sync_to_async
+def create_item(
     user: User | AbstractBaseUser | AnonymousUser,
     store: Store,
     name: str,
@@ -202,26 +343,151 @@ async def create_item(
 
     Returns:
         Item: The created item.
+
+    Raises:
+        IntegrityError: If the item already exists at the store, or the store does not exist.
     """
-    item = await Item.objects.acreate(
-        name=name,
-        description=description,
-        price=price,
-        store=store,
-        user=user,
-    )
-    await item.asave()
+    with transaction.atomic():
+        aggregate_repo.ensure(user_id=user.pk)
+        item = Item.objects.create(
+            name=name,
+            description=description,
+            price=price,
+            store=store,
+            user=user,  # type: ignore
+        )
+        aggregate_repo.record_created(user_id=user.pk, price=price)
     return item
 
 
+async def find_existing(pairs: set[tuple[int, str]]) -> set[tuple[int, str]]:
+    """
+    Find which (store id, item name) pairs already exist, using a single query.
+
+    Args:
+        pairs (set[tuple[int, str]]): The store id and item name pairs to check.
+
+    Returns:
+        set[tuple[int, str]]: The pairs that already exist.
+    """
+    if not pairs:
+        return set()
+
+    store_ids = {store_id for store_id, _ in pairs}
+    names = {name for _, name in pairs}
+    existing = Item.objects.filter(store_id__in=store_ids, name__in=names).values_list(
+        "store_id", "name"
+    )
+    return {row async for row in existing if row in pairs}
+
+
+def _create_each(items: list[Item]) -> list[Item | None]:
+    """
+    Create items one at a time, skipping those that already exist at their store.
+
+    Used when a batch conflicts with items created since they were checked, so the other rows
+    of the batch are still created.
+
+    Args:
+        items (list[Item]): The unsaved items.
+
+    Returns:
+        list[Item | None]: The created items, None for the rows that already existed.
+    """
+    created: list[Item | None] = []
+    for item in items:
+        item.pk = None
+        item._state.adding = True
+        try:
+            with transaction.atomic():
+                created.append(Item.objects.bulk_create([item])[0])
+        except IntegrityError as error:
+            if not is_unique_violation(error):
+                raise
+            created.append(None)
+    return created
+
+
+@sync_to_async
+def bulk_create_items(
+    user: User | AbstractBaseUser | AnonymousUser,
+    items: list[Item],
+    batch_size: int = BULK_CREATE_BATCH_SIZE,
+) -> list[tuple[BulkItemStatus, Item | None]]:
+    """
+    Create shopping items in batches.
+
+    The stores of the items are locked first, so they can not be deleted before the items are
+    inserted. When a batch conflicts with items created since they were checked, the rows are
+    created one by one so only the conflicting rows are skipped. The items and the aggregate of
+    the user are written in the same transaction.
+
+    Args:
+        user (User): The user that created the items.
+        items (list[Item]): The unsaved items, with their store set.
+        batch_size (int): The number of items inserted per statement.
+
+    Returns:
+        list[tuple[BulkItemStatus, Item | None]]: The status of every item, in the order they
+            were given, along with the created item.
+    """
+    if not items:
+        return []
+
+    for item in items:
+        item.user = user  # type: ignore
+
+    with transaction.atomic():
+        store_ids = set(
+            Store.objects.select_for_update()
+            .filter(id__in={item.store_id for item in items})
+            .values_list("id", flat=True)
+        )
+        candidates = [item for item in items if item.store_id in store_ids]
+        aggregate_repo.ensure(user_id=user.pk)
+
+        created: list[Item | None]
+        try:
+            with transaction.atomic():
+                created = list(Item.objects.bulk_create(candidates, batch_size=batch_size))
+        except IntegrityError as error:
+            if not is_unique_violation(error):
+                raise
+            log.warning("Items were created since they were checked, creating them one by one.")
+            created = _create_each(candidates)
+
+        created_by_id = {id(item): result for item, result in zip(candidates, created)}
+        prices = [item.price for item in created if item is not None]
+        if prices:
+            aggregate_repo.record_added(
+                user_id=user.pk,
+                total_items=len(prices),
+                total_price=sum(Decimal(str(price)) for price in prices),
+                max_price=max(prices),
+                min_price=min(prices),
+            )
+
+    results: list[tuple[BulkItemStatus, Item | None]] = []
+    for item in items:
+        if item.store_id not in store_ids:
+            results.append(("store_not_found", None))
+        elif (result := created_by_id[id(item)]) is None:
+            results.append(("duplicate", None))
+        else:
+            results.append(("created", result))
+    return results
+
+
 async def get_items(
     page: int = 1,
     items_per_page: int = 10,
     user: User | AbstractBaseUser | AnonymousUser | None = None,
-    store: Store | None = None,
+    store: Store | int | None = None,
     name: str | None = None,
-    stores: list[Store] | None = None,
+    store_ids: list[int] | None = None,
     search: ItemSearchSchema | None = None,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> ItemPaginationSchema:
     """
     Get all the items.
@@ -229,10 +495,23 @@ async def get_items(
     Args:
         page (int): The page number.
         items_per_page (int): The number of items per page.
+        cursor (str | None): The cursor to page from, enables cursor pagination when provided.
+        include_total (bool): Whether to count the total number of items.
 
     Returns:
         ItemPaginationSchema: The paginated items.
     """
+    if cursor is not None:
+        return await _keyset_paginate(
+            cursor=cursor,
+            items_per_page=items_per_page,
+            user=user,
+            store=store,
+            search=search,
+            name=name,
+            store_ids=store_ids,
+        )
+
     items = await _paginate(
         page_number=page,
         items_per_page=items_per_page,
@@ -240,19 +519,59 @@ async def get_items(
         store=store,
         search=search,
         name=name,
-        stores=stores,
+        store_ids=store_ids,
+        include_total=include_total,
     )
     return items
 
 
+def export_items(
+    user: User | AbstractBaseUser | AnonymousUser | None = None,
+    store: Store | int | None = None,
+    name: str | None = None,
+    store_ids: list[int] | None = None,
+    search: ItemSearchSchema | None = None,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Iterate over every item that matches the filters, without loading them all into memory.
+
+    Args:
+        user (User | AbstractBaseUser | AnonymousUser | None): The user who created the items.
+        store (Store | int | None): The store, or its id, where the items are stocked.
+        name (str | None): The full or partial name of the items.
+        store_ids (list[int] | None): The ids of the stores to filter off.
+        search (ItemSearchSchema | None): The search filters.
+        chunk_size (int): The number of rows fetched from the database cursor at a time.
+
+    Returns:
+        AsyncIterator[dict[str, Any]]: The items as rows of EXPORT_FIELDS.
+    """
+    items = _filter(user=user, store=store, name=name, store_ids=store_ids, search=search)
+    rows: AsyncIterator[dict[str, Any]] = items.values(*EXPORT_FIELDS).aiterator(
+        chunk_size=chunk_size
+    )
+    return rows
+
+
 @no_type_check
 async def aggregate(user: User | AbstractBaseUser | AnonymousUser | None = None) -> dict[str, Any]:
     """
     Aggregate the items.
 
+    The aggregation for a single user is read from the aggregate table, the aggregation over
+    all items is computed from the item table.
+
+    Args:
+        user (User | AbstractBaseUser | AnonymousUser | None): The user to aggregate items for.
+
     Returns:
         dict[str, Any]: The aggregation of the items.
     """
+    if user and user.pk:
+        get_aggregation = sync_to_async(aggregate_repo.get_aggregation)
+        return await get_aggregation(user_id=user.pk)
+
     filter_items = sync_to_async(_filter)
     items = await filter_items(user=user)
 
@@ -296,39 +615,241 @@ async def get_item_for_user(item_id: int, user: User | AbstractBaseUser | Anonym
     return item
 
 
-async def update_item(
-    item: Item,
+def _update_assignments(
+    name: str | None,
+    price: float | None,
+    description: str | None,
+    store_id: int | None,
+) -> list[tuple[str, Any]]:
+    """
+    Get the columns to set for an update, only the provided values are changed.
+
+    Args:
+        name (str | None): The new item name.
+        price (float | None): The new price of the item.
+        description (str | None): The new item description.
+        store_id (int | None): The id of the new store of the item.
+
+    Returns:
+        list[tuple[str, Any]]: The column names and their new values, updated_at is always set.
+    """
+    values: dict[str, Any] = {
+        "name": name,
+        "price": price,
+        "description": description,
+        "store_id": store_id,
+    }
+    assignments = [(column, value) for column, value in values.items() if value]
+    assignments.append(("updated_at", timezone.now()))
+    return assignments
+
+
+def _update_returning(
+    item_id: int,
+    user_id: int,
+    assignments: list[tuple[str, Any]],
+    store_id: int | None,
+) -> tuple[Item, Decimal] | None:
+    """
+    Update an item and read it back, with its store and user, in a single statement.
+
+    The previous price is locked and returned alongside the updated row, so the aggregate can be
+    adjusted without reading the item first.
+
+    Args:
+        item_id (int): The ID of the item.
+        user_id (int): The ID of the user who owns the item.
+        assignments (list[tuple[str, Any]]): The columns to set and their new values.
+        store_id (int | None): The id of the new store, checked to exist when provided.
+
+    Returns:
+        tuple[Item, Decimal] | None: The updated item and its previous price, None if no row
+            matched.
+    """
+    quote = connection.ops.quote_name
+    item_table = quote(Item._meta.db_table)
+    store_table = quote(Store._meta.db_table)
+    user_table = quote(User._meta.db_table)
+    set_sql = ", ".join(f"{quote(column)} = %s" for column, _ in assignments)
+    params = [item_id, user_id, *(value for _, value in assignments)]
+
+    store_check = ""
+    if store_id:
+        store_check = f" AND EXISTS (SELECT 1 FROM {store_table} WHERE id = %s)"
+        params.append(store_id)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"WITH old AS (SELECT id, price FROM {item_table} "
+            "WHERE id = %s AND user_id = %s FOR UPDATE), "
+            f"updated AS (UPDATE {item_table} item SET {set_sql} FROM old "
+            f"WHERE item.id = old.id{store_check} "
+            "RETURNING item.id, item.name, item.description, item.price, item.created_at, "
+            "item.updated_at, item.store_id, item.user_id, old.price AS old_price) "
+            "SELECT updated.*, store.name, store.store_type, store.description, "
+            "store.created_at, store.updated_at, auth.username "
+            f"FROM updated JOIN {store_table} store ON store.id = updated.store_id "
+            f"JOIN {user_table} auth ON auth.id = updated.user_id",
+            params,
+        )
+        row = cursor.fetchone()
+
+    if row is None:
+        return None
+
+    (
+        item_id,
+        name,
+        description,
+        price,
+        created_at,
+        updated_at,
+        row_store_id,
+        row_user_id,
+        old_price,
+        store_name,
+        store_type,
+        store_description,
+        store_created_at,
+        store_updated_at,
+        username,
+    ) = row
+    item = Item(
+        id=item_id,
+        name=name,
+        description=description,
+        price=price,
+        created_at=created_at,
+        updated_at=updated_at,
+        store=Store(
+            id=row_store_id,
+            name=store_name,
+            store_type=store_type,
+            description=store_description,
+            created_at=store_created_at,
+            updated_at=store_updated_at,
+        ),
+        user=User(id=row_user_id, username=username),
+    )
+    return item, old_price
+
+
+def _update_then_select(
+    item_id: int,
+    user_id: int,
+    assignments: list[tuple[str, Any]],
+    store_id: int | None,
+) -> tuple[Item, Decimal] | None:
+    """
+    Update an item and read it back with separate statements, for databases without UPDATE FROM.
+
+    Args:
+        item_id (int): The ID of the item.
+        user_id (int): The ID of the user who owns the item.
+        assignments (list[tuple[str, Any]]): The columns to set and their new values.
+        store_id (int | None): The id of the new store, checked to exist when provided.
+
+    Returns:
+        tuple[Item, Decimal] | None: The updated item and its previous price, None if no row
+            matched.
+    """
+    old_price = (
+        Item.objects.select_for_update()
+        .filter(id=item_id, user_id=user_id)
+        .values_list("price", flat=True)
+        .first()
+    )
+    if old_price is None:
+        return None
+
+    quote = connection.ops.quote_name
+    set_sql = ", ".join(f"{quote(column)} = %s" for column, _ in assignments)
+    params = [*(value for _, value in assignments), item_id, user_id]
+
+    store_check = ""
+    if store_id:
+        store_check = f" AND EXISTS (SELECT 1 FROM {quote(Store._meta.db_table)} WHERE id = %s)"
+        params.append(store_id)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {quote(Item._meta.db_table)} SET {set_sql} "
+            f"WHERE id = %s AND user_id = %s{store_check}",
+            params,
+        )
+        if not cursor.rowcount:
+            return None
+
+    item = _select_for_schema(Item.objects.filter(id=item_id)).get()
+    return item, old_price
+
+
+@sync_to_async
+def update_item(
+    item_id: int,
+    user: User | AbstractBaseUser | AnonymousUser,
     name: str | None = None,
     price: float | None = None,
     description: str | None = None,
-    store: Store | None = None,
+    store_id: int | None = None,
 ) -> Item:
     """
-    Update an item by its ID.
+    Update the provided columns of an item, leaving the others untouched.
+
+    On PostgreSQL the update, the previous price and the related store and user are read in a
+    single statement. Duplicate names and deleted stores are rejected by the constraints. Price
+    changes are appended to the price history in the same transaction.
 
     Args:
         item_id (int): The ID of the item.
+        user (User | AnonymousUser | AbstractBaseUser): The user who owns the item.
+        name (str | None): The new item name.
+        price (float | None): The new price of the item.
+        description (str | None): The new item description.
+        store_id (int | None): The id of the new store of the item.
 
     Returns:
-        Item: The item.
-    """
-    if name:
-        item.name = name
-    if price:
-        item.price = price
-    if description:
-        item.description = description
-    if store:
-        item.store = store
+        Item: The updated item, with its store and user.
 
-    logging.info(f"Updating item with ID: {item.id}.")
-    await item.asave()
+    Raises:
+        Item.DoesNotExist: If the user does not own an item with the ID.
+        Store.DoesNotExist: If the new store does not exist.
+        IntegrityError: If the item already exists at the store, or the store was deleted.
+    """
+    assignments = _update_assignments(name, price, description, store_id)
+
+    logging.info(f"Updating item with ID: {item_id}.")
+    with transaction.atomic():
+        if price:
+            aggregate_repo.ensure(user_id=user.pk)
+
+        if connection.vendor == "postgresql":
+            updated = _update_returning(item_id, user.pk, assignments, store_id)
+        else:
+            updated = _update_then_select(item_id, user.pk, assignments, store_id)
+
+        if updated is None:
+            if store_id and not Store.objects.filter(id=store_id).exists():
+                raise Store.DoesNotExist()
+            raise Item.DoesNotExist()
+
+        item, old_price = updated
+        if price:
+            aggregate_repo.record_updated(user_id=user.pk, old_price=old_price, new_price=price)
+            price_history_repo.record_change(
+                item_id=item.id,
+                user_id=user.pk,
+                old_price=old_price,
+                new_price=item.price,
+                recorded_at=item.updated_at,
+            )
     return item
 
 
-async def delete_item(item_id: int, user: User | AbstractBaseUser | AnonymousUser) -> None:
+@sync_to_async
+def delete_item(item_id: int, user: User | AbstractBaseUser | AnonymousUser) -> None:
     """
-    Delete an item by its ID.
+    Delete an item by its ID, with a single statement scoped to its owner.
 
     Args:
         item_id (int): The ID of the item.
@@ -337,10 +858,25 @@ async def delete_item(item_id: int, user: User | AbstractBaseUser | AnonymousUse
     Raises:
         Item.DoesNotExist: If the item does not exist.
     """
-    logging.info(f"Retrieving item with ID: '{item_id}' for deletion.")
-    item = await Item.objects.aget(id=item_id, user=user)
     logging.info(f"Deleting item with ID: '{item_id}'.")
-    await item.adelete()
+    with transaction.atomic(), connection.cursor() as cursor:
+        aggregate_repo.ensure(user_id=user.pk)
+        cursor.execute(
+            f"DELETE FROM {connection.ops.quote_name(Item._meta.db_table)} "
+            "WHERE id = %s AND user_id = %s RETURNING price",
+            [item_id, user.pk],
+        )
+        row = cursor.fetchone()
+        if row is None:
+            raise Item.DoesNotExist()
+
+        aggregate_repo.record_removed(
+            user_id=user.pk,
+            total_items=1,
+            total_price=row[0],
+            max_price=row[0],
+            min_price=row[0],
+        )
 
 
 log.info("Item repository loaded.")
@@ -0,0 +1,96 @@
+"""Contains item price history repository functions."""
+
+import logging
+from datetime import date, datetime
+from decimal import Decimal
+
+from django.db.models import Case, F, Q, Value, When
+from django.utils import timezone
+
+from items.models import ShoppingItemPriceHistory as PriceHistory
+from items.models import ShoppingItemPriceRollup as PriceRollup
+
+log = logging.getLogger(__name__)
+log.info("Item price history repository loading...")
+
+
+def month_start(moment: datetime) -> date:
+    """
+    Get the first day of the month of a moment, in the active timezone.
+
+    Args:
+        moment (datetime): The moment.
+
+    Returns:
+        date: The first day of the month.
+    """
+    return timezone.localdate(moment).replace(day=1)
+
+
+def record_change(
+    item_id: int,
+    user_id: int,
+    old_price: Decimal,
+    new_price: Decimal,
+    recorded_at: datetime | None = None,
+) -> None:
+    """
+    Record a price change and add it to the monthly rollup of the user.
+
+    Must be called in the transaction that changes the price. Prices that did not change are not
+    recorded.
+
+    Args:
+        item_id (int): The item whose price changed.
+        user_id (int): The user who owns the item.
+        old_price (Decimal): The previous price of the item.
+        new_price (Decimal): The new price of the item.
+        recorded_at (datetime | None): When the price changed, now if None.
+    """
+    if old_price == new_price:
+        return
+
+    recorded_at = recorded_at or timezone.now()
+    PriceHistory.objects.create(
+        item_id=item_id,
+        user_id=user_id,
+        old_price=old_price,
+        price=new_price,
+        recorded_at=recorded_at,
+    )
+
+    month = month_start(recorded_at)
+    PriceRollup.objects.bulk_create(
+        [PriceRollup(user_id=user_id, month=month)],
+        ignore_conflicts=True,
+    )
+    PriceRollup.objects.filter(user_id=user_id, month=month).update(
+        changes=F("changes") + 1,
+        total_price=F("total_price") + new_price,
+        max_price=Case(
+            When(Q(max_price__isnull=True) | Q(max_price__lt=new_price), then=Value(new_price)),
+            default=F("max_price"),
+        ),
+        min_price=Case(
+            When(Q(min_price__isnull=True) | Q(min_price__gt=new_price), then=Value(new_price)),
+            default=F("min_price"),
+        ),
+    )
+
+
+async def get_monthly_rollups(user_id: int, since: date) -> dict[date, PriceRollup]:
+    """
+    Get the monthly rollups of a user's price changes.
+
+    Args:
+        user_id (int): The user id.
+        since (date): The first month to include.
+
+    Returns:
+        dict[date, PriceRollup]: The rollups keyed by the first day of their month.
+    """
+    rollups = PriceRollup.objects.filter(user_id=user_id, month__gte=since)
+    return {rollup.month: rollup async for rollup in rollups}
+
+
+log.info("Item price history repository loaded.")
@@ -25,4 +25,13 @@ class ItemDoesNotExist(Exception):
         super().__init__(f"Item with id '{item_id}' does not exist.")
 
 
+class InvalidCursor(Exception):
+    """Raised when a pagination cursor can not be decoded."""
+
+    def __init__(self, cursor: str) -> None:
+        """Initialize the exception."""
+        self.cursor = cursor
+        super().__init__(f"Cursor '{cursor}' is invalid.")
+
+
 log.info("Item API exceptions loaded.")
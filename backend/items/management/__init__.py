@@ -0,0 +1,6 @@
+"""Contains django management files."""
+
+import logging
+
+log = logging.getLogger(__name__)
+log.info("Loading django management...")
@@ -0,0 +1,6 @@
+"""Contains custom admin commands."""
+
+import logging
+
+log = logging.getLogger(__name__)
+log.info("Loading django commands...")
@@ -0,0 +1,182 @@
+"""Contains the import items command."""
+
+import csv
+import json
+import logging
+import time
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any, Iterator
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from items.database import import_repo
+from items.database.import_repo import ImportRow
+from items.models import ShoppingItem as Item
+from stores.constants import STORE_TYPE_MAPPING
+from stores.models import ShoppingStore as Store
+
+log = logging.getLogger(__name__)
+log.info("Loading django import items command...")
+
+DEFAULT_STORE_TYPE = 3
+MAX_PRICE = Decimal("99999999.99")
+FORMATS = ("csv", "ndjson")
+REQUIRED_FIELDS = ("store", "name", "price")
+
+
+def _to_row(record: dict[str, Any], line: int) -> ImportRow:
+    """
+    Validate a record read from the file.
+
+    Args:
+        record (dict[str, Any]): The record.
+        line (int): The line number of the record, used in error messages.
+
+    Returns:
+        ImportRow: The validated row.
+
+    Raises:
+        CommandError: If the record is missing fields or has invalid values.
+    """
+    for field in REQUIRED_FIELDS:
+        if record.get(field) is None:
+            raise CommandError(f"Line {line}: missing field '{field}'.")
+
+    try:
+        store_name = str(record["store"]).strip()
+        name = str(record["name"]).strip()
+        price = Decimal(str(record["price"]))
+        store_type = int(record.get("store_type") or DEFAULT_STORE_TYPE)
+    except (InvalidOperation, ValueError):
+        raise CommandError(f"Line {line}: invalid price or store type.")
+
+    if not store_name or not name:
+        raise CommandError(f"Line {line}: the store and name may not be empty.")
+
+    store_max_length = Store._meta.get_field("name").max_length
+    if store_max_length is not None and len(store_name) > store_max_length:
+        raise CommandError(f"Line {line}: the store may not be longer than {store_max_length}.")
+
+    name_max_length = Item._meta.get_field("name").max_length
+    if name_max_length is not None and len(name) > name_max_length:
+        raise CommandError(f"Line {line}: the name may not be longer than {name_max_length}.")
+
+    if store_type not in STORE_TYPE_MAPPING:
+        raise CommandError(
+            f"Line {line}: store type {store_type} is not one of {list(STORE_TYPE_MAPPING)}."
+        )
+
+    if not price.is_finite() or not 0 <= price <= MAX_PRICE:
+        raise CommandError(f"Line {line}: price {price} must be between 0 and {MAX_PRICE}.")
+
+    return ImportRow(
+        store_name=store_name,
+        store_type=store_type,
+        name=name,
+        description=str(record.get("description") or ""),
+        price=price,
+    )
+
+
+def _read_rows(path: Path, file_format: str) -> Iterator[ImportRow]:
+    """
+    Read the rows of a CSV or NDJSON file one at a time.
+
+    Args:
+        path (Path): The file to read.
+        file_format (str): Either csv or ndjson.
+
+    Yields:
+        ImportRow: The next row of the file.
+    """
+    with path.open(newline="", encoding="utf-8") as file:
+        if file_format == "csv":
+            for line, record in enumerate(csv.DictReader(file), start=2):
+                yield _to_row(record, line)
+            return
+
+        for line, text in enumerate(file, start=1):
+            if not text.strip():
+                continue
+            try:
+                record = json.loads(text)
+            except json.JSONDecodeError:
+                raise CommandError(f"Line {line}: invalid JSON.")
+            yield _to_row(record, line)
+
+
+class Command(BaseCommand):
+    """Import items, and the stores they are stocked at, from a CSV or NDJSON file."""
+
+    help = (
+        "Import items from a CSV or NDJSON file with the fields store, name, price and "
+        "optionally description and store_type. Missing stores are created, items that already "
+        "exist at their store are skipped."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command arguments."""
+        parser.add_argument("path", type=Path, help="The file to import.")
+        parser.add_argument(
+            "--user",
+            required=True,
+            help="The username of the user who will own the imported stores and items.",
+        )
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            help="The file format, detected from the file extension when not provided.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=import_repo.IMPORT_BATCH_SIZE,
+            help="The number of rows per batch, and how often progress is reported.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Handle the command."""
+        path: Path = options["path"]
+        if not path.is_file():
+            raise CommandError(f"File '{path}' does not exist.")
+
+        file_format = options["format"] or path.suffix.lstrip(".").lower()
+        if file_format == "jsonl":
+            file_format = "ndjson"
+        if file_format not in FORMATS:
+            raise CommandError(f"Could not detect the format of '{path}', use --format.")
+
+        if options["batch_size"] < 1:
+            raise CommandError("The batch size must be at least 1.")
+
+        try:
+            user = User.objects.get(username=options["user"])
+        except User.DoesNotExist:
+            raise CommandError(f"User '{options['user']}' does not exist.")
+
+        started = time.monotonic()
+
+        def progress(rows: int) -> None:
+            elapsed = time.monotonic() - started
+            rate = rows / elapsed if elapsed else 0
+            self.stdout.write(f"Read {rows} rows ({rate:.0f} rows/s)...")
+
+        result = import_repo.import_items(
+            _read_rows(path, file_format),
+            user=user,
+            batch_size=options["batch_size"],
+            progress=progress,
+        )
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {result.items_created} items and created {result.stores_created} "
+                f"stores from {result.rows} rows in {elapsed:.2f}s."
+            )
+        )
+
+
+log.info("Loaded django import items command.")
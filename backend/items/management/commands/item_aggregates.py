@@ -0,0 +1,57 @@
+"""Contains the item aggregates command."""
+
+import logging
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from items.database import aggregate_repo
+
+log = logging.getLogger(__name__)
+log.info("Loading django item aggregates command...")
+
+
+class Command(BaseCommand):
+    """Verify, and optionally rebuild, the per-user item aggregate rows."""
+
+    help = "Verify the per-user item aggregate rows against the item table."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add the command arguments."""
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Rebuild the rows that are missing or out of date.",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Rebuild every row instead of only the mismatched rows.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Handle the command."""
+        if options["rebuild"] and options["all"]:
+            rebuilt = aggregate_repo.rebuild()
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt {rebuilt} item aggregate rows."))
+            return
+
+        mismatches = aggregate_repo.find_mismatches()
+        if not mismatches:
+            self.stdout.write(self.style.SUCCESS("Item aggregates are up to date."))
+            return
+
+        for user_id in mismatches:
+            self.stdout.write(f"Item aggregate for user '{user_id}' is missing or out of date.")
+
+        if not options["rebuild"]:
+            self.stdout.write(
+                self.style.WARNING(f"Found {len(mismatches)} mismatched item aggregate rows.")
+            )
+            return
+
+        rebuilt = aggregate_repo.rebuild(user_ids=mismatches)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rebuilt} item aggregate rows."))
+
+
+log.info("Loaded django item aggregates command.")
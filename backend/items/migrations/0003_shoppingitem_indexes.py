@@ -0,0 +1,32 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+from shoppingapp.database.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("items", "0002_shoppingitem_price"),
+        ("stores", "0002_shoppingstore_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="shoppingitem",
+            index=models.Index(fields=["user", "-updated_at"], name="item_user_updated_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="shoppingitem",
+            index=models.Index(fields=["store", "-updated_at"], name="item_store_updated_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="shoppingitem",
+            index=models.Index(fields=["store", "name"], name="item_store_name_idx"),
+        ),
+    ]
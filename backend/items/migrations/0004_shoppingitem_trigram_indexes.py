@@ -0,0 +1,30 @@
+from django.db import migrations
+
+from shoppingapp.database.operations import PostgresRunSQL
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("items", "0003_shoppingitem_indexes"),
+        ("stores", "0003_shoppingstore_name_trigram_index"),
+    ]
+
+    operations = [
+        PostgresRunSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS item_name_trgm_idx "
+                "ON items_shoppingitem USING gin (name gin_trgm_ops);"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS item_name_trgm_idx;",
+        ),
+        PostgresRunSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS item_description_trgm_idx "
+                "ON items_shoppingitem USING gin (description gin_trgm_ops);"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS item_description_trgm_idx;",
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:11
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max, Min, Sum
+
+
+def populate_aggregates(apps, schema_editor):
+    """Build the aggregate rows for every user that already has items."""
+    Item = apps.get_model("items", "ShoppingItem")
+    ItemAggregate = apps.get_model("items", "ShoppingItemAggregate")
+
+    rows = (
+        Item.objects.values("user_id")
+        .annotate(
+            total_items=Count("id"),
+            total_price=Sum("price"),
+            max_price=Max("price"),
+            min_price=Min("price"),
+        )
+        .order_by()
+    )
+    ItemAggregate.objects.bulk_create(
+        [ItemAggregate(**row) for row in rows.iterator()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("items", "0004_shoppingitem_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ShoppingItemAggregate",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="item_aggregate",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("total_items", models.PositiveIntegerField(default=0)),
+                ("total_price", models.DecimalField(decimal_places=2, default=0, max_digits=16)),
+                ("max_price", models.DecimalField(decimal_places=2, max_digits=10, null=True)),
+                ("min_price", models.DecimalField(decimal_places=2, max_digits=10, null=True)),
+                ("extremes_stale", models.BooleanField(default=False)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(populate_aggregates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,87 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:22
+
+import logging
+from typing import Any
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+from shoppingapp.database.operations import (
+    AddUniqueConstraintConcurrently,
+    RemoveIndexConcurrently,
+)
+
+log = logging.getLogger(__name__)
+
+NAME_MAX_LENGTH = 100
+
+
+def _free_name(Item: Any, item: Any) -> str:
+    """
+    Get a name for a duplicate item that no other item at its store has.
+
+    The id of the item is appended to its name, followed by a counter if that name is taken.
+    """
+    attempt = 1
+    while True:
+        suffix = f" ({item.id})" if attempt == 1 else f" ({item.id}-{attempt})"
+        name = f"{item.name[: NAME_MAX_LENGTH - len(suffix)]}{suffix}"
+        if not Item.objects.filter(store_id=item.store_id, name=name).exists():
+            return name
+        attempt += 1
+
+
+def rename_duplicate_items(apps: Any, schema_editor: Any) -> None:
+    """
+    Rename items that share a name at their store, so the unique constraint can be added.
+
+    Items created by concurrent requests before the constraint existed may share a name at a
+    store. The oldest item keeps its name, the others get their id appended to it. Every rename
+    is logged, so operators can see which items were changed.
+    """
+    Item = apps.get_model("items", "ShoppingItem")
+    duplicates = (
+        Item.objects.values("store_id", "name")
+        .annotate(count=Count("id"), first_id=Min("id"))
+        .filter(count__gt=1)
+    )
+    for duplicate in duplicates:
+        items = Item.objects.filter(store_id=duplicate["store_id"], name=duplicate["name"]).exclude(
+            id=duplicate["first_id"]
+        )
+        for item in items:
+            name = _free_name(Item, item)
+            log.warning(
+                f"Renaming item '{item.id}' of user '{item.user_id}' at store '{item.store_id}' "
+                f"from '{item.name}' to '{name}'."
+            )
+            item.name = name
+            item.save(update_fields=["name"])
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("items", "0005_shoppingitemaggregate"),
+        ("stores", "0003_shoppingstore_name_trigram_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            rename_duplicate_items, reverse_code=migrations.RunPython.noop, atomic=True
+        ),
+        AddUniqueConstraintConcurrently(
+            model_name="shoppingitem",
+            constraint=models.UniqueConstraint(
+                fields=("store", "name"), name="item_store_name_unique"
+            ),
+        ),
+        RemoveIndexConcurrently(
+            model_name="shoppingitem",
+            name="item_store_name_idx",
+        ),
+    ]
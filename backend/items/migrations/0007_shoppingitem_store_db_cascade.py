@@ -0,0 +1,41 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:30
+
+from django.db import migrations
+
+from shoppingapp.database.operations import PostgresRunSQL
+
+
+def replace_store_foreign_key(on_delete: str) -> str:
+    """Build the SQL that recreates the item to store foreign key with the on delete action."""
+    return f"""
+        DO $$
+        DECLARE fk_name text;
+        BEGIN
+            SELECT conname INTO fk_name FROM pg_constraint
+            WHERE conrelid = 'items_shoppingitem'::regclass
+                AND confrelid = 'stores_shoppingstore'::regclass
+                AND contype = 'f';
+            EXECUTE format('ALTER TABLE items_shoppingitem DROP CONSTRAINT %I', fk_name);
+            EXECUTE format(
+                'ALTER TABLE items_shoppingitem ADD CONSTRAINT %I FOREIGN KEY (store_id) '
+                'REFERENCES stores_shoppingstore (id) ON DELETE {on_delete} '
+                'DEFERRABLE INITIALLY DEFERRED',
+                fk_name
+            );
+        END $$;
+    """
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("items", "0006_shoppingitem_store_name_unique"),
+        ("stores", "0003_shoppingstore_name_trigram_index"),
+    ]
+
+    operations = [
+        PostgresRunSQL(
+            sql=replace_store_foreign_key("CASCADE"),
+            reverse_sql=replace_store_foreign_key("NO ACTION"),
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:37
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("items", "0007_shoppingitem_store_db_cascade"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ShoppingItemPriceHistory",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("old_price", models.DecimalField(decimal_places=2, max_digits=10)),
+                ("price", models.DecimalField(decimal_places=2, max_digits=10)),
+                ("recorded_at", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "item",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="price_history",
+                        to="items.shoppingitem",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["item", "recorded_at"], name="item_price_history_idx")
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="ShoppingItemPriceRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("month", models.DateField()),
+                ("changes", models.PositiveIntegerField(default=0)),
+                ("total_price", models.DecimalField(decimal_places=2, default=0, max_digits=16)),
+                ("max_price", models.DecimalField(decimal_places=2, max_digits=10, null=True)),
+                ("min_price", models.DecimalField(decimal_places=2, max_digits=10, null=True)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "month"), name="item_price_rollup_unique"
+                    )
+                ],
+            },
+        ),
+    ]
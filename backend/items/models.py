@@ -5,13 +5,21 @@ import logging
 from django.contrib.auth.models import User
 from django.db.models import (
     CASCADE,
+    DO_NOTHING,
+    BooleanField,
     CharField,
+    DateField,
     DateTimeField,
     DecimalField,
     ForeignKey,
+    Index,
     Model,
+    OneToOneField,
+    PositiveIntegerField,
     TextField,
+    UniqueConstraint,
 )
+from django.utils import timezone
 
 from stores.models import ShoppingStore as Store
 
@@ -27,12 +35,99 @@ class ShoppingItem(Model):
     price = DecimalField(max_digits=10, decimal_places=2)
     created_at = DateTimeField(auto_now_add=True)
     updated_at = DateTimeField(auto_now=True)
+    # On PostgreSQL the database also cascades (ON DELETE CASCADE, see migration 0007), so the
+    # store repository deletes a store without loading its items.
     store = ForeignKey(Store, on_delete=CASCADE)
     user = ForeignKey(User, on_delete=CASCADE)
 
+    class Meta:
+        """Meta class for the ShoppingItem model."""
+
+        indexes = [
+            Index(fields=["user", "-updated_at"], name="item_user_updated_idx"),
+            Index(fields=["store", "-updated_at"], name="item_store_updated_idx"),
+        ]
+        constraints = [
+            UniqueConstraint(fields=["store", "name"], name="item_store_name_unique"),
+        ]
+
     def __str__(self) -> str:
         """Return a string representation of the shopping item."""
         return f"{self.name}@{self.store.name}"
 
 
+class ShoppingItemAggregate(Model):
+    """
+    Denormalised item statistics for a single user.
+
+    Kept current by the item repository whenever the user's items are created, updated or
+    deleted. The extremes are flagged as stale when the current minimum or maximum item is
+    removed and are recomputed the next time the row is read.
+    """
+
+    user = OneToOneField(User, on_delete=CASCADE, primary_key=True, related_name="item_aggregate")
+    total_items = PositiveIntegerField(default=0)
+    total_price = DecimalField(max_digits=16, decimal_places=2, default=0)
+    max_price = DecimalField(max_digits=10, decimal_places=2, null=True)
+    min_price = DecimalField(max_digits=10, decimal_places=2, null=True)
+    extremes_stale = BooleanField(default=False)
+    updated_at = DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        """Return a string representation of the item aggregate."""
+        return f"{self.user_id}: {self.total_items} items"
+
+
+class ShoppingItemPriceHistory(Model):
+    """
+    Append-only record of an item price change.
+
+    The history outlives the item, so the item reference has no database constraint.
+    """
+
+    item = ForeignKey(
+        ShoppingItem,
+        on_delete=DO_NOTHING,
+        db_constraint=False,
+        related_name="price_history",
+    )
+    user = ForeignKey(User, on_delete=CASCADE)
+    old_price = DecimalField(max_digits=10, decimal_places=2)
+    price = DecimalField(max_digits=10, decimal_places=2)
+    recorded_at = DateTimeField(default=timezone.now)
+
+    class Meta:
+        """Meta class for the ShoppingItemPriceHistory model."""
+
+        indexes = [
+            Index(fields=["item", "recorded_at"], name="item_price_history_idx"),
+        ]
+
+    def __str__(self) -> str:
+        """Return a string representation of the price change."""
+        return f"{self.item_id}: {self.old_price} -> {self.price}"
+
+
+class ShoppingItemPriceRollup(Model):
+    """Monthly totals of the price changes of a user's items, kept with the history."""
+
+    user = ForeignKey(User, on_delete=CASCADE)
+    month = DateField()
+    changes = PositiveIntegerField(default=0)
+    total_price = DecimalField(max_digits=16, decimal_places=2, default=0)
+    max_price = DecimalField(max_digits=10, decimal_places=2, null=True)
+    min_price = DecimalField(max_digits=10, decimal_places=2, null=True)
+
+    class Meta:
+        """Meta class for the ShoppingItemPriceRollup model."""
+
+        constraints = [
+            UniqueConstraint(fields=["user", "month"], name="item_price_rollup_unique"),
+        ]
+
+    def __str__(self) -> str:
+        """Return a string representation of the rollup."""
+        return f"{self.user_id} @ {self.month:%Y-%m}: {self.changes} changes"
+
+
 log.info("Items models loaded.")
@@ -2,14 +2,20 @@
 
 import logging
 
-from django.http import HttpRequest
-from ninja import Router
+from django.http import HttpRequest, StreamingHttpResponse
+from ninja import P, QueryEx, Router
 
 from authentication.auth.api_key import ApiKey
-from items.schemas.input import ItemSearchSchema, NewItem, UpdateItem
-from items.schemas.output import ItemAggregationSchema, ItemPaginationSchema, ItemSchema
+from items.schemas.input import ItemSearchSchema, NewItem, NewItems, UpdateItem
+from items.schemas.output import (
+    BulkItemCreateSchema,
+    ItemAggregationSchema,
+    ItemPaginationSchema,
+    ItemSchema,
+)
 from items.services import item_service
 from shoppingapp.schemas.shared import DeleteSchema
+from shoppingapp.utilities.streaming import ExportFormat
 
 log = logging.getLogger(__name__)
 log.info("Item router loading...")
@@ -44,9 +50,30 @@ async def create_item(request: HttpRequest, new_item: NewItem) -> ItemSchema:
     return item
 
 
+@item_router.post("/bulk", response={200: BulkItemCreateSchema})
+async def create_items(request: HttpRequest, new_items: NewItems) -> BulkItemCreateSchema:
+    """
+    Create new items in bulk.
+
+    Args:
+        request (HttpRequest): The HTTP request.
+        new_items (NewItems): The new items data.
+
+    Returns:
+        BulkItemCreateSchema: The result of every row, in the order they were given.
+    """
+    user = await request.auser()
+    result = await item_service.create_items(user=user, new_items=new_items.items)
+    return result
+
+
 @item_router.get("", response={200: ItemPaginationSchema})
 async def get_items(
-    request: HttpRequest, page: int = 1, per_page: int = 10
+    request: HttpRequest,
+    page: int = 1,
+    per_page: QueryEx[int, P(ge=1)] = 10,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> ItemPaginationSchema:
     """
     Get all items.
@@ -55,17 +82,27 @@ async def get_items(
         request (HttpRequest): The HTTP request.
         page (int): The page number.
         per_page (int): The number of items per page.
+        cursor (str | None): The next_cursor of the previous page, or empty for the first page.
+            Enables cursor pagination, which ignores the page number.
+        include_total (bool): Whether to count the total number of items, total and total_pages
+            are null when disabled.
 
     Returns:
         ItemPaginationSchema: The paginated list of items.
     """
-    items = await item_service.get_items(page=page, items_per_page=per_page)
+    items = await item_service.get_items(
+        page=page, items_per_page=per_page, cursor=cursor, include_total=include_total
+    )
     return items
 
 
 @item_router.get("/me", response={200: ItemPaginationSchema})
 async def get_my_items(
-    request: HttpRequest, page: int = 1, per_page: int = 10
+    request: HttpRequest,
+    page: int = 1,
+    per_page: QueryEx[int, P(ge=1)] = 10,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> ItemPaginationSchema:
     """
     Get all items.
@@ -74,12 +111,22 @@ async def get_my_items(
         request (HttpRequest): The HTTP request.
         page (int): The page number.
         per_page (int): The number of items per page.
+        cursor (str | None): The next_cursor of the previous page, or empty for the first page.
+            Enables cursor pagination, which ignores the page number.
+        include_total (bool): Whether to count the total number of items, total and total_pages
+            are null when disabled.
 
     Returns:
         ItemPaginationSchema: The paginated list of items.
     """
     user = await request.auser()
-    items = await item_service.get_items(page=page, items_per_page=per_page, user=user)
+    items = await item_service.get_items(
+        page=page,
+        items_per_page=per_page,
+        user=user,
+        cursor=cursor,
+        include_total=include_total,
+    )
     return items
 
 
@@ -184,10 +231,12 @@ async def search(
     request: HttpRequest,
     search: ItemSearchSchema,
     page: int = 1,
-    limit: int = 10,
+    limit: QueryEx[int, P(ge=1)] = 10,
     name: str | None = None,
     own: bool = False,
     store: int | None = None,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> ItemPaginationSchema:
     """Search for items based off filters."""
     user = None
@@ -195,7 +244,53 @@ async def search(
         user = await request.auser()
 
     return await item_service.search_items(
-        user=user, limit=limit, name=name, page=page, search=search, store_id=store
+        user=user,
+        limit=limit,
+        name=name,
+        page=page,
+        search=search,
+        store_id=store,
+        cursor=cursor,
+        include_total=include_total,
+    )
+
+
+@item_router.post("/export")
+async def export(
+    request: HttpRequest,
+    search: ItemSearchSchema,
+    name: str | None = None,
+    own: bool = False,
+    store: int | None = None,
+    format: ExportFormat = "ndjson",
+) -> StreamingHttpResponse:
+    """
+    Export every item that matches the search filters.
+
+    The items are streamed from a database cursor, so the memory used does not depend on the
+    number of items.
+
+    Args:
+        request (HttpRequest): The HTTP request.
+        search (ItemSearchSchema): The search filters.
+        name (str | None): Full or partial name to search for.
+        own (bool): Flag indicating if you would like to export only your own items.
+        store (int | None): The store to filter off.
+        format (ExportFormat): Either ndjson or csv.
+
+    Returns:
+        StreamingHttpResponse: The streamed items.
+    """
+    user = None
+    if own:
+        user = await request.auser()
+
+    return await item_service.export_items(
+        export_format=format,
+        user=user,
+        name=name,
+        store_id=store,
+        search=search,
     )
 
 
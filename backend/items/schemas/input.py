@@ -4,11 +4,13 @@ import logging
 from datetime import date
 from decimal import Decimal
 
-from ninja import Schema
+from ninja import Field, Schema
 
 log = logging.getLogger(__name__)
 log.info("Item input schemas loading...")
 
+BULK_CREATE_LIMIT = 5000
+
 
 class NewItem(Schema):
     """New Item Schema."""
@@ -19,6 +21,12 @@ class NewItem(Schema):
     description: str = ""
 
 
+class NewItems(Schema):
+    """New Items Schema, used to create items in bulk."""
+
+    items: list[NewItem] = Field(..., min_length=1, max_length=BULK_CREATE_LIMIT)
+
+
 class UpdateItem(Schema):
     """Update Item Schema."""
 
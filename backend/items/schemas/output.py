@@ -1,6 +1,7 @@
 """Contains schemas that are outgoing to the user."""
 
 import logging
+from typing import Literal
 
 from ninja import ModelSchema, Schema
 
@@ -11,6 +12,8 @@ from stores.schemas.output import StoreSchemaNoUser
 log = logging.getLogger(__name__)
 log.info("Item output schemas loading...")
 
+BulkItemStatus = Literal["created", "duplicate", "store_not_found"]
+
 
 class ItemSchema(ModelSchema):
     """Item model schema for outgoing data."""
@@ -36,6 +39,24 @@ class ItemPaginationSchema(PaginationSchema):
     """Pagination schema for outgoing data."""
 
     items: list[ItemSchema] = []
+    next_cursor: str | None = None
+
+
+class BulkItemResultSchema(Schema):
+    """Result of a single row of a bulk item creation."""
+
+    index: int
+    status: BulkItemStatus
+    item: ItemSchema | None = None
+
+
+class BulkItemCreateSchema(Schema):
+    """Bulk item creation schema for outgoing data."""
+
+    created: int = 0
+    duplicates: int = 0
+    stores_not_found: int = 0
+    results: list[BulkItemResultSchema] = []
 
 
 class ItemAggregationSchema(Schema):
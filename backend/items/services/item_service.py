@@ -3,15 +3,26 @@
 import logging
 
 from django.contrib.auth.models import AbstractBaseUser, AnonymousUser, User
+from django.db import IntegrityError
+from django.http import StreamingHttpResponse
 
 from items.database import item_repo
 from items.errors.exceptions import ItemAlreadyExists, ItemDoesNotExist
 from items.models import ShoppingItem as Item
-from items.schemas.input import ItemSearchSchema
-from items.schemas.output import ItemAggregationSchema, ItemPaginationSchema, ItemSchema
+from items.schemas.input import ItemSearchSchema, NewItem
+from items.schemas.output import (
+    BulkItemCreateSchema,
+    BulkItemResultSchema,
+    BulkItemStatus,
+    ItemAggregationSchema,
+    ItemPaginationSchema,
+    ItemSchema,
+)
+from shoppingapp.database.errors import is_foreign_key_violation, is_unique_violation
 from shoppingapp.schemas.shared import DeleteSchema
+from shoppingapp.utilities.streaming import ExportFormat, stream_rows
 from stores.database import store_repo
-from stores.errors.api_exceptions import StoreDoesNotExist
+from stores.errors.api_exceptions import StoreDoesNotExist, StoresDoNotExist
 from stores.models import ShoppingStore as Store
 
 log = logging.getLogger(__name__)
@@ -44,10 +55,6 @@ async def create_item(
     """
     try:
         store = await store_repo.get_store(store_id=store_id)
-
-        if await item_repo.does_item_exist(name=name, store=store):
-            raise ItemAlreadyExists(item_name=name, store_name=store.name)
-
         item = await item_repo.create_item(
             description=description,
             name=name,
@@ -59,6 +66,84 @@ async def create_item(
         return item_schema
     except Store.DoesNotExist:
         raise StoreDoesNotExist(store_id=store_id)
+    except IntegrityError as error:
+        if is_unique_violation(error):
+            log.warning(f"Item ('{name}') already exists @ '{store.name}'.")
+            raise ItemAlreadyExists(item_name=name, store_name=store.name)
+        if is_foreign_key_violation(error):
+            log.warning(f"Store with id '{store_id}' was removed while creating an item.")
+            raise StoreDoesNotExist(store_id=store_id)
+        raise
+
+
+async def create_items(
+    user: User | AbstractBaseUser | AnonymousUser,
+    new_items: list[NewItem],
+) -> BulkItemCreateSchema:
+    """
+    Create items in bulk.
+
+    Rows are not created when their store does not exist or when an item with the same name
+    already exists at the store, including earlier rows in the same request.
+
+    Args:
+        user (User): The user that created the items.
+        new_items (list[NewItem]): The items to create.
+
+    Returns:
+        BulkItemCreateSchema: The result of every row, in the order they were given.
+    """
+    stores = await store_repo.get_stores_by_ids([new_item.store_id for new_item in new_items])
+    existing = await item_repo.find_existing(
+        {(new_item.store_id, new_item.name) for new_item in new_items}
+    )
+
+    statuses: list[BulkItemStatus] = []
+    to_create: list[tuple[int, Item]] = []
+    for index, new_item in enumerate(new_items):
+        key = (new_item.store_id, new_item.name)
+        store = stores.get(new_item.store_id)
+        if store is None:
+            statuses.append("store_not_found")
+            continue
+        if key in existing:
+            statuses.append("duplicate")
+            continue
+
+        existing.add(key)
+        statuses.append("created")
+        item = Item(
+            name=new_item.name,
+            description=new_item.description,
+            price=new_item.price,
+            store=store,
+        )
+        to_create.append((index, item))
+
+    log.info(f"Creating {len(to_create)} of {len(new_items)} items in bulk...")
+    created = await item_repo.bulk_create_items(user=user, items=[item for _, item in to_create])
+    created_by_index: dict[int, Item] = {}
+    for (index, _), (status, created_item) in zip(to_create, created):
+        statuses[index] = status
+        if created_item is not None:
+            created_by_index[index] = created_item
+
+    results = [
+        BulkItemResultSchema(
+            index=index,
+            status=status,
+            item=(
+                ItemSchema.from_orm(created_by_index[index]) if index in created_by_index else None
+            ),
+        )
+        for index, status in enumerate(statuses)
+    ]
+    return BulkItemCreateSchema(
+        created=statuses.count("created"),
+        duplicates=statuses.count("duplicate"),
+        stores_not_found=statuses.count("store_not_found"),
+        results=results,
+    )
 
 
 async def get_items(
@@ -66,15 +151,30 @@ async def get_items(
     items_per_page: int = 10,
     user: User | AbstractBaseUser | AnonymousUser | None = None,
     store: Store | None = None,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> ItemPaginationSchema:
     """
     Get all items.
 
+    Args:
+        page (int): The page number.
+        items_per_page (int): The number of items per page.
+        user (User): The user that owns the items.
+        store (Store): The store to filter off.
+        cursor (str): The cursor to page from, enables cursor pagination when provided.
+        include_total (bool): Whether to count the total number of items.
+
     Returns:
         ItemPaginationSchema: A paginated list of items.
     """
     items = await item_repo.get_items(
-        page=page, items_per_page=items_per_page, user=user, store=store
+        page=page,
+        items_per_page=items_per_page,
+        user=user,
+        store=store,
+        cursor=cursor,
+        include_total=include_total,
     )
     return items
 
@@ -113,54 +213,28 @@ async def get_item_detail(item_id: int) -> ItemSchema:
         raise ItemDoesNotExist(item_id=item_id)
 
 
-async def _validate_for_update(
+async def _store_name_for_update(
     item_id: int,
     user: User | AbstractBaseUser | AnonymousUser,
-    name: str | None = None,
     store_id: int | None = None,
-) -> tuple[Item, Store | None]:
+) -> str:
     """
-    Check that all provided details are valid for updating an item.
+    Get the name of the store an update targeted, used to describe a rejected update.
 
     Args:
         item_id (int): The item id.
         user (User): The user that created the item.
-        name (str): The new item name.
-        store_id (int): The store id that the item belongs to.
+        store_id (int | None): The new store id, the current store of the item is used if None.
 
     Returns:
-        tuple[Item, Store | None]: The item and store details, store can be None.
-
-    Raises:
-        ItemDoesNotExist: If the item id provided does not exist.
-        ItemAlreadyExists: If you are attempting to create a duplicate item at the given store.
-        StoreDoesNotExist: If the store id provided is invalid.
+        str: The store name.
     """
-    logging.info("Validating new updated item details...")
-    store = None
-    item = None
-
     if store_id:
-        logging.info(f"Getting store with ID: {store_id} (For update on item with ID: {item_id})")
-        try:
-            store = await store_repo.get_store(store_id=store_id)
-        except Store.DoesNotExist:
-            raise StoreDoesNotExist(store_id=store_id)
-
-    logging.info("Attempting to retrieve item details...")
-    try:
-        item = await item_repo.get_item_for_user(item_id=item_id, user=user)
-    except Item.DoesNotExist:
-        raise ItemDoesNotExist(item_id=item_id)
-
-    logging.info("Checking if item already exists...")
-    if name and store and await item_repo.does_item_exist(name=name, store=store):
-        raise ItemAlreadyExists(item_name=name, store_name=store.name)
-
-    if name and not store and await item_repo.does_item_exist(name=name, store=item.store):
-        raise ItemAlreadyExists(item_name=name, store_name=item.store.name)
+        store = await store_repo.get_store(store_id=store_id)
+        return store.name
 
-    return item, store
+    item = await item_repo.get_item_for_user(item_id=item_id, user=user)
+    return item.store.name
 
 
 async def update_item(
@@ -189,18 +263,30 @@ async def update_item(
         ItemAlreadyExists: If you are attempting to create a duplicate item at the given store.
         StoreDoesNotExist: If the store id provided is invalid.
     """
-    item, store = await _validate_for_update(
-        item_id=item_id, user=user, name=name, store_id=store_id
-    )
+    try:
+        item = await item_repo.update_item(
+            item_id=item_id,
+            user=user,
+            name=name,
+            price=price,
+            description=description,
+            store_id=store_id,
+        )
+    except Item.DoesNotExist:
+        logging.warning(f"Item with ID: {item_id} does not exist for user: {user}. (For update)")
+        raise ItemDoesNotExist(item_id=item_id)
+    except Store.DoesNotExist:
+        raise StoreDoesNotExist(store_id=store_id or 0)
+    except IntegrityError as error:
+        if is_unique_violation(error) and name:
+            store_name = await _store_name_for_update(item_id, user, store_id)
+            log.warning(f"Item ('{name}') already exists @ '{store_name}'.")
+            raise ItemAlreadyExists(item_name=name, store_name=store_name)
+        if is_foreign_key_violation(error) and store_id:
+            log.warning(f"Store with id '{store_id}' was removed while updating an item.")
+            raise StoreDoesNotExist(store_id=store_id)
+        raise
 
-    logging.info("Update checks passed.")
-    item = await item_repo.update_item(
-        item=item,
-        name=name,
-        price=price,
-        description=description,
-        store=store,
-    )
     item_schema = ItemSchema.from_orm(item)
     return item_schema
 
@@ -224,6 +310,42 @@ async def delete_item(item_id: int, user: User | AbstractBaseUser | AnonymousUse
         raise ItemDoesNotExist(item_id=item_id)
 
 
+async def _resolve_stores(
+    store_id: int | None = None,
+    search: ItemSearchSchema | None = None,
+) -> tuple[int | None, list[int] | None]:
+    """
+    Validate the store filters of an item search with a single query.
+
+    Args:
+        store_id (int | None): The store to filter off.
+        search (ItemSearchSchema | None): The search filters, which may contain stores.
+
+    Returns:
+        tuple[int | None, list[int] | None]: The store id and the store ids to filter off.
+
+    Raises:
+        StoreDoesNotExist: If the store does not exist.
+        StoresDoNotExist: If any of the stores in the search do not exist.
+    """
+    store_ids = search.stores if search and search.stores else None
+    requested = set(store_ids or [])
+    if store_id:
+        requested.add(store_id)
+    if not requested:
+        return store_id, store_ids
+
+    missing = sorted(requested - await store_repo.get_existing_store_ids(requested))
+    if store_id and missing == [store_id]:
+        log.warning("Could not find selected store.")
+        raise StoreDoesNotExist(store_id=store_id)
+    if missing:
+        log.warning(f"Could not find selected stores: {missing}.")
+        raise StoresDoNotExist(store_ids=missing)
+
+    return store_id, store_ids
+
+
 async def search_items(
     page: int = 1,
     limit: int = 10,
@@ -231,6 +353,8 @@ async def search_items(
     name: str | None = None,
     store_id: int | None = None,
     search: ItemSearchSchema | None = None,
+    cursor: str | None = None,
+    include_total: bool = True,
 ) -> ItemPaginationSchema:
     """
     Search items based on the provided filters.
@@ -252,25 +376,13 @@ async def search_items(
         price (float): Price to filter by.
         price_is_lt (float): Price is smaller than.
         price_is_gt (float): The price is greater than.
+        cursor (str): The cursor to page from, enables cursor pagination when provided.
+        include_total (bool): Whether to count the total number of items.
 
     Returns:
         ItemPaginationSchema: Returns the item pagination schema.
     """
-    stores = None
-    if search and search.stores:
-        try:
-            stores = [await store_repo.get_store(store_id) for store_id in search.stores]
-        except Store.DoesNotExist:
-            log.warning("Could not find selected stores.")
-            raise StoreDoesNotExist(store_id=0)
-
-    store = None
-    if store_id:
-        try:
-            store = await store_repo.get_store(store_id)
-        except Store.DoesNotExist:
-            log.warning("Could not find selected store.")
-            raise StoreDoesNotExist(store_id=store_id)
+    store, store_ids = await _resolve_stores(store_id=store_id, search=search)
 
     result = await item_repo.get_items(
         name=name,
@@ -279,9 +391,42 @@ async def search_items(
         store=store,
         user=user,
         search=search,
-        stores=stores,
+        store_ids=store_ids,
+        cursor=cursor,
+        include_total=include_total,
     )
     return result
 
 
+async def export_items(
+    export_format: ExportFormat = "ndjson",
+    user: User | AbstractBaseUser | AnonymousUser | None = None,
+    name: str | None = None,
+    store_id: int | None = None,
+    search: ItemSearchSchema | None = None,
+) -> StreamingHttpResponse:
+    """
+    Export every item that matches the search filters as a stream.
+
+    Args:
+        export_format (ExportFormat): Either ndjson or csv.
+        user (User): The user that owns the items.
+        name (str): Full or partial name to filter by.
+        store_id (int): The store to filter off.
+        search (ItemSearchSchema): The search filters.
+
+    Returns:
+        StreamingHttpResponse: The streamed items.
+
+    Raises:
+        StoreDoesNotExist: If the store does not exist.
+        StoresDoNotExist: If any of the stores in the search do not exist.
+    """
+    store, store_ids = await _resolve_stores(store_id=store_id, search=search)
+    rows = item_repo.export_items(
+        user=user, store=store, name=name, store_ids=store_ids, search=search
+    )
+    return stream_rows(rows, item_repo.EXPORT_FIELDS, export_format, filename="items")
+
+
 log.info("Item Service Loaded.")
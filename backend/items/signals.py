@@ -0,0 +1,22 @@
+"""Contains the signal receivers of the items app."""
+
+import logging
+from typing import Any
+
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from items.database import aggregate_repo
+from stores.models import ShoppingStore as Store
+
+log = logging.getLogger(__name__)
+log.info("Loading item signals...")
+
+
+@receiver(pre_delete, sender=Store)
+def remove_store_items_from_aggregates(sender: type[Store], instance: Store, **kwargs: Any) -> None:
+    """Take the items of a store deleted through the ORM out of the aggregates of their owners."""
+    aggregate_repo.record_store_deleted(store_id=instance.pk)
+
+
+log.info("Loaded item signals.")
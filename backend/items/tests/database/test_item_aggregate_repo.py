@@ -0,0 +1,124 @@
+"""Contains tests for the incrementally maintained item aggregates."""
+
+from decimal import Decimal
+
+from items.database import aggregate_repo, item_repo
+from items.models import ShoppingItem as Item
+from items.models import ShoppingItemAggregate as ItemAggregate
+from items.tests.base.base_test_case import BaseTestCase
+from stores.database import store_repo
+
+
+class TestItemAggregateRepo(BaseTestCase):
+    """Test that the item repository keeps the aggregate rows current."""
+
+    async def _aggregate_row(self) -> ItemAggregate:
+        """Get the aggregate row of the test user."""
+        return await ItemAggregate.objects.aget(user=self.user)
+
+    async def test_missing_row_is_built_from_items(self) -> None:
+        """Test that the row is built from the item table on first read."""
+        self.assertFalse(await ItemAggregate.objects.filter(user=self.user).aexists())
+
+        aggregation = await item_repo.aggregate(user=self.user)
+
+        self.assertEqual(aggregation["total_items"], 2)
+        self.assertEqual(aggregation["total_price"], 300)
+        self.assertEqual(aggregation["average_price"], 150)
+        self.assertEqual(aggregation["max_price"], 200)
+        self.assertEqual(aggregation["min_price"], 100)
+        self.assertTrue(await ItemAggregate.objects.filter(user=self.user).aexists())
+
+    async def test_create_updates_row(self) -> None:
+        """Test that creating an item updates the totals and extremes."""
+        await item_repo.create_item(user=self.user, store=self.store, name="Cheap", price=50)
+        await item_repo.create_item(user=self.user, store=self.store, name="Dear", price=500)
+
+        aggregate = await self._aggregate_row()
+        self.assertEqual(aggregate.total_items, 4)
+        self.assertEqual(aggregate.total_price, Decimal("850"))
+        self.assertEqual(aggregate.max_price, Decimal("500"))
+        self.assertEqual(aggregate.min_price, Decimal("50"))
+        self.assertFalse(aggregate.extremes_stale)
+
+    async def test_update_price_adjusts_totals(self) -> None:
+        """Test that changing a price adjusts the sum and extremes."""
+        await item_repo.update_item(item_id=self.item.id, user=self.user, price=400)
+
+        aggregate = await self._aggregate_row()
+        self.assertEqual(aggregate.total_items, 2)
+        self.assertEqual(aggregate.total_price, Decimal("600"))
+        self.assertEqual(aggregate.max_price, Decimal("400"))
+        self.assertTrue(aggregate.extremes_stale)
+
+        aggregation = await item_repo.aggregate(user=self.user)
+        self.assertEqual(aggregation["min_price"], 200)
+        self.assertEqual(aggregation["max_price"], 400)
+        self.assertFalse((await self._aggregate_row()).extremes_stale)
+
+    async def test_update_without_price_change(self) -> None:
+        """Test that updating other fields leaves the aggregate untouched."""
+        await item_repo.aggregate(user=self.user)
+        await item_repo.update_item(item_id=self.item.id, user=self.user, name="Renamed Item")
+
+        aggregate = await self._aggregate_row()
+        self.assertEqual(aggregate.total_price, Decimal("300"))
+        self.assertFalse(aggregate.extremes_stale)
+
+    async def test_delete_extreme_marks_stale(self) -> None:
+        """Test that deleting the maximum item flags the extremes for recomputation."""
+        await item_repo.delete_item(item_id=self.alt_item.id, user=self.user)
+
+        aggregate = await self._aggregate_row()
+        self.assertEqual(aggregate.total_items, 1)
+        self.assertEqual(aggregate.total_price, Decimal("100"))
+        self.assertTrue(aggregate.extremes_stale)
+
+        aggregation = await item_repo.aggregate(user=self.user)
+        self.assertEqual(aggregation["max_price"], 100)
+        self.assertEqual(aggregation["min_price"], 100)
+
+    async def test_delete_non_extreme_keeps_extremes(self) -> None:
+        """Test that deleting an item between the extremes does not flag them."""
+        item = await item_repo.create_item(
+            user=self.user, store=self.store, name="Middle", price=150
+        )
+        await item_repo.delete_item(item_id=item.id, user=self.user)
+
+        aggregate = await self._aggregate_row()
+        self.assertEqual(aggregate.total_items, 2)
+        self.assertFalse(aggregate.extremes_stale)
+
+    async def test_delete_last_item(self) -> None:
+        """Test that removing every item returns an empty aggregation."""
+        await item_repo.delete_item(item_id=self.item.id, user=self.user)
+        await item_repo.delete_item(item_id=self.alt_item.id, user=self.user)
+
+        aggregation = await item_repo.aggregate(user=self.user)
+        self.assertEqual(aggregation["total_items"], 0)
+        self.assertIsNone(aggregation["total_price"])
+        self.assertIsNone(aggregation["max_price"])
+
+    async def test_delete_store_removes_items_from_aggregate(self) -> None:
+        """Test that deleting a store subtracts its items from the owners' aggregates."""
+        store = await self.create_temporary_store()
+        await item_repo.create_item(user=self.user, store=store, name="Gone", price=1000)
+
+        await store_repo.delete_store(store_id=store.id, user=self.user)
+
+        aggregation = await item_repo.aggregate(user=self.user)
+        self.assertEqual(aggregation["total_items"], 2)
+        self.assertEqual(aggregation["total_price"], 300)
+        self.assertEqual(aggregation["max_price"], 200)
+
+    def test_find_mismatches_and_rebuild(self) -> None:
+        """Test that drifted rows are reported and rebuilt."""
+        aggregate_repo.ensure(user_id=self.user.id)
+        self.assertEqual(aggregate_repo.find_mismatches(), [])
+
+        Item.objects.create(name="Untracked", price=5, store=self.store, user=self.user)
+        self.assertEqual(aggregate_repo.find_mismatches(), [self.user.id])
+
+        aggregate_repo.rebuild(user_ids=[self.user.id])
+        self.assertEqual(aggregate_repo.find_mismatches(), [])
+        self.assertEqual(ItemAggregate.objects.get(user=self.user).total_items, 3)
@@ -0,0 +1,86 @@
+"""Contains tests for the item search date filters."""
+
+from datetime import date, datetime
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from django.db.models import Q
+from django.utils import timezone
+
+from items.database import item_repo
+from items.models import ShoppingItem as Item
+from items.schemas.input import ItemSearchSchema
+from items.tests.base.base_test_case import BaseTestCase
+from shoppingapp.database.filters import date_range
+
+AMSTERDAM = ZoneInfo("Europe/Amsterdam")
+
+
+class TestItemDateFilter(BaseTestCase):
+    """Test that item date filters compile to timestamp ranges."""
+
+    def setUp(self) -> None:
+        """Set the updated dates of the items."""
+        super().setUp()
+        Item.objects.filter(id=self.item.id).update(
+            updated_at=datetime(2024, 3, 9, 23, 30, tzinfo=AMSTERDAM)
+        )
+        Item.objects.filter(id=self.alt_item.id).update(
+            updated_at=datetime(2024, 3, 10, 0, 30, tzinfo=AMSTERDAM)
+        )
+
+    def _search(self, **filters: Any) -> set[int]:
+        """Get the ids of the user's items that match the date filters."""
+        items = item_repo._filter(user=self.user, search=ItemSearchSchema(**filters))
+        return set(items.values_list("id", flat=True))
+
+    def test_date_range_uses_active_timezone(self) -> None:
+        """Test that the day boundaries are midnight in the active timezone."""
+        with timezone.override(AMSTERDAM):
+            query = date_range("updated_at", on=date(2024, 3, 10))
+
+        expected = Q(
+            updated_at__gte=datetime(2024, 3, 10, tzinfo=AMSTERDAM),
+            updated_at__lt=datetime(2024, 3, 11, tzinfo=AMSTERDAM),
+        )
+        self.assertEqual(query, expected)
+
+    def test_date_range_without_dates(self) -> None:
+        """Test that no dates produce an empty filter."""
+        self.assertEqual(date_range("updated_at"), date_range("created_at"))
+        self.assertFalse(date_range("updated_at").children)
+
+    def test_updated_on(self) -> None:
+        """Test that only items updated on the local date match."""
+        with timezone.override(AMSTERDAM):
+            self.assertEqual(self._search(updated_on=date(2024, 3, 10)), {self.alt_item.id})
+            self.assertEqual(self._search(updated_on=date(2024, 3, 9)), {self.item.id})
+
+        # In UTC both items were updated on the 9th
+        self.assertEqual(
+            self._search(updated_on=date(2024, 3, 9)), {self.item.id, self.alt_item.id}
+        )
+
+    def test_updated_before_and_after_are_exclusive(self) -> None:
+        """Test that the before and after dates themselves do not match."""
+        with timezone.override(AMSTERDAM):
+            self.assertEqual(self._search(updated_before=date(2024, 3, 10)), {self.item.id})
+            self.assertEqual(self._search(updated_after=date(2024, 3, 9)), {self.alt_item.id})
+            self.assertEqual(
+                self._search(updated_after=date(2024, 3, 9), updated_before=date(2024, 3, 10)),
+                set(),
+            )
+
+    def test_updated_range_uses_index(self) -> None:
+        """Test that a date range is answered with an index range scan."""
+        items = item_repo._filter(
+            user=self.user,
+            search=ItemSearchSchema(
+                updated_after=date(2024, 1, 1), updated_before=date(2024, 2, 1)
+            ),
+        )
+
+        plan = items.explain()
+        self.assertIn("item_user_updated_idx", plan)
+        self.assertIn("updated_at>", plan)
+        self.assertIn("updated_at<", plan)
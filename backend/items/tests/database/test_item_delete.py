@@ -1,5 +1,9 @@
 """Contains tests for the item repository delete functions."""
 
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from items.database import item_repo
 from items.models import ShoppingItem as Item
 from items.tests.base.base_test_case import BaseTestCase
@@ -35,3 +39,14 @@ class TestDeleteItem(BaseTestCase):
         # Check that the item still exists
         item_exists = await Item.objects.filter(id=self.item.id).aexists()
         self.assertTrue(item_exists)
+
+    def test_delete_item_single_statement(self) -> None:
+        """Test that the item is deleted without being loaded first."""
+        async_to_sync(item_repo.aggregate)(user=self.user)
+
+        with CaptureQueriesContext(connection) as queries:
+            async_to_sync(item_repo.delete_item)(item_id=self.item.id, user=self.user)
+
+        statements = [query["sql"] for query in queries.captured_queries]
+        self.assertEqual(sum(sql.startswith("DELETE") for sql in statements), 1)
+        self.assertFalse(any(sql.startswith("SELECT") and "price" in sql for sql in statements))
@@ -0,0 +1,72 @@
+"""Contains tests that check the item indexes are used by the repository queries."""
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.testcases import TestCase
+
+from items.models import ShoppingItem as Item
+from stores.models import ShoppingStore as Store
+
+
+class TestItemIndexes(TestCase):
+    """Test that the planner uses the item indexes for the repository access paths."""
+
+    def setUp(self) -> None:
+        """Seed a dataset large enough for the planner to prefer the indexes."""
+        self.users = [
+            User.objects.create(username=f"indexuser{index}", email=f"index{index}@gmail.com")
+            for index in range(5)
+        ]
+        self.stores = [
+            Store.objects.create(
+                name=f"Index Store {index}",
+                store_type=(index % 3) + 1,
+                description="",
+                user=self.users[index % 5],
+            )
+            for index in range(20)
+        ]
+        Item.objects.bulk_create(
+            Item(
+                name=f"Index Item {index}",
+                description="",
+                price=index,
+                store=self.stores[index % 20],
+                user=self.users[index % 5],
+            )
+            for index in range(2000)
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+            if connection.vendor == "postgresql":
+                # Only for the transaction of this test, so later tests plan as usual.
+                cursor.execute("SET LOCAL enable_seqscan = off")
+
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        """Tear down the tests."""
+        User.objects.all().delete()
+        Store.objects.all().delete()
+        Item.objects.all().delete()
+        return super().tearDown()
+
+    def test_user_listing_uses_index(self) -> None:
+        """Test that listing a user's items uses the (user, -updated_at) index."""
+        queryset = Item.objects.filter(user=self.users[0]).order_by("-updated_at", "-id")
+        self.assertIn("item_user_updated_idx", queryset.explain())
+
+    def test_store_listing_uses_index(self) -> None:
+        """Test that listing a store's items uses the (store, -updated_at) index."""
+        queryset = Item.objects.filter(store=self.stores[0]).order_by("-updated_at", "-id")
+        self.assertIn("item_store_updated_idx", queryset.explain())
+
+    def test_item_exists_uses_index(self) -> None:
+        """Test that checking if an item exists uses the (store, name) unique index."""
+        queryset = Item.objects.filter(store=self.stores[0], name="Index Item 0")
+        # SQLite backs table level unique constraints with an automatically named index.
+        index = "item_store_name_unique" if connection.vendor == "postgresql" else "autoindex"
+        plan = queryset.explain()
+        self.assertIn(index, plan)
+        self.assertIn("store_id", plan)
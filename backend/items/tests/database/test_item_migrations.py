@@ -0,0 +1,80 @@
+"""Contains tests for the item migrations."""
+
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+
+BEFORE_UNIQUE = [("items", "0005_shoppingitemaggregate")]
+UNIQUE = [("items", "0006_shoppingitem_store_name_unique")]
+
+
+class TestStoreNameUniqueMigration(TransactionTestCase):
+    """Test the migration that makes item names unique per store."""
+
+    def tearDown(self) -> None:
+        """Migrate back to the latest migrations."""
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(executor.loader.graph.leaf_nodes())
+        return super().tearDown()
+
+    def _migrate(self, targets: list[tuple[str, str]]) -> MigrationExecutor:
+        """Migrate to the targets and return an executor for them."""
+        executor = MigrationExecutor(connection)
+        executor.migrate(targets)
+        executor.loader.build_graph()
+        return executor
+
+    def test_duplicates_renamed(self) -> None:
+        """Test that items sharing a name at their store are renamed before the constraint."""
+        executor = self._migrate(BEFORE_UNIQUE)
+        apps = executor.loader.project_state(BEFORE_UNIQUE).apps
+        User = apps.get_model("auth", "User")
+        Store = apps.get_model("stores", "ShoppingStore")
+        Item = apps.get_model("items", "ShoppingItem")
+
+        user = User.objects.create(username="migrationuser")
+        store = Store.objects.create(name="Migration Store", store_type=1, user=user)
+        other_store = Store.objects.create(name="Other Store", store_type=1, user=user)
+        first, second, third = [
+            Item.objects.create(name="Milk", price=1, store=store, user=user) for _ in range(3)
+        ]
+        other = Item.objects.create(name="Milk", price=1, store=other_store, user=user)
+        long_name = "x" * 100
+        Item.objects.create(name=long_name, price=1, store=store, user=user)
+        long_duplicate = Item.objects.create(name=long_name, price=1, store=store, user=user)
+
+        executor = self._migrate(UNIQUE)
+        Item = executor.loader.project_state(UNIQUE).apps.get_model("items", "ShoppingItem")
+
+        names = dict(Item.objects.values_list("id", "name"))
+        self.assertEqual(names[first.id], "Milk")
+        self.assertEqual(names[second.id], f"Milk ({second.id})")
+        self.assertEqual(names[third.id], f"Milk ({third.id})")
+        self.assertEqual(names[other.id], "Milk")
+        self.assertEqual(len(names[long_duplicate.id]), 100)
+        self.assertTrue(names[long_duplicate.id].endswith(f" ({long_duplicate.id})"))
+
+    def test_renamed_name_already_taken(self) -> None:
+        """Test that a duplicate is given another name when its renamed name is taken."""
+        executor = self._migrate(BEFORE_UNIQUE)
+        apps = executor.loader.project_state(BEFORE_UNIQUE).apps
+        User = apps.get_model("auth", "User")
+        Store = apps.get_model("stores", "ShoppingStore")
+        Item = apps.get_model("items", "ShoppingItem")
+
+        user = User.objects.create(username="migrationuser")
+        store = Store.objects.create(name="Migration Store", store_type=1, user=user)
+        first = Item.objects.create(name="Milk", price=1, store=store, user=user)
+        second = Item.objects.create(name="Milk", price=1, store=store, user=user)
+        taken = Item.objects.create(name=f"Milk ({second.id})", price=1, store=store, user=user)
+
+        with self.assertLogs("items.migrations", level="WARNING") as logs:
+            executor = self._migrate(UNIQUE)
+        Item = executor.loader.project_state(UNIQUE).apps.get_model("items", "ShoppingItem")
+
+        names = dict(Item.objects.values_list("id", "name"))
+        self.assertEqual(names[first.id], "Milk")
+        self.assertEqual(names[taken.id], f"Milk ({second.id})")
+        self.assertEqual(names[second.id], f"Milk ({second.id}-2)")
+        self.assertIn(f"Renaming item '{second.id}'", logs.output[0])
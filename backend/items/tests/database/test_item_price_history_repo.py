@@ -0,0 +1,51 @@
+"""Contains tests for the item price history repository."""
+
+from decimal import Decimal
+
+from items.database import item_repo
+from items.models import ShoppingItemPriceHistory as PriceHistory
+from items.models import ShoppingItemPriceRollup as PriceRollup
+from items.tests.base.base_test_case import BaseTestCase
+
+
+class TestItemPriceHistoryRepo(BaseTestCase):
+    """Test that price changes are recorded with the update."""
+
+    async def _history(self) -> list[PriceHistory]:
+        """Get the price changes of the item, oldest first."""
+        history = PriceHistory.objects.filter(item_id=self.item.id).order_by("recorded_at")
+        return [change async for change in history]
+
+    async def test_update_records_price_change(self) -> None:
+        """Test that a price update appends to the history and the monthly rollup."""
+        await item_repo.update_item(item_id=self.item.id, user=self.user, price=150)
+        await item_repo.update_item(item_id=self.item.id, user=self.user, price=50)
+
+        history = await self._history()
+        self.assertEqual(
+            [(change.old_price, change.price) for change in history],
+            [(Decimal("100"), Decimal("150")), (Decimal("150"), Decimal("50"))],
+        )
+
+        rollup = await PriceRollup.objects.aget(user=self.user)
+        self.assertEqual(rollup.month, history[0].recorded_at.date().replace(day=1))
+        self.assertEqual(rollup.changes, 2)
+        self.assertEqual(rollup.total_price, Decimal("200"))
+        self.assertEqual(rollup.max_price, Decimal("150"))
+        self.assertEqual(rollup.min_price, Decimal("50"))
+
+    async def test_update_without_price_change(self) -> None:
+        """Test that updates that keep the price are not recorded."""
+        await item_repo.update_item(item_id=self.item.id, user=self.user, name="Renamed Item")
+        await item_repo.update_item(item_id=self.item.id, user=self.user, price=100)
+
+        self.assertEqual(await self._history(), [])
+        self.assertFalse(await PriceRollup.objects.filter(user=self.user).aexists())
+
+    async def test_history_outlives_item(self) -> None:
+        """Test that the history of a deleted item is kept."""
+        await item_repo.update_item(item_id=self.item.id, user=self.user, price=150)
+        await item_repo.delete_item(item_id=self.item.id, user=self.user)
+
+        history = await self._history()
+        self.assertEqual(len(history), 1)
@@ -351,7 +351,7 @@ class TestFilterItems(TestCase):
 
     def test_filter_item_stores(self) -> None:
         """Test the filter with stores."""
-        records = item_repo._filter(stores=[self.store])
+        records = item_repo._filter(store_ids=[self.store.id])
         items = [record for record in records]
         self.assertIsInstance(items, list)
         self.assertEqual(len(items), 2)
@@ -366,7 +366,7 @@ class TestFilterItems(TestCase):
         )
         self.store.save()
 
-        records = item_repo._filter(stores=[self.store])
+        records = item_repo._filter(store_ids=[self.store.id])
         items = [record for record in records]
         self.assertIsInstance(items, list)
         self.assertEqual(len(items), 0)
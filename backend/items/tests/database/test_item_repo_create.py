@@ -3,10 +3,13 @@
 from datetime import datetime
 
 from django.contrib.auth.models import User
+from django.db import IntegrityError
 from django.test.testcases import TestCase
 
 from items.database import item_repo
 from items.models import ShoppingItem as Item
+from items.models import ShoppingItemAggregate as ItemAggregate
+from shoppingapp.database.errors import is_foreign_key_violation, is_unique_violation
 from stores.models import ShoppingStore as Store
 
 MOCK_NAME = "Test Item"
@@ -115,3 +118,16 @@ class TestItemRepositoryCreate(TestCase):
         self.assertEqual(item.description, MOCK_DESRIPTION)
         self.assertIsInstance(item.created_at, datetime)
         self.assertIsInstance(item.updated_at, datetime)
+
+    async def test_create_duplicate_violates_constraint(self) -> None:
+        """Test that the database rejects a duplicate item and leaves the aggregate as it was."""
+        await item_repo.create_item(user=self.user, store=self.store, name=MOCK_NAME, price=10)
+
+        with self.assertRaises(IntegrityError) as context:
+            await item_repo.create_item(user=self.user, store=self.store, name=MOCK_NAME, price=20)
+
+        self.assertTrue(is_unique_violation(context.exception))
+        self.assertFalse(is_foreign_key_violation(context.exception))
+        aggregate = await ItemAggregate.objects.aget(user=self.user)
+        self.assertEqual(aggregate.total_items, 1)
+        self.assertEqual(aggregate.total_price, 10)
@@ -0,0 +1,69 @@
+"""Contains tests for the cursor pagination of the item repository."""
+
+import pytest
+
+from items.database import item_repo
+from items.errors.exceptions import InvalidCursor
+from items.models import ShoppingItem as Item
+from items.tests.base.base_test_case import BaseTestCase
+
+
+class TestKeysetPaginateItems(BaseTestCase):
+    """Test the item repository cursor pagination."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        super().setUp()
+        for index in range(3):
+            Item.objects.create(
+                name=f"Keyset Item {index}",
+                description="",
+                price=10,
+                store=self.store,
+                user=self.user,
+            )
+
+    async def test_first_page(self) -> None:
+        """Test that the first page is returned with a cursor to the next page."""
+        items = await item_repo.get_items(items_per_page=2, cursor="")
+        self.assertEqual(len(items.items), 2)
+        self.assertIsNone(items.total)
+        self.assertIsNone(items.total_pages)
+        self.assertFalse(items.has_previous)
+        self.assertTrue(items.has_next)
+        self.assertIsNotNone(items.next_cursor)
+
+    async def test_walk_all_pages(self) -> None:
+        """Test that following the cursors returns every item once in order."""
+        expected = [item.id async for item in Item.objects.order_by("-updated_at", "-id")]
+        seen: list[int] = []
+        cursor = ""
+
+        while True:
+            items = await item_repo.get_items(items_per_page=2, cursor=cursor)
+            seen.extend(item.id for item in items.items)  # type: ignore
+            if not items.has_next:
+                self.assertIsNone(items.next_cursor)
+                break
+            self.assertIsNotNone(items.next_cursor)
+            cursor = items.next_cursor or ""
+
+        self.assertEqual(seen, expected)
+
+    async def test_cursor_with_filters(self) -> None:
+        """Test that cursor pagination respects the filters."""
+        items = await item_repo.get_items(items_per_page=1, cursor="", name="Keyset")
+        self.assertEqual(len(items.items), 1)
+        self.assertTrue(items.has_next)
+
+        items = await item_repo.get_items(
+            items_per_page=10, cursor=items.next_cursor, name="Keyset"
+        )
+        self.assertEqual(len(items.items), 2)
+        self.assertTrue(items.has_previous)
+        self.assertFalse(items.has_next)
+
+    async def test_invalid_cursor(self) -> None:
+        """Test that an invalid cursor raises an error."""
+        with pytest.raises(InvalidCursor):
+            await item_repo.get_items(cursor="not-a-cursor")
@@ -0,0 +1,44 @@
+"""Contains tests for the trigram substring lookup used by the item repository."""
+
+from django.db import connection
+
+from items.database import item_repo
+from items.models import ShoppingItem as Item
+from items.tests.base.base_test_case import BaseTestCase
+from shoppingapp.database.lookups import TrigramIContains
+
+
+class TestTrigramIContains(BaseTestCase):
+    """Test the trigram substring lookup."""
+
+    def test_matches_case_insensitive_substring(self) -> None:
+        """Test that the lookup matches substrings regardless of case."""
+        items = Item.objects.filter(name__trigram_icontains="tEsT it")
+        self.assertEqual(list(items), [self.item])
+
+    def test_matches_description(self) -> None:
+        """Test that the lookup is registered on text fields."""
+        items = Item.objects.filter(description__trigram_icontains="alternate desc")
+        self.assertEqual(list(items), [self.alt_item])
+
+    def test_escapes_wildcards(self) -> None:
+        """Test that LIKE wildcards in the value are matched literally."""
+        items = Item.objects.filter(name__trigram_icontains="%")
+        self.assertEqual(list(items), [])
+
+    def test_compiles_to_ilike_on_postgres(self) -> None:
+        """Test that the PostgreSQL compilation is an ILIKE without UPPER around the column."""
+        query = Item.objects.filter(name__trigram_icontains="50%").query
+        lookup = query.where.children[0]
+        assert isinstance(lookup, TrigramIContains)
+
+        sql, params = lookup.as_postgresql(query.get_compiler(connection=connection), connection)
+        self.assertIn("ILIKE", sql)
+        self.assertNotIn("UPPER", sql)
+        self.assertEqual(params, ["%50\\%%"])
+
+    async def test_get_items_name_filter(self) -> None:
+        """Test that the repository name filter uses the lookup."""
+        items = await item_repo.get_items(name="alternate")
+        self.assertEqual(items.total, 1)
+        self.assertEqual(items.items[0].id, self.alt_item.id)  # type: ignore
@@ -1,8 +1,12 @@
 """Contains tests for the item repo update functions."""
 
+from django.contrib.auth.models import User
+from django.db import IntegrityError
+
 from items.database import item_repo
 from items.models import ShoppingItem as Item
 from items.tests.base.base_test_case import BaseTestCase
+from stores.models import ShoppingStore as Store
 
 
 class TestUpdateItem(BaseTestCase):
@@ -16,7 +20,7 @@ class TestUpdateItem(BaseTestCase):
         )
 
         # Update the item
-        item = await item_repo.update_item(item=self.item)
+        item = await item_repo.update_item(item_id=self.item.id, user=self.user)
 
         # Item ID remains the same
         self.assertEqual(item.id, item_before_update.id)
@@ -46,7 +50,7 @@ class TestUpdateItem(BaseTestCase):
         )
 
         # Update the item
-        item = await item_repo.update_item(item=self.item, name=new_name)
+        item = await item_repo.update_item(item_id=self.item.id, user=self.user, name=new_name)
 
         self.assertEqual(item.id, item_before_update.id)  # Item ID remains the same
         self.assertEqual(item.name, new_name)  # Check that the name is updated
@@ -64,7 +68,7 @@ class TestUpdateItem(BaseTestCase):
         )
 
         # Update the item
-        item = await item_repo.update_item(item=self.item, price=new_price)
+        item = await item_repo.update_item(item_id=self.item.id, user=self.user, price=new_price)
 
         self.assertEqual(item.id, item_before_update.id)  # Item ID remains the same
         self.assertEqual(item.price, new_price)  # Check that the price is updated
@@ -82,7 +86,9 @@ class TestUpdateItem(BaseTestCase):
         )
 
         # Update the item
-        item = await item_repo.update_item(item=self.item, description=new_description)
+        item = await item_repo.update_item(
+            item_id=self.item.id, user=self.user, description=new_description
+        )
 
         self.assertEqual(item.id, item_before_update.id)  # Item ID remains the same
         self.assertEqual(item.description, new_description)  # Check that the description is updated
@@ -101,8 +107,42 @@ class TestUpdateItem(BaseTestCase):
         )
 
         # Update the item
-        item = await item_repo.update_item(item=self.item, store=temp_store)
+        item = await item_repo.update_item(
+            item_id=self.item.id, user=self.user, store_id=temp_store.id
+        )
 
         self.assertEqual(item.id, item_before_update.id)
         self.assertEqual(item.store, temp_store)
         self.assertNotEqual(item.updated_at.isoformat(), item_before_update.updated_at.isoformat())
+
+    async def test_update_item_keeps_concurrent_changes(self) -> None:
+        """Test that only the provided columns are written, keeping other writers' changes."""
+        await Item.objects.filter(id=self.item.id).aupdate(description="Changed Elsewhere")
+
+        # The in-memory item still holds the old description
+        item = await item_repo.update_item(item_id=self.item.id, user=self.user, name="New Name")
+
+        self.assertEqual(item.name, "New Name")
+        self.assertEqual(item.description, "Changed Elsewhere")
+
+    async def test_update_item_of_other_user(self) -> None:
+        """Test that an item can only be updated by its owner."""
+        other_user = await User.objects.acreate(username="otheruser")
+
+        with self.assertRaises(Item.DoesNotExist):
+            await item_repo.update_item(item_id=self.item.id, user=other_user, name="New Name")
+
+    async def test_update_item_with_missing_store(self) -> None:
+        """Test that moving an item to a missing store is rejected."""
+        with self.assertRaises(Store.DoesNotExist):
+            await item_repo.update_item(item_id=self.item.id, user=self.user, store_id=999)
+
+        item = await Item.objects.aget(id=self.item.id)
+        self.assertEqual(item.store_id, self.store.id)
+
+    async def test_update_item_duplicate_name(self) -> None:
+        """Test that the unique constraint rejects a duplicate name at the store."""
+        with self.assertRaises(IntegrityError):
+            await item_repo.update_item(
+                item_id=self.item.id, user=self.user, name=self.alt_item.name
+            )
@@ -0,0 +1,73 @@
+"""Contains tests for the single statement item update used on PostgreSQL."""
+
+from decimal import Decimal
+from unittest import skipUnless
+
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+
+from items.database import item_repo
+from items.models import ShoppingItem as Item
+from items.models import ShoppingItemAggregate as ItemAggregate
+from items.schemas.output import ItemSchema
+from items.tests.base.base_test_case import BaseTestCase
+from stores.models import ShoppingStore as Store
+
+
+@skipUnless(connection.vendor == "postgresql", "UPDATE ... FROM ... RETURNING is PostgreSQL only")
+class TestUpdateReturning(BaseTestCase):
+    """Test the item update that reads the row back in the same statement."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        super().setUp()
+        self.other_store = Store.objects.create(
+            name="Other Test Store", store_type=1, description="Other", user=self.user
+        )
+
+    def _update(
+        self, name: str | None = None, price: float | None = None, store_id: int | None = None
+    ) -> tuple[Item, Decimal] | None:
+        """Run the update with the given values, as update_item would."""
+        assignments = item_repo._update_assignments(name, price, None, store_id)
+        with transaction.atomic():
+            return item_repo._update_returning(self.item.id, self.user.id, assignments, store_id)
+
+    def test_returns_schema_fields(self) -> None:
+        """Test that every field of the item schema matches the row read with the ORM."""
+        updated = self._update(name="Renamed", price=150, store_id=self.other_store.id)
+        assert updated is not None
+        item, old_price = updated
+
+        expected = item_repo._select_for_schema(Item.objects.filter(id=self.item.id))
+        self.assertEqual(
+            ItemSchema.from_orm(item).dict(), ItemSchema.from_orm(expected.get()).dict()
+        )
+        self.assertEqual(item.store.name, "Other Test Store")
+        self.assertEqual(item.store.store_type, 1)
+        self.assertEqual(item.user.username, self.user.username)
+        self.assertEqual(old_price, Decimal("100"))
+
+    def test_missing_store(self) -> None:
+        """Test that nothing is updated when the new store does not exist."""
+        self.assertIsNone(self._update(name="Renamed", store_id=99999))
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.name, "Test Item")
+
+    def test_other_user(self) -> None:
+        """Test that an item of another user is not updated."""
+        other_user = User.objects.create(username="otheruser", email="other@gmail.com")
+        assignments = item_repo._update_assignments("Renamed", None, None, None)
+        with transaction.atomic():
+            updated = item_repo._update_returning(self.item.id, other_user.id, assignments, None)
+        self.assertIsNone(updated)
+
+    async def test_price_change_adjusts_aggregate(self) -> None:
+        """Test that the previous price returned by the update is used for the aggregate."""
+        await item_repo.update_item(item_id=self.item.id, user=self.user, price=50)
+
+        aggregate = await ItemAggregate.objects.aget(user=self.user)
+        self.assertEqual(aggregate.total_items, 2)
+        self.assertEqual(aggregate.total_price, Decimal("250"))
+        self.assertEqual(aggregate.max_price, Decimal("200"))
+        self.assertEqual(aggregate.min_price, Decimal("50"))
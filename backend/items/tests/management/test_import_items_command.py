@@ -0,0 +1,143 @@
+"""Contains tests for the import items management command."""
+
+import json
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from items.models import ShoppingItem as Item
+from items.models import ShoppingItemAggregate as ItemAggregate
+from items.tests.base.base_test_case import BaseTestCase
+from stores.models import ShoppingStore as Store
+
+
+class TestImportItemsCommand(BaseTestCase):
+    """Test the import items management command."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        super().setUp()
+        self.directory = TemporaryDirectory()
+        self.path = Path(self.directory.name)
+
+    def tearDown(self) -> None:
+        """Tear down the tests."""
+        self.directory.cleanup()
+        return super().tearDown()
+
+    def _call(self, file_name: str, content: str, *args: str) -> str:
+        """Write the file, import it and return the command output."""
+        file = self.path / file_name
+        file.write_text(content, encoding="utf-8")
+        out = StringIO()
+        call_command("import_items", str(file), "--user", self.user.username, *args, stdout=out)
+        return out.getvalue()
+
+    def test_import_csv(self) -> None:
+        """Test importing items and creating their stores from a CSV file."""
+        content = (
+            "store,store_type,name,description,price\n"
+            "Imported Store,1,Imported Item,An item,12.50\n"
+            "Imported Store,1,Second Item,,3\n"
+            "Base Test Store,,Base Item,,7\n"
+        )
+        output = self._call("items.csv", content)
+
+        self.assertIn("Imported 3 items and created 1 stores from 3 rows", output)
+        store = Store.objects.get(name="Imported Store")
+        self.assertEqual(store.store_type, 1)
+        self.assertEqual(store.user, self.user)
+        self.assertEqual(Item.objects.filter(store=store).count(), 2)
+        self.assertTrue(Item.objects.filter(store=self.store, name="Base Item").exists())
+
+    def test_import_ndjson_skips_duplicates(self) -> None:
+        """Test that existing items and repeated rows are skipped."""
+        rows = [
+            {"store": "Base Test Store", "name": "Test Item", "price": 1},
+            {"store": "Base Test Store", "name": "New Item", "price": 2},
+            {"store": "Base Test Store", "name": "New Item", "price": 3},
+        ]
+        content = "\n".join(json.dumps(row) for row in rows)
+        output = self._call("items.ndjson", content)
+
+        self.assertIn("Imported 1 items and created 0 stores from 3 rows", output)
+        self.assertEqual(Item.objects.filter(name="New Item").count(), 1)
+        self.assertEqual(Item.objects.filter(name="Test Item").count(), 1)
+
+    def test_import_reports_progress(self) -> None:
+        """Test that progress is reported every batch."""
+        content = "store,name,price\n" + "".join(
+            f"Progress Store,Item {index},1\n" for index in range(5)
+        )
+        output = self._call("items.csv", content, "--batch-size", "2")
+        self.assertIn("Read 2 rows", output)
+        self.assertIn("Read 4 rows", output)
+        self.assertIn("Read 5 rows", output)
+
+    def test_import_rebuilds_aggregate(self) -> None:
+        """Test that the user's aggregate includes the imported items."""
+        self._call("items.csv", "store,name,price\nBase Test Store,Imported,50\n")
+
+        aggregate = ItemAggregate.objects.get(user=self.user)
+        self.assertEqual(aggregate.total_items, 3)
+        self.assertEqual(aggregate.total_price, 350)
+        self.assertEqual(aggregate.min_price, 50)
+
+    def test_import_invalid_row(self) -> None:
+        """Test that an invalid row aborts the import."""
+        content = "store,name,price\nBase Test Store,Valid,1\nBase Test Store,Invalid,abc\n"
+        with self.assertRaisesMessage(CommandError, "Line 3: invalid price or store type."):
+            self._call("items.csv", content)
+        self.assertFalse(Item.objects.filter(name="Valid").exists())
+
+    def test_import_invalid_store_type(self) -> None:
+        """Test that a store type that is not a choice aborts the import."""
+        content = "store,name,price,store_type\nNew Store,Valid,1,1\nOther Store,Invalid,1,9\n"
+        with self.assertRaisesMessage(CommandError, "Line 3: store type 9 is not one of"):
+            self._call("items.csv", content)
+        self.assertFalse(Store.objects.filter(name="New Store").exists())
+
+    def test_import_invalid_price(self) -> None:
+        """Test that prices that are not finite, negative or too large abort the import."""
+        for price in ["NaN", "Infinity", "-1", "100000000"]:
+            content = f"store,name,price\nBase Test Store,Invalid,{price}\n"
+            with self.assertRaisesMessage(CommandError, "Line 2: price"):
+                self._call("items.csv", content)
+        self.assertFalse(Item.objects.filter(name="Invalid").exists())
+
+    def test_import_too_long_values(self) -> None:
+        """Test that a store or name longer than their columns aborts the import."""
+        long_value = "x" * 101
+        with self.assertRaisesMessage(CommandError, "Line 2: the store may not be longer than 100"):
+            self._call("items.csv", f"store,name,price\n{long_value},Invalid,1\n")
+        with self.assertRaisesMessage(CommandError, "Line 2: the name may not be longer than 100"):
+            self._call("items.csv", f"store,name,price\nBase Test Store,{long_value},1\n")
+        self.assertFalse(Store.objects.filter(name=long_value).exists())
+
+    def test_import_missing_cells(self) -> None:
+        """Test that missing CSV cells and JSON nulls are reported instead of imported."""
+        with self.assertRaisesMessage(CommandError, "Line 2: missing field 'name'."):
+            self._call("items.csv", "store,price,name\nBase Test Store,1\n")
+        with self.assertRaisesMessage(CommandError, "Line 1: missing field 'store'."):
+            self._call("items.ndjson", json.dumps({"store": None, "name": "Invalid", "price": 1}))
+        self.assertFalse(Item.objects.filter(name="None").exists())
+
+    def test_import_invalid_batch_size(self) -> None:
+        """Test that a batch size below 1 is refused before any row is read."""
+        for batch_size in ["0", "-1"]:
+            with self.assertRaisesMessage(CommandError, "The batch size must be at least 1."):
+                self._call(
+                    "items.csv",
+                    "store,name,price\nBase Test Store,New,1\n",
+                    "--batch-size",
+                    batch_size,
+                )
+        self.assertFalse(Item.objects.filter(name="New").exists())
+
+    def test_import_unknown_format(self) -> None:
+        """Test that an unknown file extension requires the format option."""
+        with self.assertRaisesMessage(CommandError, "use --format"):
+            self._call("items.txt", "")
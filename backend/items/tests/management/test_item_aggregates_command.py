@@ -0,0 +1,39 @@
+"""Contains tests for the item aggregates management command."""
+
+from io import StringIO
+
+from django.core.management import call_command
+
+from items.models import ShoppingItem as Item
+from items.models import ShoppingItemAggregate as ItemAggregate
+from items.tests.base.base_test_case import BaseTestCase
+
+
+class TestItemAggregatesCommand(BaseTestCase):
+    """Test the item aggregates management command."""
+
+    def _call(self, *args: str) -> str:
+        """Call the command and return its output."""
+        out = StringIO()
+        call_command("item_aggregates", *args, stdout=out)
+        return out.getvalue()
+
+    def test_reports_missing_rows(self) -> None:
+        """Test that missing rows are reported without being rebuilt."""
+        output = self._call()
+        self.assertIn(f"user '{self.user.id}'", output)
+        self.assertFalse(ItemAggregate.objects.filter(user=self.user).exists())
+
+    def test_rebuild(self) -> None:
+        """Test that mismatched rows are rebuilt."""
+        self._call("--rebuild")
+        aggregate = ItemAggregate.objects.get(user=self.user)
+        self.assertEqual(aggregate.total_items, 2)
+        self.assertIn("up to date", self._call())
+
+    def test_rebuild_all(self) -> None:
+        """Test that every row is rebuilt."""
+        Item.objects.create(name="Extra", price=5, store=self.store, user=self.user)
+        output = self._call("--rebuild", "--all")
+        self.assertIn("Rebuilt 1 item aggregate rows.", output)
+        self.assertEqual(ItemAggregate.objects.get(user=self.user).total_items, 3)
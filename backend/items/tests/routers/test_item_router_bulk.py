@@ -0,0 +1,127 @@
+"""Contains tests for the item router bulk create endpoint."""
+
+from unittest.mock import patch
+
+from django.test.client import Client
+
+from items.models import ShoppingItem as Item
+from items.models import ShoppingItemAggregate as ItemAggregate
+from items.tests.base.base_test_case import BaseTestCase
+
+CONTENT_TYPE = "application/json"
+
+
+class TestBulkCreateItemsEndpoint(BaseTestCase):
+    """Test the bulk create items endpoint."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        super().setUp()
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def test_bulk_create(self) -> None:
+        """Test that every row is created and returned in order."""
+        rows = [
+            {"store_id": self.store.id, "name": f"Bulk Item {index}", "price": index + 1}
+            for index in range(3)
+        ]
+        response = self.client.post("/api/v1/items/bulk", {"items": rows}, CONTENT_TYPE)
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+        self.assertEqual(data["created"], 3)
+        self.assertEqual(data["duplicates"], 0)
+        self.assertEqual(data["stores_not_found"], 0)
+        self.assertEqual([result["index"] for result in data["results"]], [0, 1, 2])
+        self.assertEqual(data["results"][2]["status"], "created")
+        self.assertEqual(data["results"][2]["item"]["name"], "Bulk Item 2")
+        self.assertEqual(data["results"][2]["item"]["store"]["id"], self.store.id)
+        self.assertIsNotNone(data["results"][2]["item"]["id"])
+        self.assertEqual(Item.objects.filter(name__startswith="Bulk Item").count(), 3)
+
+    def test_bulk_create_reports_failures(self) -> None:
+        """Test that duplicates and missing stores are reported per row."""
+        rows = [
+            {"store_id": self.store.id, "name": "Test Item", "price": 1},
+            {"store_id": 99999, "name": "Orphan Item", "price": 1},
+            {"store_id": self.store.id, "name": "Fresh Item", "price": 1},
+            {"store_id": self.store.id, "name": "Fresh Item", "price": 2},
+        ]
+        response = self.client.post("/api/v1/items/bulk", {"items": rows}, CONTENT_TYPE)
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+        self.assertEqual(data["created"], 1)
+        self.assertEqual(data["duplicates"], 2)
+        self.assertEqual(data["stores_not_found"], 1)
+        statuses = [result["status"] for result in data["results"]]
+        self.assertEqual(statuses, ["duplicate", "store_not_found", "created", "duplicate"])
+        self.assertIsNone(data["results"][0]["item"])
+        self.assertEqual(Item.objects.filter(name="Fresh Item").count(), 1)
+
+    def test_bulk_create_updates_aggregate(self) -> None:
+        """Test that the created items are added to the user's aggregate."""
+        rows = [
+            {"store_id": self.store.id, "name": "Cheap Item", "price": 5},
+            {"store_id": self.store.id, "name": "Dear Item", "price": 500},
+        ]
+        self.client.post("/api/v1/items/bulk", {"items": rows}, CONTENT_TYPE)
+
+        aggregate = ItemAggregate.objects.get(user=self.user)
+        self.assertEqual(aggregate.total_items, 4)
+        self.assertEqual(aggregate.total_price, 805)
+        self.assertEqual(aggregate.max_price, 500)
+        self.assertEqual(aggregate.min_price, 5)
+
+    def test_bulk_create_query_count(self) -> None:
+        """Test that the number of queries does not grow with the number of rows."""
+        rows = [
+            {"store_id": self.store.id, "name": f"Counted Item {index}", "price": 1}
+            for index in range(100)
+        ]
+        with self.assertNumQueries(14):
+            response = self.client.post("/api/v1/items/bulk", {"items": rows}, CONTENT_TYPE)
+        self.assertEqual(response.json()["created"], 100)
+
+    def test_bulk_create_empty(self) -> None:
+        """Test that an empty request is rejected."""
+        response = self.client.post("/api/v1/items/bulk", {"items": []}, CONTENT_TYPE)
+        self.assertEqual(response.status_code, 422)
+
+    def test_bulk_create_duplicate_after_check(self) -> None:
+        """Test that an item created after the existence check is reported as a duplicate."""
+        rows = [
+            {"store_id": self.store.id, "name": "Test Item", "price": 1},
+            {"store_id": self.store.id, "name": "Racing Item", "price": 2},
+        ]
+        with patch("items.services.item_service.item_repo.find_existing", return_value=set()):
+            response = self.client.post("/api/v1/items/bulk", {"items": rows}, CONTENT_TYPE)
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+        self.assertEqual(data["created"], 1)
+        self.assertEqual(data["duplicates"], 1)
+        self.assertEqual([result["status"] for result in data["results"]], ["duplicate", "created"])
+        self.assertEqual(data["results"][1]["item"]["name"], "Racing Item")
+        self.assertEqual(Item.objects.filter(name="Test Item").count(), 1)
+
+        aggregate = ItemAggregate.objects.get(user=self.user)
+        self.assertEqual(aggregate.total_items, 3)
+
+    def test_bulk_create_store_deleted_after_check(self) -> None:
+        """Test that a store deleted after it was loaded is reported per row."""
+        store_id = self.store.id
+        stores = {store_id: self.store}
+        Item.objects.filter(store_id=store_id).delete()
+        self.store.delete()
+        rows = [{"store_id": store_id, "name": "Orphan Item", "price": 1}]
+
+        with patch("items.services.item_service.store_repo.get_stores_by_ids", return_value=stores):
+            response = self.client.post("/api/v1/items/bulk", {"items": rows}, CONTENT_TYPE)
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+        self.assertEqual(data["created"], 0)
+        self.assertEqual(data["stores_not_found"], 1)
+        self.assertFalse(Item.objects.filter(name="Orphan Item").exists())
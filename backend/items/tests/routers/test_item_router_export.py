@@ -0,0 +1,66 @@
+"""Contains tests for the item router export endpoint."""
+
+import csv
+import json
+from io import StringIO
+
+from django.http import StreamingHttpResponse
+from django.test.client import AsyncClient
+
+from items.database import item_repo
+from items.tests.base.base_test_case import BaseTestCase
+
+CONTENT_TYPE = "application/json"
+
+
+class TestExportItemsEndpoint(BaseTestCase):
+    """Test the export items endpoint."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        super().setUp()
+        self.async_client = AsyncClient()
+
+    async def _export(self, query: str, body: dict[str, object] | None = None) -> tuple[str, str]:
+        """Call the export endpoint and return the content type and body."""
+        response = await self.async_client.post(
+            f"/api/v1/items/export{query}", body or {}, CONTENT_TYPE
+        )
+        self.assertEqual(response.status_code, 200)
+        assert isinstance(response, StreamingHttpResponse)
+        chunks = [chunk async for chunk in response]
+        return response["Content-Type"], b"".join(chunks).decode()
+
+    async def test_export_ndjson(self) -> None:
+        """Test exporting the items as newline delimited JSON."""
+        content_type, body = await self._export("")
+        self.assertEqual(content_type, "application/x-ndjson")
+
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([row["name"] for row in rows], ["Alternate Item", "Test Item"])
+        self.assertEqual(list(rows[0]), list(item_repo.EXPORT_FIELDS))
+        self.assertEqual(rows[1]["store_id"], self.store.id)
+        self.assertEqual(rows[1]["price"], "100.00")
+
+    async def test_export_csv(self) -> None:
+        """Test exporting the items as CSV."""
+        content_type, body = await self._export("?format=csv")
+        self.assertEqual(content_type, "text/csv")
+
+        rows = list(csv.DictReader(StringIO(body)))
+        self.assertEqual([row["name"] for row in rows], ["Alternate Item", "Test Item"])
+        self.assertEqual(rows[0]["description"], "Alternate Description")
+
+    async def test_export_with_filters(self) -> None:
+        """Test that the export applies the search filters."""
+        _, body = await self._export("?name=alternate", {"price_is_gt": 150})
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["id"], self.alt_item.id)
+
+    async def test_export_with_invalid_store(self) -> None:
+        """Test that exporting items for a store that does not exist fails."""
+        response = await self.async_client.post(
+            "/api/v1/items/export?store=99999", {}, CONTENT_TYPE
+        )
+        self.assertEqual(response.status_code, 404)
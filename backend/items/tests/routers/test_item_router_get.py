@@ -181,3 +181,61 @@ class TestGetItemsEndpoint(TestCase):
 
         items = data.get("items")
         self.assertEqual(len(items), 0)
+
+    def test_get_items_with_cursor(self) -> None:
+        """Test getting all items using cursor pagination."""
+        response = self.client.get("/api/v1/items?per_page=1&cursor=")
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+        self.assertEqual(data.get("total"), None)
+        self.assertEqual(data.get("total_pages"), None)
+        self.assertEqual(data.get("has_next"), True)
+        self.assertEqual(data.get("items")[0].get("name"), "Alternate Item")
+
+        next_cursor = data.get("next_cursor")
+        response = self.client.get(f"/api/v1/items?per_page=1&cursor={next_cursor}")
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+        self.assertEqual(data.get("has_previous"), True)
+        self.assertEqual(data.get("has_next"), False)
+        self.assertEqual(data.get("next_cursor"), None)
+        self.assertEqual(data.get("items")[0].get("name"), "Test Item")
+
+    def test_get_items_with_invalid_cursor(self) -> None:
+        """Test getting all items using an invalid cursor."""
+        response = self.client.get("/api/v1/items?cursor=invalid")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"detail": "Cursor 'invalid' is invalid."})
+
+    def test_get_items_with_invalid_page_size(self) -> None:
+        """Test getting items with a page size below 1 is rejected."""
+        for per_page in [0, -1]:
+            response = self.client.get(f"/api/v1/items?per_page={per_page}&cursor=")
+            self.assertEqual(response.status_code, 422)
+
+            response = self.client.get(f"/api/v1/items?per_page={per_page}")
+            self.assertEqual(response.status_code, 422)
+
+    def test_get_items_without_total(self) -> None:
+        """Test getting all items without counting the total."""
+        response = self.client.get("/api/v1/items?per_page=1&include_total=false")
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+        self.assertEqual(data.get("total"), None)
+        self.assertEqual(data.get("total_pages"), None)
+        self.assertEqual(data.get("page_number"), 1)
+        self.assertEqual(data.get("has_previous"), False)
+        self.assertEqual(data.get("has_next"), True)
+        self.assertEqual(data.get("next_page"), 2)
+        self.assertEqual(data.get("items")[0].get("name"), "Alternate Item")
+
+        response = self.client.get("/api/v1/items?per_page=1&page=2&include_total=false")
+        data = response.json()
+        self.assertEqual(data.get("has_previous"), True)
+        self.assertEqual(data.get("previous_page"), 1)
+        self.assertEqual(data.get("has_next"), False)
+        self.assertEqual(data.get("next_page"), None)
+        self.assertEqual(data.get("items")[0].get("name"), "Test Item")
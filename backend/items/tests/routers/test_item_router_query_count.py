@@ -0,0 +1,146 @@
+"""Contains query count benchmarks for the paginated item endpoints."""
+
+from django.contrib.auth.models import User
+from django.test.client import Client
+from django.test.testcases import TestCase
+
+from items.models import ShoppingItem as Item
+from stores.models import ShoppingStore as Store
+
+PAGE_SIZES = [1, 10, 50]
+
+
+class TestItemEndpointQueryCount(TestCase):
+    """Test that the paginated item endpoints run a constant number of queries."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.client = Client()
+        self.users = [
+            User.objects.create(username=f"queryuser{index}", email=f"query{index}@gmail.com")
+            for index in range(2)
+        ]
+        self.stores = [
+            Store.objects.create(
+                name=f"Query Store {index}",
+                store_type=3,
+                description="",
+                user=self.users[index % 2],
+            )
+            for index in range(5)
+        ]
+        Item.objects.bulk_create(
+            Item(
+                name=f"Query Item {index}",
+                description="",
+                price=index,
+                store=self.stores[index % 5],
+                user=self.users[index % 2],
+            )
+            for index in range(60)
+        )
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        """Tear down the tests."""
+        User.objects.all().delete()
+        Store.objects.all().delete()
+        Item.objects.all().delete()
+        return super().tearDown()
+
+    def test_get_items_query_count(self) -> None:
+        """Test the get items endpoint query count does not grow with page size."""
+        for page_size in PAGE_SIZES:
+            with self.assertNumQueries(2):
+                response = self.client.get(f"/api/v1/items?per_page={page_size}")
+            self.assertEqual(len(response.json().get("items")), page_size)
+
+    def test_get_items_with_cursor_query_count(self) -> None:
+        """Test the get items endpoint query count with cursor pagination."""
+        for page_size in PAGE_SIZES:
+            with self.assertNumQueries(1):
+                response = self.client.get(f"/api/v1/items?per_page={page_size}&cursor=")
+            self.assertEqual(len(response.json().get("items")), page_size)
+
+    def test_get_my_items_query_count(self) -> None:
+        """Test the get personal items endpoint query count does not grow with page size."""
+        self.client.force_login(self.users[0])
+        for page_size, queries in zip(PAGE_SIZES[:2], [4, 3]):
+            # The user of the session is cached after the first request
+            with self.assertNumQueries(queries):
+                response = self.client.get(f"/api/v1/items/me?per_page={page_size}")
+            self.assertEqual(len(response.json().get("items")), page_size)
+
+    def test_search_items_query_count(self) -> None:
+        """Test the search items endpoint query count does not grow with page size."""
+        for page_size in PAGE_SIZES:
+            with self.assertNumQueries(2):
+                response = self.client.post(
+                    f"/api/v1/items/search?limit={page_size}",
+                    data={},
+                    content_type="application/json",
+                )
+            self.assertEqual(len(response.json().get("items")), page_size)
+
+    def test_search_items_by_stores_query_count(self) -> None:
+        """Test the store filter of a search is validated with a single query."""
+        for store_count in [1, 5]:
+            store_ids = [store.id for store in self.stores[:store_count]]
+            with self.assertNumQueries(3):
+                response = self.client.post(
+                    "/api/v1/items/search?limit=50",
+                    data={"stores": store_ids},
+                    content_type="application/json",
+                )
+            self.assertEqual(response.json().get("total"), store_count * 12)
+
+    def test_search_items_by_missing_stores(self) -> None:
+        """Test the missing stores of a search are reported by id."""
+        store_ids = [self.stores[0].id, 99998, 99999]
+        with self.assertNumQueries(1):
+            response = self.client.post(
+                "/api/v1/items/search",
+                data={"stores": store_ids},
+                content_type="application/json",
+            )
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(
+            response.json().get("detail"), "Stores with ids '99998', '99999' do not exist."
+        )
+
+    def test_store_detail_page_query_count(self) -> None:
+        """Test the store detail page query count does not grow with page size."""
+        self.client.force_login(self.users[0])
+        store_id = self.stores[0].id
+        with self.assertNumQueries(5):
+            response = self.client.get(f"/stores/detail/{store_id}")
+        self.assertEqual(response.status_code, 200)
+
+        # The store and the user of the session are cached after the first request
+        for page_size in PAGE_SIZES[:2]:
+            with self.assertNumQueries(3):
+                response = self.client.get(f"/stores/detail/{store_id}?limit={page_size}")
+            self.assertEqual(response.status_code, 200)
+
+    def test_get_stores_query_count(self) -> None:
+        """Test the get stores endpoint query count does not grow with page size."""
+        for page_size in [1, 5]:
+            with self.assertNumQueries(2):
+                response = self.client.get(f"/api/v1/stores?limit={page_size}")
+            self.assertEqual(len(response.json().get("stores")), page_size)
+
+    def test_get_items_without_total_query_count(self) -> None:
+        """Test the get items endpoint skips the count when the total is not requested."""
+        for page_size in PAGE_SIZES:
+            with self.assertNumQueries(1):
+                response = self.client.get(
+                    f"/api/v1/items?per_page={page_size}&include_total=false"
+                )
+            self.assertEqual(len(response.json().get("items")), page_size)
+
+    def test_get_stores_without_total_query_count(self) -> None:
+        """Test the get stores endpoint skips the count when the total is not requested."""
+        for page_size in [1, 5]:
+            with self.assertNumQueries(1):
+                response = self.client.get(f"/api/v1/stores?limit={page_size}&include_total=false")
+            self.assertEqual(len(response.json().get("stores")), page_size)
@@ -47,7 +47,7 @@ class TestUpdateRouter(BaseTestCase):
         )
         item = response.json()
         self.assertEqual(item["name"], "Updated Item")
-        self.assertEqual(item["price"], "200.0")
+        self.assertEqual(item["price"], "200.00")
         self.assertEqual(item["description"], "Updated Description")
 
         self.assertEqual(item["store"]["name"], "Temporary Store")
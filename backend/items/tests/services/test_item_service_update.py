@@ -70,12 +70,20 @@ class TestUpdateItemService(BaseTestCase):
 
     async def test_update_item_with_duplicate_name_and_same_store(self) -> None:
         """Test updating an item with a duplicate name and same store."""
-        new_store = await self.create_temporary_store()
-        new_item = await self.create_temporary_item(store=new_store)
-
         with self.assertRaises(ItemAlreadyExists):
             await item_service.update_item(
-                item_id=new_item.id,
+                item_id=self.item.id,
                 user=self.user,
-                name=new_item.name,
+                name=self.alt_item.name,
             )
+
+    async def test_update_item_with_own_name(self) -> None:
+        """Test that keeping the current name of an item is not a duplicate."""
+        item = await item_service.update_item(
+            item_id=self.item.id, user=self.user, name=self.item.name, price=150
+        )
+
+        item_dict = item.model_dump()
+
+        self.assertEqual(item_dict.get("name"), self.item.name)
+        self.assertEqual(item_dict.get("price"), 150)
@@ -109,7 +109,7 @@ class TestItemUpdateView(BaseTestCase):
         response = self.client.post(
             "/items/update/action",
             {
-                "item-id": item.id,
+                "item-id": self.item.id,
                 "item-input": item.name,
                 "store-input": store.id,
                 "price-input": item.price,
@@ -117,7 +117,7 @@ class TestItemUpdateView(BaseTestCase):
             },
         )
         self.assertRedirects(
-            response, f"/items/update/{item.id}?error=Item already exists.", 302, 200
+            response, f"/items/update/{self.item.id}?error=Item already exists.", 302, 200
         )
 
     def test_update_action_view(self) -> None:
@@ -1,6 +1,7 @@
 """Contains the views for the items app."""
 
 import logging
+from functools import partial
 
 from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
 from django.shortcuts import render
@@ -15,6 +16,7 @@ from items.schemas.contexts import (
     ItemUpdateContext,
 )
 from items.services import item_service
+from shoppingapp.utilities.concurrency import gather_reads
 from shoppingapp.utilities.utils import get_overview_params
 from stores.services import store_service
 
@@ -142,8 +144,10 @@ async def _get_overview_context(
         (await request.auser(), "Your Items") if is_personalized else (None, "All Items")
     )
 
-    pagination = await item_service.get_items(page=page, items_per_page=limit, user=user)
-    aggregation = await item_service.aggregate(user=user)
+    pagination, aggregation = await gather_reads(
+        partial(item_service.get_items, page=page, items_per_page=limit, user=user),
+        partial(item_service.aggregate, user=user),
+    )
     context = ItemOverviewContext(
         pagination=pagination,
         aggregation=aggregation,
@@ -0,0 +1,6 @@
+"""Contains shared database helpers for the project."""
+
+import logging
+
+log = logging.getLogger(__name__)
+log.info("Loading shared database helpers...")
@@ -0,0 +1,55 @@
+"""Contains helpers to classify database errors."""
+
+import logging
+
+from django.db import IntegrityError
+
+log = logging.getLogger(__name__)
+log.info("Loading database errors...")
+
+UNIQUE_VIOLATION = "23505"
+FOREIGN_KEY_VIOLATION = "23503"
+
+
+def _sqlstate(error: IntegrityError) -> str | None:
+    """
+    Get the SQLSTATE of the driver error that caused the integrity error.
+
+    Args:
+        error (IntegrityError): The integrity error raised by Django.
+
+    Returns:
+        str | None: The SQLSTATE, or None when the driver does not provide one (SQLite).
+    """
+    return getattr(error.__cause__, "sqlstate", None)
+
+
+def is_unique_violation(error: IntegrityError) -> bool:
+    """
+    Check if an integrity error was caused by a unique constraint.
+
+    Args:
+        error (IntegrityError): The integrity error raised by Django.
+
+    Returns:
+        bool: True if a unique constraint was violated, false otherwise.
+    """
+    return _sqlstate(error) == UNIQUE_VIOLATION or "UNIQUE constraint failed" in str(error)
+
+
+def is_foreign_key_violation(error: IntegrityError) -> bool:
+    """
+    Check if an integrity error was caused by a foreign key constraint.
+
+    Args:
+        error (IntegrityError): The integrity error raised by Django.
+
+    Returns:
+        bool: True if a foreign key constraint was violated, false otherwise.
+    """
+    return _sqlstate(error) == FOREIGN_KEY_VIOLATION or "FOREIGN KEY constraint failed" in str(
+        error
+    )
+
+
+log.info("Loaded database errors.")
@@ -0,0 +1,64 @@
+"""Contains shared filters that compile to index friendly predicates."""
+
+import logging
+from datetime import date, datetime, time, timedelta
+
+from django.db.models import Q
+from django.utils import timezone
+
+log = logging.getLogger(__name__)
+log.info("Loading filters...")
+
+
+def day_start(day: date) -> datetime:
+    """
+    Get the first instant of a day in the active timezone.
+
+    Args:
+        day (date): The day.
+
+    Returns:
+        datetime: Midnight at the start of the day, timezone aware.
+    """
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def date_range(
+    field: str,
+    on: date | None = None,
+    before: date | None = None,
+    after: date | None = None,
+    inclusive: bool = False,
+) -> Q:
+    """
+    Filter a timestamp field by calendar dates in the active timezone.
+
+    Unlike the __date lookups, which cast every row before comparing, the dates are converted to
+    half-open timestamp ranges, so an index on the field can be range scanned.
+
+    Args:
+        field (str): The name of the timestamp field.
+        on (date | None): Only match timestamps on this date.
+        before (date | None): Only match timestamps before this date.
+        after (date | None): Only match timestamps after this date.
+        inclusive (bool): Whether the before and after dates themselves match.
+
+    Returns:
+        Q: The filter, empty when no dates are provided.
+    """
+    query = Q()
+    next_day = timedelta(days=1)
+
+    if on:
+        query &= Q(**{f"{field}__gte": day_start(on), f"{field}__lt": day_start(on + next_day)})
+    if before:
+        end = before + next_day if inclusive else before
+        query &= Q(**{f"{field}__lt": day_start(end)})
+    if after:
+        start = after if inclusive else after + next_day
+        query &= Q(**{f"{field}__gte": day_start(start)})
+
+    return query
+
+
+log.info("Loaded filters.")
@@ -0,0 +1,44 @@
+"""Contains custom lookups shared by the repositories."""
+
+import logging
+from typing import Any
+
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import CharField, TextField
+from django.db.models.lookups import IContains
+from django.db.models.sql.compiler import SQLCompiler
+
+log = logging.getLogger(__name__)
+log.info("Loading lookups...")
+
+
+class TrigramIContains(IContains):
+    """
+    Case-insensitive containment lookup that can be served by a pg_trgm GIN index.
+
+    Django compiles icontains to UPPER(column::text) LIKE UPPER(%s) on PostgreSQL, which no
+    index on the column can serve. This lookup compiles to column ILIKE %s instead, which the
+    gin_trgm_ops indexes created in the migrations are able to answer. Other databases fall back
+    to the regular icontains lookup.
+    """
+
+    lookup_name = "trigram_icontains"
+
+    def as_sql(self, compiler: SQLCompiler, connection: BaseDatabaseWrapper) -> Any:
+        """Compile the lookup as a regular icontains lookup."""
+        return IContains(self.lhs, self.rhs).as_sql(compiler, connection)
+
+    def as_postgresql(self, compiler: SQLCompiler, connection: BaseDatabaseWrapper) -> Any:
+        """Compile the lookup as an ILIKE that can use the trigram indexes."""
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs_sql} ILIKE {rhs_sql}", [*lhs_params, *rhs_params]
+
+
+def register_lookups() -> None:
+    """Register the custom lookups on the text fields."""
+    CharField.register_lookup(TrigramIContains)
+    TextField.register_lookup(TrigramIContains)
+
+
+log.info("Loaded lookups.")
@@ -0,0 +1,188 @@
+"""Contains custom migration operations."""
+
+import logging
+from typing import Any
+
+from django.contrib.postgres import operations as postgres_operations
+from django.db import NotSupportedError
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.operations import AddConstraint, AddIndex, RemoveIndex, RunSQL
+from django.db.migrations.state import ProjectState
+from django.db.models import BaseConstraint, UniqueConstraint
+
+log = logging.getLogger(__name__)
+log.info("Loading migration operations...")
+
+
+def _ensure_not_in_transaction(schema_editor: BaseDatabaseSchemaEditor, operation: Any) -> None:
+    """
+    Refuse to run a concurrent operation inside a transaction, which PostgreSQL does not allow.
+
+    Args:
+        schema_editor (BaseDatabaseSchemaEditor): The schema editor running the operation.
+        operation (Any): The operation.
+
+    Raises:
+        NotSupportedError: If the migration runs in a transaction.
+    """
+    if schema_editor.connection.in_atomic_block:
+        raise NotSupportedError(
+            f"The {type(operation).__name__} operation cannot be executed inside a transaction "
+            "(set atomic = False on the migration)."
+        )
+
+
+class AddIndexConcurrently(postgres_operations.AddIndexConcurrently):
+    """
+    Create an index without locking writes on PostgreSQL.
+
+    Uses CREATE INDEX CONCURRENTLY on PostgreSQL and a regular CREATE INDEX on other databases
+    (such as SQLite in the test settings), where concurrent index creation is not available.
+    """
+
+    def database_forwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ) -> Any:
+        """Create the index."""
+        if schema_editor.connection.vendor == "postgresql":
+            return super().database_forwards(app_label, schema_editor, from_state, to_state)
+        return AddIndex.database_forwards(self, app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ) -> Any:
+        """Drop the index."""
+        if schema_editor.connection.vendor == "postgresql":
+            return super().database_backwards(app_label, schema_editor, from_state, to_state)
+        return AddIndex.database_backwards(self, app_label, schema_editor, from_state, to_state)
+
+
+class RemoveIndexConcurrently(postgres_operations.RemoveIndexConcurrently):
+    """
+    Drop an index without locking writes on PostgreSQL.
+
+    Uses DROP INDEX CONCURRENTLY on PostgreSQL and a regular DROP INDEX on other databases.
+    """
+
+    def database_forwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ) -> Any:
+        """Drop the index."""
+        if schema_editor.connection.vendor == "postgresql":
+            return super().database_forwards(app_label, schema_editor, from_state, to_state)
+        return RemoveIndex.database_forwards(self, app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ) -> Any:
+        """Create the index again."""
+        if schema_editor.connection.vendor == "postgresql":
+            return super().database_backwards(app_label, schema_editor, from_state, to_state)
+        return RemoveIndex.database_backwards(self, app_label, schema_editor, from_state, to_state)
+
+
+class AddUniqueConstraintConcurrently(AddConstraint):
+    """
+    Add a unique constraint without locking writes on PostgreSQL while its index is built.
+
+    On PostgreSQL the unique index is created with CREATE UNIQUE INDEX CONCURRENTLY and then
+    attached with ADD CONSTRAINT ... UNIQUE USING INDEX, which only holds its lock briefly. On
+    other databases the constraint is added as usual. Only unconditional constraints on plain
+    fields are supported.
+    """
+
+    model_name: str
+    constraint: BaseConstraint
+
+    def database_forwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ) -> None:
+        """Build the index and attach the constraint."""
+        if schema_editor.connection.vendor != "postgresql":
+            return super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+        _ensure_not_in_transaction(schema_editor, self)
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return None
+
+        constraint = self.constraint
+        if not isinstance(constraint, UniqueConstraint) or constraint.condition is not None:
+            raise ValueError(f"Constraint '{constraint.name}' is not a plain unique constraint.")
+        table = schema_editor.quote_name(model._meta.db_table)
+        name = schema_editor.quote_name(constraint.name)
+        columns = ", ".join(
+            schema_editor.quote_name(model._meta.get_field(field).column)
+            for field in constraint.fields
+        )
+        schema_editor.execute(f"CREATE UNIQUE INDEX CONCURRENTLY {name} ON {table} ({columns})")
+        schema_editor.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {name} UNIQUE USING INDEX {name}"
+        )
+        return None
+
+    def database_backwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ) -> None:
+        """Drop the constraint, along with its index."""
+        if schema_editor.connection.vendor == "postgresql":
+            _ensure_not_in_transaction(schema_editor, self)
+        super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+class PostgresRunSQL(RunSQL):
+    """
+    Run raw SQL on PostgreSQL only.
+
+    Used for PostgreSQL specific objects, such as trigram indexes, that have no equivalent on
+    other databases. On other databases the operation does nothing.
+    """
+
+    def database_forwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ) -> None:
+        """Run the forwards SQL."""
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ) -> None:
+        """Run the backwards SQL."""
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+log.info("Loaded migration operations.")
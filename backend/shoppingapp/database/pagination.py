@@ -0,0 +1,72 @@
+"""Contains the shared page number pagination."""
+
+import logging
+from typing import Any, TypeVar
+
+from django.core.paginator import Paginator
+from django.db.models import Model, QuerySet
+
+log = logging.getLogger(__name__)
+log.info("Loading pagination...")
+
+T = TypeVar("T", bound=Model)
+
+
+def paginate(
+    records: QuerySet[T],
+    page_number: int = 1,
+    per_page: int = 10,
+    include_total: bool = True,
+) -> tuple[list[T], dict[str, Any]]:
+    """
+    Paginate a queryset by page number.
+
+    When include_total is False the total is not counted. The page is fetched with one extra
+    row to work out whether there is a next page, and the total and total pages are None. Out of
+    range page numbers then return an empty page instead of the last page.
+
+    Args:
+        records (QuerySet[T]): The ordered records to paginate.
+        page_number (int): The page number.
+        per_page (int): The number of records per page.
+        include_total (bool): Whether to count the total number of records.
+
+    Returns:
+        tuple[list[T], dict[str, Any]]: The records on the page and the pagination fields.
+    """
+    if include_total:
+        paginator = Paginator(records, per_page)
+        paginated_page = paginator.get_page(page_number)
+        has_previous = paginated_page.has_previous()
+        has_next = paginated_page.has_next()
+        page = paginated_page.number
+
+        return list(paginated_page.object_list), {
+            "total": paginator.count,
+            "page_number": page,
+            "total_pages": paginator.num_pages,
+            "has_previous": has_previous,
+            "previous_page": paginated_page.previous_page_number() if has_previous else None,
+            "has_next": has_next,
+            "next_page": paginated_page.next_page_number() if has_next else None,
+        }
+
+    page = max(page_number, 1)
+    start = (page - 1) * per_page
+    end = start + per_page + 1
+    page_records = list(records[start:end])
+    has_previous = page > 1
+    has_next = len(page_records) > per_page
+
+    return page_records[:per_page], {
+        "total": None,
+        "page_number": page,
+        "total_pages": None,
+        "has_previous": has_previous,
+        "previous_page": page - 1 if has_previous else None,
+        "has_next": has_next,
+        "next_page": page + 1 if has_next else None,
+    }
+
+
+log.info("Loaded pagination.")
@@ -0,0 +1,6 @@
+"""Contains middleware for the shopping app project."""
+
+import logging
+
+log = logging.getLogger(__name__)
+log.info("Loading shopping app middleware...")
@@ -0,0 +1,127 @@
+"""Contains the reference data HTTP caching middleware."""
+
+import logging
+from typing import Awaitable, Callable
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseBase,
+    HttpResponseNotModified,
+)
+from django.utils.http import parse_etags
+
+log = logging.getLogger(__name__)
+log.info("Loading reference data middleware...")
+
+IMMUTABLE = "private, max-age=31536000, immutable"
+REVALIDATE = "private, no-cache"
+
+GetResponse = Callable[[HttpRequest], HttpResponseBase | Awaitable[HttpResponseBase]]
+
+
+class ReferenceDataCacheMiddleware:
+    """
+    Serve reference data endpoints with strong ETags tied to the application version.
+
+    Reference data only changes with a release, so the ETag of every reference data path is the
+    version in version.txt. Conditional requests with a matching ETag are answered with a 304
+    before the session, API key and view are touched. Requests that pass the current version in
+    the v query parameter may cache the response as immutable, others must revalidate it.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: GetResponse) -> None:
+        """
+        Create the middleware.
+
+        Args:
+            get_response (GetResponse): The next middleware or view.
+        """
+        self.get_response = get_response
+        self.paths = frozenset(settings.REFERENCE_DATA_PATHS)
+        self.etag = f'"{settings.APP_VERSION}"'
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponseBase | Awaitable[HttpResponseBase]:
+        """
+        Handle a request.
+
+        Args:
+            request (HttpRequest): The request.
+
+        Returns:
+            HttpResponseBase | Awaitable[HttpResponseBase]: The response.
+        """
+        if self.async_mode:
+            return self.__acall__(request)
+
+        if not self._is_reference_data(request):
+            return self.get_response(request)
+
+        if self._is_not_modified(request):
+            return self._not_modified(request)
+
+        response: HttpResponseBase = self.get_response(request)  # type: ignore
+        return self._add_headers(request, response)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponseBase:
+        """
+        Handle a request in async mode.
+
+        Args:
+            request (HttpRequest): The request.
+
+        Returns:
+            HttpResponseBase: The response.
+        """
+        if not self._is_reference_data(request):
+            return await self.get_response(request)  # type: ignore
+
+        if self._is_not_modified(request):
+            return self._not_modified(request)
+
+        response: HttpResponseBase = await self.get_response(request)  # type: ignore
+        return self._add_headers(request, response)
+
+    def _is_reference_data(self, request: HttpRequest) -> bool:
+        """Check if the request reads a reference data endpoint."""
+        return request.method in ("GET", "HEAD") and request.path in self.paths
+
+    def _is_not_modified(self, request: HttpRequest) -> bool:
+        """Check if the client already has the current version of the response."""
+        if_none_match = request.headers.get("If-None-Match")
+        if not if_none_match:
+            return False
+
+        etags = parse_etags(if_none_match)
+        return "*" in etags or self.etag in etags
+
+    def _cache_control(self, request: HttpRequest) -> str:
+        """Get the Cache-Control header for the request."""
+        if request.GET.get("v") == settings.APP_VERSION:
+            return IMMUTABLE
+        return REVALIDATE
+
+    def _not_modified(self, request: HttpRequest) -> HttpResponse:
+        """Answer a conditional request for a response the client already has."""
+        response = HttpResponseNotModified()
+        response.headers["ETag"] = self.etag
+        response.headers["Cache-Control"] = self._cache_control(request)
+        return response
+
+    def _add_headers(self, request: HttpRequest, response: HttpResponseBase) -> HttpResponseBase:
+        """Add the caching headers to a successful response."""
+        if response.status_code == 200:
+            response.headers["ETag"] = self.etag
+            response.headers["Cache-Control"] = self._cache_control(request)
+        return response
+
+
+log.info("Loaded reference data middleware.")
@@ -0,0 +1,86 @@
+"""Contains middleware that is skipped for stateless API requests."""
+
+import logging
+from typing import Any, Callable
+
+from django.conf import settings
+from django.contrib.auth import middleware as auth_middleware
+from django.contrib.messages import middleware as messages_middleware
+from django.contrib.sessions import middleware as sessions_middleware
+from django.http import HttpRequest
+from django.middleware import csrf
+
+from authentication.auth.keys import parse_key
+
+log = logging.getLogger(__name__)
+log.info("Loading stateless API middleware...")
+
+STATELESS_ATTRIBUTE = "_is_stateless_api"
+
+
+def is_stateless_api_request(request: HttpRequest) -> bool:
+    """
+    Check if a request is an API request that authenticates with a key id prefixed API key.
+
+    The key alone identifies the client and its user, so the request needs no session, CSRF
+    token, session user or messages.
+
+    Args:
+        request (HttpRequest): The request.
+
+    Returns:
+        bool: True if the request is stateless.
+    """
+    stateless: bool | None = getattr(request, STATELESS_ATTRIBUTE, None)
+    if stateless is None:
+        key = request.headers.get("X-API-Key")
+        stateless = bool(
+            request.path.startswith(settings.STATELESS_API_PREFIX)
+            and key
+            and parse_key(key) is not None
+        )
+        setattr(request, STATELESS_ATTRIBUTE, stateless)
+    return stateless
+
+
+class StatelessApiMixin:
+    """Pass stateless API requests straight to the next middleware."""
+
+    get_response: Callable[[HttpRequest], Any]
+
+    def __call__(self, request: HttpRequest) -> Any:
+        """Handle a request, skipping this middleware for stateless API requests."""
+        if is_stateless_api_request(request):
+            return self.get_response(request)
+        return super().__call__(request)  # type: ignore
+
+
+class SessionMiddleware(StatelessApiMixin, sessions_middleware.SessionMiddleware):
+    """Session middleware that does not load or save sessions for stateless API requests."""
+
+
+class CsrfViewMiddleware(StatelessApiMixin, csrf.CsrfViewMiddleware):
+    """CSRF middleware that does not check stateless API requests, they carry no cookies."""
+
+    def process_view(
+        self,
+        request: HttpRequest,
+        callback: Callable[..., Any] | None,
+        callback_args: tuple[Any, ...],
+        callback_kwargs: dict[str, Any],
+    ) -> Any:
+        """Check the CSRF token of requests that are not stateless."""
+        if is_stateless_api_request(request):
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+
+class AuthenticationMiddleware(StatelessApiMixin, auth_middleware.AuthenticationMiddleware):
+    """Authentication middleware that leaves the user of stateless API requests to the key."""
+
+
+class MessageMiddleware(StatelessApiMixin, messages_middleware.MessageMiddleware):
+    """Message middleware that keeps no messages for stateless API requests."""
+
+
+log.info("Loaded stateless API middleware.")
@@ -0,0 +1,34 @@
+"""Contains the metrics router."""
+
+import logging
+
+from django.http import HttpRequest
+from ninja import Router
+
+from authentication.auth.session_auth import StaffSessionAuth
+from shoppingapp.schemas.shared import MetricsSchema
+from shoppingapp.utilities import cache
+
+log = logging.getLogger(__name__)
+log.info("Metrics router loading...")
+
+metrics_router = Router(tags=["Metrics"], auth=StaffSessionAuth())
+
+
+@metrics_router.get("", response={200: MetricsSchema})
+async def get_metrics(request: HttpRequest) -> MetricsSchema:
+    """
+    Get the metrics of the worker process that served the request.
+
+    Every worker keeps its own caches, so the counters only cover that worker.
+
+    Args:
+        request (HttpRequest): The HTTP request.
+
+    Returns:
+        MetricsSchema: The metrics.
+    """
+    return MetricsSchema.model_validate({"caches": cache.get_stats()})
+
+
+log.info("Metrics router loaded.")
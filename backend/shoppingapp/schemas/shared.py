@@ -22,9 +22,9 @@ class UserSchema(ModelSchema):
 class PaginationSchema(Schema):
     """Pagination schema."""
 
-    total: int = 0
+    total: int | None = 0
     page_number: int = 1
-    total_pages: int = 1
+    total_pages: int | None = 1
     has_previous: bool = False
     previous_page: int | None = None
     has_next: bool = False
@@ -48,4 +48,21 @@ class BaseContext(Schema):
     error: str | None = None
 
 
+class CacheStatsSchema(Schema):
+    """Counters of a process local cache."""
+
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+
+class MetricsSchema(Schema):
+    """Metrics of the worker process that served the request."""
+
+    caches: dict[str, CacheStatsSchema]
+
+
 log.info("Loaded shared schemas.")
@@ -47,16 +47,28 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
+    "shoppingapp.middleware.reference_data.ReferenceDataCacheMiddleware",
+    "shoppingapp.middleware.stateless.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
+    "shoppingapp.middleware.stateless.CsrfViewMiddleware",
+    "shoppingapp.middleware.stateless.AuthenticationMiddleware",
+    "shoppingapp.middleware.stateless.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
 ROOT_URLCONF = "shoppingapp.urls"
 
+APP_VERSION = (BASE_DIR.parent.parent / "version.txt").read_text().strip()
+
+# API requests under this prefix that carry a key id prefixed API key skip the session, CSRF,
+# session user and messages middleware.
+STATELESS_API_PREFIX = "/api/v1/"
+
+# Responses of these paths only change with a release, they are cached by clients per version.
+REFERENCE_DATA_PATHS = [
+    "/api/v1/stores/types/mapping",
+]
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -97,6 +109,56 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# The cache is local to each worker process, invalidations only reach the worker that made the
+# change, so cached values are kept for a short time.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+STORE_AGGREGATE_CACHE_TTL = int(getenv("SHOPPING_STORE_AGGREGATE_CACHE_TTL", "60"))
+STORE_CACHE_SIZE = int(getenv("SHOPPING_STORE_CACHE_SIZE", "1024"))
+STORE_CACHE_TTL = int(getenv("SHOPPING_STORE_CACHE_TTL", "30"))
+API_KEY_CACHE_SIZE = int(getenv("SHOPPING_API_KEY_CACHE_SIZE", "1024"))
+API_KEY_CACHE_TTL = int(getenv("SHOPPING_API_KEY_CACHE_TTL", "300"))
+
+# Independent reads of a page are sent over separate pooled connections at the same time, so a
+# page takes about as long as its slowest read. Each worker holds up to PARALLEL_DB_READS_LIMIT
+# extra connections for this, the limit must stay below the max_size of the pool so other
+# requests still get a connection. Reads inside a transaction always share its connection.
+PARALLEL_DB_READS = getenv("SHOPPING_PARALLEL_DB_READS", "true").lower() == "true"
+PARALLEL_DB_READS_LIMIT = int(getenv("SHOPPING_PARALLEL_DB_READS_LIMIT", "4"))
+
+
+# Sessions and users
+# Sessions are read from the local cache and written through to the database. The ModelBackend
+# stays listed so sessions created before the cached backend keep working. The caches are local
+# to each worker, so a password change or logout in one worker is only seen by the others once
+# their entries expire. Keep both TTLs short.
+
+SESSION_ENGINE = getenv("SHOPPING_SESSION_ENGINE", "authentication.session_store")
+SESSION_CACHE_TTL = int(getenv("SHOPPING_SESSION_CACHE_TTL", "60"))
+
+AUTHENTICATION_BACKENDS = [
+    "authentication.backends.CachedModelBackend",
+    "django.contrib.auth.backends.ModelBackend",
+]
+USER_CACHE_SIZE = int(getenv("SHOPPING_USER_CACHE_SIZE", "1024"))
+USER_CACHE_TTL = int(getenv("SHOPPING_USER_CACHE_TTL", "60"))
+
+
+# Password hashing
+# Passwords are hashed and checked in a process pool per worker, so logins do not hold up the
+# thread that runs the ORM calls. Calls beyond the queue limit are refused with a 503.
+
+PASSWORD_HASHING_WORKERS = int(getenv("SHOPPING_PASSWORD_HASHING_WORKERS", "2"))
+PASSWORD_HASHING_QUEUE_LIMIT = int(getenv("SHOPPING_PASSWORD_HASHING_QUEUE_LIMIT", "32"))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
+from os import getenv
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -45,16 +46,28 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
+    "shoppingapp.middleware.reference_data.ReferenceDataCacheMiddleware",
+    "shoppingapp.middleware.stateless.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
+    "shoppingapp.middleware.stateless.CsrfViewMiddleware",
+    "shoppingapp.middleware.stateless.AuthenticationMiddleware",
+    "shoppingapp.middleware.stateless.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
 ROOT_URLCONF = "shoppingapp.urls"
 
+APP_VERSION = (BASE_DIR.parent.parent / "version.txt").read_text().strip()
+
+# API requests under this prefix that carry a key id prefixed API key skip the session, CSRF,
+# session user and messages middleware.
+STATELESS_API_PREFIX = "/api/v1/"
+
+# Responses of these paths only change with a release, they are cached by clients per version.
+REFERENCE_DATA_PATHS = [
+    "/api/v1/stores/types/mapping",
+]
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -85,9 +98,63 @@ DATABASES = {
     }
 }
 
+# Set SHOPPING_TEST_DATABASE=postgresql to run the tests against PostgreSQL, which exercises the
+# PostgreSQL only queries. The connection uses the SHOPPING_DATABASE_* variables of the app.
+if getenv("SHOPPING_TEST_DATABASE") == "postgresql":
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": getenv("SHOPPING_DATABASE_NAME"),
+            "USER": getenv("SHOPPING_DATABASE_USER"),
+            "PASSWORD": getenv("SHOPPING_DATABASE_PASSWORD"),
+            "HOST": getenv("SHOPPING_DB_HOST"),
+            "PORT": getenv("SHOPPING_DB_PORT", "5432"),
+        }
+    }
+
 PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# Tests that rely on caching override this with a local memory cache.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+    }
+}
+
+STORE_AGGREGATE_CACHE_TTL = 60
+STORE_CACHE_SIZE = 1024
+STORE_CACHE_TTL = 30
+API_KEY_CACHE_SIZE = 1024
+API_KEY_CACHE_TTL = 300
+
+# Test cases run inside a transaction that other connections can not see.
+PARALLEL_DB_READS = False
+PARALLEL_DB_READS_LIMIT = 4
+
+
+# Sessions and users
+
+SESSION_ENGINE = "authentication.session_store"
+SESSION_CACHE_TTL = 60
+
+AUTHENTICATION_BACKENDS = [
+    "authentication.backends.CachedModelBackend",
+    "django.contrib.auth.backends.ModelBackend",
+]
+USER_CACHE_SIZE = 1024
+USER_CACHE_TTL = 60
+
+
+# Password hashing
+
+PASSWORD_HASHING_WORKERS = 0
+PASSWORD_HASHING_QUEUE_LIMIT = 32
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -0,0 +1 @@
+"""Contains the tests for the shopping app project."""
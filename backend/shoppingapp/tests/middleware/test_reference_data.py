@@ -0,0 +1,73 @@
+"""Contains tests for the reference data caching middleware."""
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.test import AsyncClient, TestCase
+
+from shoppingapp.middleware.reference_data import IMMUTABLE, REVALIDATE
+
+MAPPING_ENDPOINT = "/api/v1/stores/types/mapping"
+ETAG = f'"{settings.APP_VERSION}"'
+
+
+class TestReferenceDataCacheMiddleware(TestCase):
+    """Test the reference data caching middleware."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.force_login(self.user)
+        return super().setUp()
+
+    def test_response_has_etag(self) -> None:
+        """Test that reference data is served with the version ETag and must be revalidated."""
+        response = self.client.get(MAPPING_ENDPOINT)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["ETag"], ETAG)
+        self.assertEqual(response.headers["Cache-Control"], REVALIDATE)
+
+    def test_versioned_response_is_immutable(self) -> None:
+        """Test that reference data requested for the current version is immutable."""
+        response = self.client.get(f"{MAPPING_ENDPOINT}?v={settings.APP_VERSION}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Cache-Control"], IMMUTABLE)
+
+    def test_other_version_must_revalidate(self) -> None:
+        """Test that reference data requested for another version is not immutable."""
+        response = self.client.get(f"{MAPPING_ENDPOINT}?v=0.0.0")
+        self.assertEqual(response.headers["Cache-Control"], REVALIDATE)
+
+    def test_not_modified_before_auth(self) -> None:
+        """Test that a matching ETag is answered without touching the session or database."""
+        self.client.logout()
+        with self.assertNumQueries(0):
+            response = self.client.get(MAPPING_ENDPOINT, headers={"If-None-Match": ETAG})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response.headers["ETag"], ETAG)
+        self.assertNotIn("Set-Cookie", response.headers)
+
+    def test_stale_etag(self) -> None:
+        """Test that an ETag of an older version gets the full response."""
+        response = self.client.get(MAPPING_ENDPOINT, headers={"If-None-Match": '"0.0.0"'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["1"], "Online")
+
+    def test_other_paths_untouched(self) -> None:
+        """Test that other endpoints are not given the reference data headers."""
+        response = self.client.get("/api/v1/stores", headers={"If-None-Match": ETAG})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response.headers)
+
+    def test_unsuccessful_response_not_cached(self) -> None:
+        """Test that rejected requests are not given the reference data headers."""
+        response = self.client.post(MAPPING_ENDPOINT, headers={"If-None-Match": ETAG})
+        self.assertEqual(response.status_code, 405)
+        self.assertNotIn("ETag", response.headers)
+
+    async def test_not_modified_async(self) -> None:
+        """Test that the middleware answers conditional requests in async mode."""
+        client = AsyncClient()
+        response = await client.get(MAPPING_ENDPOINT, headers={"If-None-Match": ETAG})
+        self.assertEqual(response.status_code, 304)
@@ -0,0 +1,92 @@
+"""Contains tests for the stateless API middleware."""
+
+from os import environ
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.test import AsyncClient, TestCase
+
+from authentication.models import ApiClient
+from stores.models import ShoppingStore as Store
+
+STORES_URL = "/api/v1/stores"
+
+
+class TestStatelessApiMiddleware(TestCase):
+    """Test the stateless API middleware."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.user = User.objects.create_user(username="apiuser", password="testpassword")
+        Store.objects.create(name="Stateless Store", store_type=1, user=self.user)
+        self.key = async_to_sync(ApiClient.create_key)(self.user)
+        environment = patch.dict(environ, {"TESTS_ENVIRONMENT": "False"})
+        environment.start()
+        self.addCleanup(environment.stop)
+        process_request = patch.object(
+            SessionMiddleware,
+            "process_request",
+            autospec=True,
+            side_effect=SessionMiddleware.process_request,
+        )
+        self.process_request = process_request.start()
+        self.addCleanup(process_request.stop)
+        return super().setUp()
+
+    def test_key_request_skips_session(self) -> None:
+        """Test that a request with a prefixed key is served without touching the session."""
+        self.client.force_login(self.user)
+        self.process_request.reset_mock()
+
+        with self.assertNumQueries(3):
+            response = self.client.get(STORES_URL, headers={"X-API-Key": self.key})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["stores"][0]["name"], "Stateless Store")
+        self.process_request.assert_not_called()
+        self.assertNotIn("Set-Cookie", response.headers)
+
+    def test_key_post_without_csrf_token(self) -> None:
+        """Test that stateless requests that change data need no CSRF token."""
+        response = self.client.post(
+            f"{STORES_URL}/create",
+            data={"name": "Created Store", "store_type": 2, "description": ""},
+            content_type="application/json",
+            headers={"X-API-Key": self.key},
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["user"]["username"], "apiuser")
+
+    def test_invalid_key_rejected(self) -> None:
+        """Test that a prefixed key that does not match is rejected."""
+        response = self.client.get(STORES_URL, headers={"X-API-Key": f"{self.key}0"})
+        self.assertEqual(response.status_code, 401)
+        self.process_request.assert_not_called()
+
+    def test_session_routes_unauthorized(self) -> None:
+        """Test that session authenticated routes reject stateless requests."""
+        self.client.force_login(self.user)
+        response = self.client.get("/api/v1/dashboard/history", headers={"X-API-Key": self.key})
+        self.assertEqual(response.status_code, 401)
+
+    def test_requests_without_key_use_session(self) -> None:
+        """Test that other requests keep the full middleware chain."""
+        self.client.force_login(self.user)
+        self.process_request.reset_mock()
+        response = self.client.get("/api/v1/dashboard/history")
+
+        self.assertEqual(response.status_code, 200)
+        self.process_request.assert_called_once()
+
+    def test_key_outside_api_uses_session(self) -> None:
+        """Test that pages outside the API keep the full middleware chain."""
+        self.client.get("/stores/", headers={"X-API-Key": self.key})
+        self.process_request.assert_called_once()
+
+    async def test_key_request_skips_session_async(self) -> None:
+        """Test that the stateless chain is used by the async handler."""
+        response = await AsyncClient().get(STORES_URL, headers={"X-API-Key": self.key})
+        self.assertEqual(response.status_code, 200)
+        self.process_request.assert_not_called()
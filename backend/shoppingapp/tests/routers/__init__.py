@@ -0,0 +1 @@
+"""Contains tests for the shopping app routers."""
@@ -0,0 +1,38 @@
+"""Contains tests for the metrics router."""
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+METRICS_URL = "/api/v1/metrics"
+
+
+class TestMetricsRouter(TestCase):
+    """Test the metrics router."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.staff = User.objects.create_user(username="staff", password="testing", is_staff=True)
+        self.user = User.objects.create_user(username="user", password="testing")
+        return super().setUp()
+
+    def test_get_metrics(self) -> None:
+        """Test that staff can read the cache counters."""
+        self.client.force_login(self.staff)
+        response = self.client.get(METRICS_URL)
+        self.assertEqual(response.status_code, 200)
+
+        stores = response.json()["caches"]["stores"]
+        self.assertEqual(stores["size"], 0)
+        self.assertEqual(stores["hits"], 0)
+        self.assertIn("max_size", stores)
+
+    def test_get_metrics_not_staff(self) -> None:
+        """Test that users who are not staff can not read the metrics."""
+        self.client.force_login(self.user)
+        response = self.client.get(METRICS_URL)
+        self.assertEqual(response.status_code, 401)
+
+    def test_get_metrics_not_logged_in(self) -> None:
+        """Test that anonymous users can not read the metrics."""
+        response = self.client.get(METRICS_URL)
+        self.assertEqual(response.status_code, 401)
@@ -0,0 +1,76 @@
+"""Contains tests for the local cache utilities."""
+
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from shoppingapp.utilities import cache
+from shoppingapp.utilities.cache import LocalCache
+
+
+class TestLocalCache(SimpleTestCase):
+    """Test the local cache."""
+
+    def test_get_counts_hits_and_misses(self) -> None:
+        """Test that reads are counted as hits or misses."""
+        local: LocalCache[int, str] = LocalCache(max_size=2, ttl=30)
+        self.assertIsNone(local.get(1))
+        local.set(1, "one")
+        self.assertEqual(local.get(1), "one")
+
+        stats = local.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["size"], 1)
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test that the least recently used entry is evicted when the cache is full."""
+        local: LocalCache[int, str] = LocalCache(max_size=2, ttl=30)
+        local.set(1, "one")
+        local.set(2, "two")
+        local.get(1)
+        local.set(3, "three")
+
+        self.assertEqual(local.get(1), "one")
+        self.assertIsNone(local.get(2))
+        self.assertEqual(local.get(3), "three")
+        self.assertEqual(local.stats()["evictions"], 1)
+
+    def test_entries_expire(self) -> None:
+        """Test that expired entries are misses but can still be revalidated."""
+        local: LocalCache[int, str] = LocalCache(max_size=2, ttl=30)
+        with patch("shoppingapp.utilities.cache.time.monotonic", return_value=100):
+            local.set(1, "one")
+        with patch("shoppingapp.utilities.cache.time.monotonic", return_value=131):
+            self.assertIsNone(local.get(1))
+            self.assertEqual(local.get_expired(1), "one")
+
+    def test_set_replace(self) -> None:
+        """Test that an entry is only replaced when the replace check allows it."""
+        local: LocalCache[int, int] = LocalCache(max_size=2, ttl=30)
+        local.set(1, 2)
+        local.set(1, 1, replace=lambda current: current <= 1)
+        self.assertEqual(local.get(1), 2)
+
+        local.set(1, 3, replace=lambda current: current <= 3)
+        self.assertEqual(local.get(1), 3)
+
+    def test_invalidate(self) -> None:
+        """Test that invalidated entries are removed and counted."""
+        local: LocalCache[int, str] = LocalCache(max_size=2, ttl=30)
+        local.set(1, "one")
+        local.invalidate(1)
+        local.invalidate(2)
+
+        self.assertIsNone(local.get_expired(1))
+        self.assertEqual(local.stats()["invalidations"], 1)
+
+    def test_registry(self) -> None:
+        """Test that registered caches are reported and cleared."""
+        local = cache.register("test", max_size=2, ttl=30)
+        self.addCleanup(cache._registry.pop, "test")
+        local.set(1, "one")
+        self.assertEqual(cache.get_stats()["test"]["size"], 1)
+
+        cache.clear_all()
+        self.assertEqual(cache.get_stats()["test"]["size"], 0)
@@ -0,0 +1,70 @@
+"""Contains tests for the concurrency utils."""
+
+import asyncio
+import threading
+
+from asgiref.sync import sync_to_async
+from django.test import SimpleTestCase, override_settings
+
+from shoppingapp.utilities.concurrency import gather_reads
+
+
+@override_settings(PARALLEL_DB_READS=True)
+class TestGatherReads(SimpleTestCase):
+    """Test running reads concurrently."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.running = 0
+        self.max_running = 0
+        self.threads: list[int] = []
+        return super().setUp()
+
+    async def read(self) -> int:
+        """Record how many reads run at the same time."""
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.05)
+        self.running -= 1
+        return self.max_running
+
+    async def test_reads_run_concurrently(self) -> None:
+        """Test that reads below the limit run at the same time."""
+        results = await gather_reads(self.read, self.read, self.read)
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(self.max_running, 3)
+
+    @override_settings(PARALLEL_DB_READS_LIMIT=1)
+    async def test_reads_bounded_by_limit(self) -> None:
+        """Test that no more than PARALLEL_DB_READS_LIMIT reads run at the same time."""
+        await gather_reads(self.read, self.read, self.read)
+
+        self.assertEqual(self.max_running, 1)
+
+    @override_settings(PARALLEL_DB_READS_LIMIT=1)
+    async def test_failed_read_releases_slot(self) -> None:
+        """Test that a failed read does not keep its slot."""
+
+        async def fail() -> None:
+            raise ValueError()
+
+        with self.assertRaises(ValueError):
+            await gather_reads(fail, self.read)
+
+        self.assertEqual(await asyncio.wait_for(gather_reads(self.read, self.read), 1), (1, 1))
+
+    async def test_reads_use_own_threads(self) -> None:
+        """Test that the sync calls of a read run in a worker thread of that read."""
+
+        def record() -> int:
+            self.threads.append(threading.get_ident())
+            return threading.get_ident()
+
+        async def read() -> int:
+            return await sync_to_async(record)()
+
+        first, second = await gather_reads(read, read)
+
+        self.assertNotEqual(first, second)
+        self.assertNotIn(threading.get_ident(), self.threads)
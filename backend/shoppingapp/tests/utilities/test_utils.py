@@ -0,0 +1,20 @@
+"""Contains tests for the shoppingapp utils."""
+
+from django.test import RequestFactory, SimpleTestCase
+
+from shoppingapp.utilities.utils import get_overview_params
+
+
+class TestGetOverviewParams(SimpleTestCase):
+    """Test the overview params util."""
+
+    async def test_params(self) -> None:
+        """Test the page and limit are read from the query string."""
+        request = RequestFactory().get("/stores/?page=2&limit=5")
+        self.assertEqual(await get_overview_params(request), {"page": 2, "limit": 5})
+
+    async def test_invalid_limit_defaults(self) -> None:
+        """Test a limit that is not a number or below 1 falls back to the default."""
+        for limit in ["abc", "0", "-1"]:
+            request = RequestFactory().get(f"/stores/?limit={limit}")
+            self.assertEqual(await get_overview_params(request), {"page": 1, "limit": 10})
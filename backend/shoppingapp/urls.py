@@ -24,19 +24,22 @@ from django.http import HttpRequest, HttpResponse
 from django.urls import include, path
 from ninja import NinjaAPI
 
+from authentication.auth.hashing import RETRY_AFTER_SECONDS
 from authentication.errors.api_exceptions import (
     EmailAlreadyExists,
     InvalidCredentials,
     InvalidUserDetails,
     NonMatchingCredentials,
+    PasswordHashingBusy,
     UserAlreadyLoggedIn,
     UsernameAlreadyExists,
     UserNotLoggedIn,
 )
 from authentication.routers.auth_router import auth_router
 from dashboard.routers.dashboard_router import dashboard_router
-from items.errors.exceptions import ItemAlreadyExists, ItemDoesNotExist
+from items.errors.exceptions import InvalidCursor, ItemAlreadyExists, ItemDoesNotExist
 from items.routers.item_router import item_router
+from shoppingapp.routers.metrics_router import metrics_router
 from stores.errors.api_exceptions import (
     InvalidStoreType,
     StoreAlreadyExists,
@@ -47,12 +50,12 @@ from stores.routers.store_router import store_router
 log = logging.getLogger(__name__)
 log.info("Loading urls...")
 
-version = open("../version.txt").read().strip()
-api = NinjaAPI(title="Shopping App API", version=version)
+api = NinjaAPI(title="Shopping App API", version=settings.APP_VERSION)
 api.add_router("/auth", auth_router)
 api.add_router("/stores", store_router)
 api.add_router("/items", item_router)
 api.add_router("/dashboard", dashboard_router)
+api.add_router("/metrics", metrics_router)
 
 
 @api.exception_handler(EmailAlreadyExists)
@@ -91,6 +94,17 @@ def non_matching_credentials_handler(
     return api.create_response(request, {"detail": str(exception)}, status=400)
 
 
+@api.exception_handler(PasswordHashingBusy)
+def password_hashing_busy_handler(
+    request: HttpRequest, exception: PasswordHashingBusy
+) -> HttpResponse:
+    """Handle PasswordHashingBusy exception."""
+    log.warning(f"Password hashing busy: {exception}")
+    response = api.create_response(request, {"detail": str(exception)}, status=503)
+    response["Retry-After"] = str(RETRY_AFTER_SECONDS)
+    return response
+
+
 @api.exception_handler(UserAlreadyLoggedIn)
 def user_already_logged_in_handler(
     request: HttpRequest, exception: UserAlreadyLoggedIn
@@ -155,6 +169,13 @@ def item_does_not_exist_handler(request: HttpRequest, exception: ItemDoesNotExis
     return api.create_response(request, {"detail": str(exception)}, status=404)
 
 
+@api.exception_handler(InvalidCursor)
+def invalid_cursor_handler(request: HttpRequest, exception: InvalidCursor) -> HttpResponse:
+    """Handle InvalidCursor exception."""
+    log.warning(f"Invalid cursor: {exception}")
+    return api.create_response(request, {"detail": str(exception)}, status=400)
+
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/v1/", api.urls),
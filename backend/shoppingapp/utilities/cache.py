@@ -0,0 +1,190 @@
+"""Utility classes for small process local caches."""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Generic, Hashable, TypeVar
+
+log = logging.getLogger(__name__)
+log.info("Loading cache utils...")
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    """Counters of a local cache."""
+
+    size: int = 0
+    max_size: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+class LocalCache(Generic[K, V]):
+    """
+    A bounded, thread safe LRU cache whose entries expire after a time to live.
+
+    The cache lives in the memory of a single worker process, so other workers only see a change
+    once their entry expires or is invalidated by a write made in that worker.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """
+        Create a cache.
+
+        Args:
+            max_size (int): The maximum number of entries, the least recently used are evicted.
+            ttl (float): The number of seconds an entry is fresh for.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats(max_size=max_size)
+
+    def get(self, key: K) -> V | None:
+        """
+        Get a fresh entry.
+
+        Args:
+            key (K): The key of the entry.
+
+        Returns:
+            V | None: The value, or None if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                self._stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry[1]
+
+    def get_expired(self, key: K) -> V | None:
+        """
+        Get an entry whether it expired or not, so it can be revalidated instead of reloaded.
+
+        Does not count as a hit or miss.
+
+        Args:
+            key (K): The key of the entry.
+
+        Returns:
+            V | None: The value, or None if it is missing.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[1] if entry else None
+
+    def set(self, key: K, value: V, replace: Callable[[V], bool] | None = None) -> None:
+        """
+        Store an entry, evicting the least recently used entry when the cache is full.
+
+        Args:
+            key (K): The key of the entry.
+            value (V): The value.
+            replace (Callable[[V], bool] | None): Called with the current value, if any, the
+                entry is only replaced when it returns True.
+        """
+        with self._lock:
+            current = self._entries.get(key)
+            if current is not None and replace is not None and not replace(current[1]):
+                return
+
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        """
+        Remove an entry.
+
+        Args:
+            key (K): The key of the entry.
+        """
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._stats.invalidations += 1
+
+    def invalidate_where(self, predicate: Callable[[K], bool]) -> int:
+        """
+        Remove every entry whose key matches the predicate.
+
+        Args:
+            predicate (Callable[[K], bool]): Called with every key, True removes the entry.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            self._stats.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._stats = CacheStats(max_size=self.max_size)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the counters of the cache.
+
+        Returns:
+            dict[str, Any]: The size, capacity, hits, misses, evictions and invalidations.
+        """
+        with self._lock:
+            self._stats.size = len(self._entries)
+            return asdict(self._stats)
+
+
+_registry: dict[str, LocalCache[Any, Any]] = {}
+
+
+def register(name: str, max_size: int, ttl: float) -> LocalCache[Any, Any]:
+    """
+    Create a local cache and register it so its counters are reported.
+
+    Args:
+        name (str): The name the cache is reported under.
+        max_size (int): The maximum number of entries.
+        ttl (float): The number of seconds an entry is fresh for.
+
+    Returns:
+        LocalCache[Any, Any]: The cache.
+    """
+    cache: LocalCache[Any, Any] = LocalCache(max_size=max_size, ttl=ttl)
+    _registry[name] = cache
+    return cache
+
+
+def get_stats() -> dict[str, dict[str, Any]]:
+    """
+    Get the counters of every registered cache.
+
+    Returns:
+        dict[str, dict[str, Any]]: The counters keyed by cache name.
+    """
+    return {name: cache.stats() for name, cache in sorted(_registry.items())}
+
+
+def clear_all() -> None:
+    """Clear every registered cache."""
+    for cache in _registry.values():
+        cache.clear()
+
+
+log.info("Loaded cache utils.")
@@ -0,0 +1,123 @@
+"""Utility functions for running independent database reads concurrently."""
+
+import asyncio
+import contextvars
+import logging
+import weakref
+from typing import Any, Awaitable, Callable, TypeVar, overload
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+log = logging.getLogger(__name__)
+log.info("Loading concurrency utils...")
+
+A = TypeVar("A")
+B = TypeVar("B")
+C = TypeVar("C")
+T = TypeVar("T")
+
+Read = Callable[[], Awaitable[T]]
+
+_semaphores: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple[int, asyncio.Semaphore]]"
+) = weakref.WeakKeyDictionary()
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """
+    Get the semaphore that bounds the reads running on their own connection.
+
+    Returns:
+        asyncio.Semaphore: The semaphore of the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    limit = settings.PARALLEL_DB_READS_LIMIT
+    cached = _semaphores.get(loop)
+    if cached is None or cached[0] != limit:
+        cached = (limit, asyncio.Semaphore(limit))
+        _semaphores[loop] = cached
+    return cached[1]
+
+
+def _run_read(read: Read[T]) -> T:
+    """
+    Run a read from a worker thread, so its ORM calls use the connection of that thread.
+
+    The ORM calls of the read are sent back to the thread that waits on async_to_sync, and its
+    connection is returned to the pool once the read is done. The read starts from an empty
+    context, since async_to_sync keeps the thread to send ORM calls to in a context variable
+    that would otherwise be shared with the caller and the other reads.
+
+    Args:
+        read (Read[T]): The read to run.
+
+    Returns:
+        T: The result of the read.
+    """
+    try:
+        return contextvars.Context().run(async_to_sync(read))
+    finally:
+        close_old_connections()
+
+
+async def _read_on_own_connection(read: Read[T]) -> T:
+    """
+    Run a read with its own thread, and therefore its own database connection, for ORM calls.
+
+    The async ORM sends every query of a request through one shared thread, so reads awaited
+    together would still run one after the other. At most PARALLEL_DB_READS_LIMIT reads run
+    this way at the same time, which keeps connections in the pool for other requests.
+
+    Args:
+        read (Read[T]): The read to run.
+
+    Returns:
+        T: The result of the read.
+    """
+    async with _get_semaphore():
+        return await sync_to_async(_run_read, thread_sensitive=False)(read)
+
+
+def _in_transaction() -> bool:
+    """
+    Check if the connection of the caller is inside a transaction.
+
+    Returns:
+        bool: True if the caller is inside an atomic block.
+    """
+    return connection.in_atomic_block
+
+
+@overload
+async def gather_reads(first: Read[A], second: Read[B], /) -> tuple[A, B]: ...
+
+
+@overload
+async def gather_reads(first: Read[A], second: Read[B], third: Read[C], /) -> tuple[A, B, C]: ...
+
+
+async def gather_reads(*reads: Read[Any]) -> tuple[Any, ...]:
+    """
+    Run independent reads concurrently and return their results in order.
+
+    When PARALLEL_DB_READS is enabled, the queries of every read run in their own thread with
+    their own database connection, so the total time approaches that of the slowest read.
+    The reads then wait for a free slot when PARALLEL_DB_READS_LIMIT reads are already running.
+    Inside a transaction of the caller the reads run back to back on its connection, so they
+    see its uncommitted writes and any writes they make stay part of the transaction.
+
+    Args:
+        reads (Read[Any]): Functions without arguments that return the awaitables to run.
+
+    Returns:
+        tuple[Any, ...]: The results of the reads.
+    """
+    if not settings.PARALLEL_DB_READS or await sync_to_async(_in_transaction)():
+        return tuple([await read() for read in reads])
+
+    return tuple(await asyncio.gather(*(_read_on_own_connection(read) for read in reads)))
+
+
+log.info("Loaded concurrency utils.")
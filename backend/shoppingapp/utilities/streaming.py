@@ -0,0 +1,89 @@
+"""Utility functions for streaming exports."""
+
+import csv
+import json
+import logging
+from io import StringIO
+from typing import Any, AsyncIterator, Literal, Sequence
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+log = logging.getLogger(__name__)
+log.info("Loading streaming utils...")
+
+ExportFormat = Literal["ndjson", "csv"]
+
+CONTENT_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+async def _to_ndjson(rows: AsyncIterator[dict[str, Any]]) -> AsyncIterator[str]:
+    """
+    Encode rows as newline delimited JSON.
+
+    Args:
+        rows (AsyncIterator[dict[str, Any]]): The rows to encode.
+
+    Yields:
+        str: One JSON document per row.
+    """
+    async for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+
+
+async def _to_csv(rows: AsyncIterator[dict[str, Any]], fields: Sequence[str]) -> AsyncIterator[str]:
+    """
+    Encode rows as CSV with a header line.
+
+    Args:
+        rows (AsyncIterator[dict[str, Any]]): The rows to encode.
+        fields (Sequence[str]): The columns, in order.
+
+    Yields:
+        str: The header, then one line per row.
+    """
+    buffer = StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields)
+
+    writer.writeheader()
+    yield buffer.getvalue()
+
+    async for row in rows:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow(row)
+        yield buffer.getvalue()
+
+
+def stream_rows(
+    rows: AsyncIterator[dict[str, Any]],
+    fields: Sequence[str],
+    export_format: ExportFormat,
+    filename: str,
+) -> StreamingHttpResponse:
+    """
+    Stream rows to the client as they are read from the database.
+
+    Args:
+        rows (AsyncIterator[dict[str, Any]]): The rows to stream.
+        fields (Sequence[str]): The columns, in order.
+        export_format (ExportFormat): Either ndjson or csv.
+        filename (str): The file name without extension, used for the download.
+
+    Returns:
+        StreamingHttpResponse: The streaming response.
+    """
+    if export_format == "csv":
+        content = _to_csv(rows, fields)
+    else:
+        content = _to_ndjson(rows)
+
+    response = StreamingHttpResponse(content, content_type=CONTENT_TYPES[export_format])
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{export_format}"'
+    return response
+
+
+log.info("Loaded streaming utils.")
@@ -41,6 +41,10 @@ async def get_overview_params(request: HttpRequest) -> dict[str, int]:
         log.warning("Failed to load limit param, defaulting to 10")
         limit = 10
 
+    if limit < 1:
+        log.warning("Limit param is below 1, defaulting to 10")
+        limit = 10
+
     log.info("Loaded overview params.")
     return {"page": page, "limit": limit}
 
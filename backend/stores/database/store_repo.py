@@ -1,25 +1,66 @@
 """Contains store repository functions."""
 
 import logging
+from copy import copy
 from datetime import date
-from typing import Any, no_type_check
+from decimal import Decimal
+from functools import partial
+from typing import Any, AsyncIterator
 
 from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.contrib.auth.models import AbstractBaseUser, AnonymousUser, User
-from django.core.paginator import Paginator
-from django.db.models import Case, Count, F, IntegerField, When
-
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Avg, Count, Max, Min, QuerySet, Sum, Value
+from django.db.models.functions import Coalesce
+
+from items.database import aggregate_repo
+from items.models import ShoppingItem as Item
+from shoppingapp.database.filters import date_range
+from shoppingapp.database.pagination import paginate
+from shoppingapp.utilities.cache import register
 from stores.models import ShoppingStore as Store
 from stores.schemas.output import StorePaginationSchema, StoreSchema
 
 log = logging.getLogger(__name__)
 log.info("Store repository loading...")
 
-
-@sync_to_async
-def _filter(
-    page_number: int = 1,
-    stores_per_page: int = 10,
+AGGREGATE_CACHE_PREFIX = "stores:aggregate"
+
+AGGREGATE_FIELDS = {
+    1: "online_stores",
+    2: "in_store_stores",
+    3: "combined_stores",
+}
+
+EXPORT_CHUNK_SIZE = 2000
+
+_store_cache = register("stores", settings.STORE_CACHE_SIZE, settings.STORE_CACHE_TTL)
+
+EXPORT_FIELDS = (
+    "id",
+    "name",
+    "store_type",
+    "description",
+    "user_id",
+    "created_at",
+    "updated_at",
+)
+
+SCHEMA_FIELDS = (
+    "id",
+    "name",
+    "store_type",
+    "description",
+    "created_at",
+    "updated_at",
+    "user__id",
+    "user__username",
+)
+
+
+def _build_query(
     name: str | None = None,
     store_types: list[int] | None = None,
     created_on: date | None = None,
@@ -30,13 +71,11 @@ def _filter(
     updated_after: date | None = None,
     user: User | None = None,
     ids: list[int] | None = None,
-) -> StorePaginationSchema:
+) -> QuerySet[Store]:
     """
-    Filter stores.
+    Build the query for the stores that match the filters, ordered by the updated date.
 
     Args:
-        page_number (int): The page number.
-        stores_per_page (int): The number of stores per page.
         name (str | None): The name of the store.
         store_types (list[int] | None): The store types.
         created_on (date | None): The date the store was created.
@@ -49,58 +88,120 @@ def _filter(
         ids (list[int] | None): The ids to filter from.
 
     Returns:
-        StorePaginationSchema: Store pagination object.
+        QuerySet[Store]: The filtered stores.
     """
     stores = Store.objects.all()
 
     if ids:
         stores = stores.filter(id__in=ids)
     if name:
-        stores = stores.filter(name__icontains=name)
+        stores = stores.filter(name__trigram_icontains=name)
     if store_types:
         stores = stores.filter(store_type__in=store_types)
-    if created_on:
-        stores = stores.filter(created_at__date=created_on)
-    if created_before:
-        stores = stores.filter(created_at__date__lte=created_before)
-    if created_after:
-        stores = stores.filter(created_at__date__gte=created_after)
-    if updated_on:
-        stores = stores.filter(updated_at__date=updated_on)
-    if updated_before:
-        stores = stores.filter(updated_at__date__lte=updated_before)
-    if updated_after:
-        stores = stores.filter(updated_at__date__gte=updated_after)
+    stores = stores.filter(
+        date_range(
+            "created_at",
+            on=created_on,
+            before=created_before,
+            after=created_after,
+            inclusive=True,
+        ),
+        date_range(
+            "updated_at",
+            on=updated_on,
+            before=updated_before,
+            after=updated_after,
+            inclusive=True,
+        ),
+    )
     if user:
         stores = stores.filter(user=user)
 
-    stores = stores.order_by("-updated_at")
-
-    paginator = Paginator(stores, stores_per_page)
-    paginated_page = paginator.get_page(page_number)
-
-    paginated_stores = paginated_page.object_list
-    results = [StoreSchema.from_orm(store) for store in paginated_stores]
-    total = paginator.count
-    page = paginated_page.number
-    total_pages = paginator.num_pages
-    has_previous = paginated_page.has_previous()
-    previous_page = paginated_page.previous_page_number() if has_previous else None
-    has_next = paginated_page.has_next()
-    next_page = paginated_page.next_page_number() if has_next else None
-
-    result = StorePaginationSchema(
-        stores=results,
-        total=total,
-        page_number=page,
-        total_pages=total_pages,
-        has_previous=has_previous,
-        previous_page=previous_page,
-        has_next=has_next,
-        next_page=next_page,
+    return stores.order_by("-updated_at")
+
+
+def _with_stats(stores: QuerySet[Store]) -> QuerySet[Store]:
+    """
+    Annotate the number of items at each store and their total and average price.
+
+    The statistics are computed with a single aggregated join on the items.
+
+    Args:
+        stores (QuerySet[Store]): The stores.
+
+    Returns:
+        QuerySet[Store]: The stores with item_count, total_price and avg_price.
+    """
+    return stores.annotate(
+        item_count=Count("shoppingitem"),
+        total_price=Coalesce(Sum("shoppingitem__price"), Value(Decimal(0))),
+        avg_price=Avg("shoppingitem__price"),
     )
 
-    return result
+
+@sync_to_async
+def _filter(
+    page_number: int = 1,
+    stores_per_page: int = 10,
+    name: str | None = None,
+    store_types: list[int] | None = None,
+    created_on: date | None = None,
+    created_before: date | None = None,
+    created_after: date | None = None,
+    updated_on: date | None = None,
+    updated_before: date | None = None,
+    updated_after: date | None = None,
+    user: User | None = None,
+    ids: list[int] | None = None,
+    include_total: bool = True,
+    with_stats: bool = False,
+) -> StorePaginationSchema:
+    """
+    Filter stores.
+
+    Args:
+        page_number (int): The page number.
+        stores_per_page (int): The number of stores per page.
+        name (str | None): The name of the store.
+        store_types (list[int] | None): The store types.
+        created_on (date | None): The date the store was created.
+        created_before (date | None): The date the store was created before.
+        created_after (date | None): The date the store was created after.
+        updated_on (date | None): The date the store was updated.
+        updated_before (date | None): The date the store was updated before.
+        updated_after (date | None): The date the store was updated after.
+        user (User | AnonymousUser | AbstractBaseUser | None): The user who created the store.
+        ids (list[int] | None): The ids to filter from.
+        include_total (bool): Whether to count the total number of stores.
+        with_stats (bool): Whether to annotate the item statistics of every store.
+
+    Returns:
+        StorePaginationSchema: Store pagination object.
+    """
+    stores = _build_query(
+        name=name,
+        store_types=store_types,
+        created_on=created_on,
+        created_before=created_before,
+        created_after=created_after,
+        updated_on=updated_on,
+        updated_before=updated_before,
+        updated_after=updated_after,
+        user=user,
+        ids=ids,
+    )
+    stores = stores.select_related("user").only(*SCHEMA_FIELDS)
+    if with_stats:
+        stores = _with_stats(stores)
+
+    page_stores, pagination = paginate(
+        stores,
+        page_number=page_number,
+        per_page=stores_per_page,
+        include_total=include_total,
+    )
+    results = [StoreSchema.from_orm(store) for store in page_stores]
+    return StorePaginationSchema(stores=results, **pagination)
 
 
 async def create_store(
@@ -128,6 +229,7 @@ async def create_store(
         user=user,
     )
     await store.asave()
+    await ainvalidate_aggregates(user_id=user.pk)
     return store
 
 
@@ -135,6 +237,8 @@ async def get_stores(
     page_number: int = 1,
     stores_per_page: int = 10,
     user: User | None = None,
+    include_total: bool = True,
+    with_stats: bool = False,
 ) -> StorePaginationSchema:
     """
     Get all stores.
@@ -143,11 +247,19 @@ async def get_stores(
         page (int): The page number.
         stores_per_page (int): The number of stores per page.
         user (User): User who owns the stores.
+        include_total (bool): Whether to count the total number of stores.
+        with_stats (bool): Whether to annotate the item statistics of every store.
 
     Returns:
         StorePaginationSchema: Store pagination object.
     """
-    return await _filter(page_number, stores_per_page, user=user)
+    return await _filter(
+        page_number,
+        stores_per_page,
+        user=user,
+        include_total=include_total,
+        with_stats=with_stats,
+    )
 
 
 async def filter_stores(
@@ -163,6 +275,8 @@ async def filter_stores(
     updated_after: date | None = None,
     user: User | None = None,
     ids: list[int] | None = None,
+    include_total: bool = True,
+    with_stats: bool = False,
 ) -> StorePaginationSchema:
     """
     Filter stores.
@@ -180,6 +294,8 @@ async def filter_stores(
         updated_after (date | None): The date the store was updated after.
         user (User | None): The user who created the store.
         ids (list[int] | None): The store ids to filter from.
+        include_total (bool): Whether to count the total number of stores.
+        with_stats (bool): Whether to annotate the item statistics of every store.
 
     Returns:
         StorePaginationSchema: Store pagination object.
@@ -197,9 +313,61 @@ async def filter_stores(
         updated_after,
         user,
         ids=ids,
+        include_total=include_total,
+        with_stats=with_stats,
     )
 
 
+def export_stores(
+    name: str | None = None,
+    store_types: list[int] | None = None,
+    created_on: date | None = None,
+    created_before: date | None = None,
+    created_after: date | None = None,
+    updated_on: date | None = None,
+    updated_before: date | None = None,
+    updated_after: date | None = None,
+    user: User | None = None,
+    ids: list[int] | None = None,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Iterate over every store that matches the filters, without loading them all into memory.
+
+    Args:
+        name (str | None): The name of the store.
+        store_types (list[int] | None): The store types.
+        created_on (date | None): The date the store was created.
+        created_before (date | None): The date the store was created before.
+        created_after (date | None): The date the store was created after.
+        updated_on (date | None): The date the store was updated.
+        updated_before (date | None): The date the store was updated before.
+        updated_after (date | None): The date the store was updated after.
+        user (User | None): The user who created the store.
+        ids (list[int] | None): The store ids to filter from.
+        chunk_size (int): The number of rows fetched from the database cursor at a time.
+
+    Returns:
+        AsyncIterator[dict[str, Any]]: The stores as rows of EXPORT_FIELDS.
+    """
+    stores = _build_query(
+        name=name,
+        store_types=store_types,
+        created_on=created_on,
+        created_before=created_before,
+        created_after=created_after,
+        updated_on=updated_on,
+        updated_before=updated_before,
+        updated_after=updated_after,
+        user=user,
+        ids=ids,
+    )
+    rows: AsyncIterator[dict[str, Any]] = stores.values(*EXPORT_FIELDS).aiterator(
+        chunk_size=chunk_size
+    )
+    return rows
+
+
 async def edit_store(
     store_id: int,
     user: User | AnonymousUser | AbstractBaseUser,
@@ -233,12 +401,84 @@ async def edit_store(
         store.description = store_description
 
     await store.asave()
+    _store_cache.invalidate(store_id)
+    await ainvalidate_aggregates(user_id=user.pk)
     return store
 
 
-async def delete_store(store_id: int, user: User | AnonymousUser | AbstractBaseUser) -> None:
+def _delete_cascading(store_id: int, user_id: int) -> list[dict[str, Any]] | None:
+    """
+    Delete a store in a single statement, letting the database cascade to its items.
+
+    The totals of the removed items are read in the same statement, from the snapshot taken
+    before the cascade ran.
+
+    Args:
+        store_id (int): The id of the store.
+        user_id (int): The id of the user who created the store.
+
+    Returns:
+        list[dict[str, Any]] | None: The totals of the removed items per owner, None if no store
+            was deleted.
+    """
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"WITH deleted AS (DELETE FROM {quote(Store._meta.db_table)} "
+            "WHERE id = %s AND user_id = %s RETURNING id) "
+            "SELECT item.user_id, COUNT(item.id), SUM(item.price), MAX(item.price), "
+            "MIN(item.price) "
+            f"FROM deleted LEFT JOIN {quote(Item._meta.db_table)} item "
+            "ON item.store_id = deleted.id GROUP BY item.user_id",
+            [store_id, user_id],
+        )
+        rows = cursor.fetchall()
+
+    if not rows:
+        return None
+
+    fields = ("user_id", "total_items", "total_price", "max_price", "min_price")
+    return [dict(zip(fields, row)) for row in rows if row[0] is not None]
+
+
+def _delete_collected(store_id: int, user_id: int) -> list[dict[str, Any]] | None:
+    """
+    Delete a store and its items with one statement each, for databases without the cascade.
+
+    Args:
+        store_id (int): The id of the store.
+        user_id (int): The id of the user who created the store.
+
+    Returns:
+        list[dict[str, Any]] | None: The totals of the removed items per owner, None if no store
+            was deleted.
+    """
+    items = Item.objects.filter(store_id=store_id, store__user_id=user_id)
+    removed = list(
+        items.values("user_id")
+        .annotate(
+            total_items=Count("id"),
+            total_price=Sum("price"),
+            max_price=Max("price"),
+            min_price=Min("price"),
+        )
+        .order_by()
+    )
+    items.delete()
+
+    deleted, _ = Store.objects.filter(id=store_id, user_id=user_id).delete()
+    if not deleted:
+        return None
+    return removed
+
+
+@sync_to_async
+def delete_store(store_id: int, user: User | AnonymousUser | AbstractBaseUser) -> None:
     """
-    Delete a store.
+    Delete a store and the items stocked at it, without loading the items.
+
+    On PostgreSQL the items are removed by the ON DELETE CASCADE of their foreign key. The item
+    aggregates of every user who had items at the store are updated in the same transaction.
 
     Args:
         store_id (int): The id of the store.
@@ -247,13 +487,44 @@ async def delete_store(store_id: int, user: User | AnonymousUser | AbstractBaseU
     Raises:
         Store.DoesNotExist: If the store does not exist.
     """
-    store = await Store.objects.aget(id=store_id, user=user)
-    await store.adelete()
+    with transaction.atomic():
+        if connection.vendor == "postgresql":
+            removed = _delete_cascading(store_id=store_id, user_id=user.pk)
+        else:
+            removed = _delete_collected(store_id=store_id, user_id=user.pk)
+
+        if removed is None:
+            raise Store.DoesNotExist()
+
+        for row in removed:
+            if not aggregate_repo.ensure(user_id=row["user_id"]):
+                aggregate_repo.record_removed(**row)
+
+        transaction.on_commit(partial(_store_cache.invalidate, store_id))
+        transaction.on_commit(partial(invalidate_aggregates, user_id=user.pk))
 
 
-async def get_store(store_id: int) -> Store:
+def _cache_store(store: Store) -> None:
     """
-    Get a store.
+    Cache a store row, unless a newer version of it is already cached.
+
+    Args:
+        store (ShoppingStore): The store, with its user loaded.
+    """
+    _store_cache.set(
+        store.id,
+        store,
+        replace=lambda cached: bool(cached.updated_at <= store.updated_at),
+    )
+
+
+async def _get_cached_store(store_id: int) -> Store:
+    """
+    Get a store from the local store cache, loading it when it is not cached.
+
+    Expired entries are revalidated against the updated_at column of the store, which avoids
+    reloading the row and its user when the store did not change. A copy is returned so callers
+    can not change the cached instance.
 
     Args:
         store_id (int): The id of the store.
@@ -264,38 +535,87 @@ async def get_store(store_id: int) -> Store:
     Raises:
         Store.DoesNotExist: If the store does not exist.
     """
+    store: Store | None = _store_cache.get(store_id)
+    if store is not None:
+        return copy(store)
+
+    expired: Store | None = _store_cache.get_expired(store_id)
+    if expired is not None:
+        updated_at = (
+            await Store.objects.filter(id=store_id).values_list("updated_at", flat=True).afirst()
+        )
+        if updated_at == expired.updated_at:
+            _store_cache.set(store_id, expired)
+            return copy(expired)
+        _store_cache.invalidate(store_id)
+
     store = await Store.objects.select_related("user").aget(id=store_id)
+    _cache_store(store)
+    return copy(store)
+
+
+async def get_store(store_id: int, with_stats: bool = False) -> Store:
+    """
+    Get a store.
+
+    Stores without statistics are served from the local store cache.
+
+    Args:
+        store_id (int): The id of the store.
+        with_stats (bool): Whether to annotate the item statistics of the store.
+
+    Returns:
+        ShoppingStore: The store.
+
+    Raises:
+        Store.DoesNotExist: If the store does not exist.
+    """
+    if not with_stats:
+        return await _get_cached_store(store_id)
+
+    store = await _with_stats(Store.objects.select_related("user")).aget(id=store_id)
     return store
 
 
-@sync_to_async
-@no_type_check
-def _pre_aggregate_filter(
-    user: User | AnonymousUser | AbstractBaseUser | None = None,
-):
+def _aggregate_cache_key(user_id: int | None = None) -> str:
     """
-    Filter stores by user pre-aggregation.
+    Get the cache key of a store aggregation.
 
     Args:
-        user (User | AnonymousUser | AbstractBaseUser | None): The user who created the store.
+        user_id (int | None): The user the stores are aggregated for, all stores if None.
 
     Returns:
-        list[ShoppingStore]: The stores.
+        str: The cache key.
     """
-    stores = Store.objects.all()
+    scope = f"user:{user_id}" if user_id is not None else "all"
+    return f"{AGGREGATE_CACHE_PREFIX}:{scope}"
 
-    if user:
-        stores = stores.filter(user=user)
 
-    return stores
+def invalidate_aggregates(user_id: int) -> None:
+    """
+    Remove the cached store aggregations that include the stores of a user.
+
+    Args:
+        user_id (int): The user whose stores changed.
+    """
+    cache.delete_many([_aggregate_cache_key(), _aggregate_cache_key(user_id)])
+
+
+async def ainvalidate_aggregates(user_id: int) -> None:
+    """
+    Remove the cached store aggregations that include the stores of a user.
+
+    Args:
+        user_id (int): The user whose stores changed.
+    """
+    await cache.adelete_many([_aggregate_cache_key(), _aggregate_cache_key(user_id)])
 
 
-@no_type_check
 async def aggregate_stores(
     user: User | AnonymousUser | AbstractBaseUser | None = None,
 ) -> dict[str, Any]:
     """
-    Aggregate stores.
+    Aggregate stores by type with a single grouped query, cached until the stores change.
 
     Args:
         user (User | AnonymousUser | AbstractBaseUser | None): The user who created the store.
@@ -303,17 +623,64 @@ async def aggregate_stores(
     Returns:
         dict[str, Any]: The aggregated stores.
     """
-    pre_filtered_stores = await _pre_aggregate_filter(user=user)
-    result = await pre_filtered_stores.aaggregate(
-        online_stores=Count(Case(When(store_type=1, then=1), output_field=IntegerField())),
-        in_store_stores=Count(Case(When(store_type=2, then=1), output_field=IntegerField())),
-        combined_stores=Count(Case(When(store_type=3, then=1), output_field=IntegerField())),
-        total_stores=Count(F("id")),
-    )
+    # Anonymous users have no primary key, they see the aggregation of all stores.
+    user_id = user.pk if user is not None and user.pk is not None else None
+    key = _aggregate_cache_key(user_id)
+    cached: dict[str, Any] | None = await cache.aget(key)
+    if cached is not None:
+        return cached
+
+    stores = Store.objects.all()
+    if user_id is not None:
+        stores = stores.filter(user_id=user_id)
 
+    rows = stores.values("store_type").annotate(total=Count("id")).order_by()
+    totals = {row["store_type"]: row["total"] async for row in rows}
+
+    result: dict[str, Any] = {
+        field: totals.get(store_type, 0) for store_type, field in AGGREGATE_FIELDS.items()
+    }
+    result["total_stores"] = sum(totals.values())
+
+    await cache.aset(key, result, settings.STORE_AGGREGATE_CACHE_TTL)
     return result
 
 
+async def get_stores_by_ids(store_ids: list[int]) -> dict[int, Store]:
+    """
+    Get the stores with the given ids in a single query.
+
+    Args:
+        store_ids (list[int]): The ids of the stores.
+
+    Returns:
+        dict[int, ShoppingStore]: The stores that exist, keyed by id.
+    """
+    stores = Store.objects.filter(id__in=set(store_ids))
+    return {store.id: store async for store in stores}
+
+
+async def get_existing_store_ids(store_ids: list[int] | set[int]) -> set[int]:
+    """
+    Find which of the given store ids exist, in at most one query.
+
+    Stores in the local store cache are not queried.
+
+    Args:
+        store_ids (list[int] | set[int]): The ids of the stores.
+
+    Returns:
+        set[int]: The ids that belong to a store.
+    """
+    cached = {store_id for store_id in set(store_ids) if _store_cache.get(store_id) is not None}
+    uncached = set(store_ids) - cached
+    if not uncached:
+        return cached
+
+    existing = Store.objects.filter(id__in=uncached).values_list("id", flat=True)
+    return cached | {store_id async for store_id in existing}
+
+
 async def does_name_exist(name: str) -> bool:
     """
     Check if a store name exists.
@@ -39,4 +39,15 @@ class StoreDoesNotExist(Exception):
         super().__init__(f"Store with id '{store_id}' does not exist.")
 
 
+class StoresDoNotExist(StoreDoesNotExist):
+    """Raised when some of the requested stores do not exist."""
+
+    def __init__(self, store_ids: list[int]) -> None:
+        """Initialize the exception."""
+        self.store_id = store_ids[0]
+        self.store_ids = store_ids
+        formatted_ids = ", ".join(f"'{store_id}'" for store_id in store_ids)
+        Exception.__init__(self, f"Stores with ids {formatted_ids} do not exist.")
+
+
 log.info("Store custom api exceptions loaded.")
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.2 on 2026-10-18 07:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+from shoppingapp.database.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("stores", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="shoppingstore",
+            index=models.Index(fields=["user", "-updated_at"], name="store_user_updated_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="shoppingstore",
+            index=models.Index(fields=["store_type"], name="store_type_idx"),
+        ),
+    ]
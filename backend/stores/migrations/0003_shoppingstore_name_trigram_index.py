@@ -0,0 +1,24 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+from shoppingapp.database.operations import PostgresRunSQL
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("stores", "0002_shoppingstore_indexes"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        PostgresRunSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS store_name_trgm_idx "
+                "ON stores_shoppingstore USING gin (name gin_trgm_ops);"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS store_name_trgm_idx;",
+        ),
+    ]
@@ -8,6 +8,7 @@ from django.db.models import (
     CharField,
     DateTimeField,
     ForeignKey,
+    Index,
     IntegerField,
     Model,
     TextField,
@@ -29,6 +30,14 @@ class ShoppingStore(Model):
     updated_at = DateTimeField(auto_now=True)
     user = ForeignKey(User, on_delete=CASCADE)
 
+    class Meta:
+        """Meta class for the ShoppingStore model."""
+
+        indexes = [
+            Index(fields=["user", "-updated_at"], name="store_user_updated_idx"),
+            Index(fields=["store_type"], name="store_type_idx"),
+        ]
+
     def __str__(self) -> str:
         """Return a string representation of the shopping store."""
         return f"{self.name}"
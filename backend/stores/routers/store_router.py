@@ -2,11 +2,12 @@
 
 import logging
 
-from django.http import HttpRequest
-from ninja import Router
+from django.http import HttpRequest, StreamingHttpResponse
+from ninja import P, QueryEx, Router
 
 from authentication.auth.api_key import ApiKey
 from shoppingapp.schemas.shared import DeleteSchema
+from shoppingapp.utilities.streaming import ExportFormat
 from stores.constants import STORE_TYPE_MAPPING
 from stores.schemas.input import NewStore, StoreDescription, StoreSearch
 from stores.schemas.output import (
@@ -57,19 +58,22 @@ async def get_mapping(request: HttpRequest) -> dict[int, str]:
 
 
 @store_router.get("/detail/{store_id}", response={200: StoreSchema})
-async def get_store_detail(request: HttpRequest, store_id: int) -> StoreSchema:
+async def get_store_detail(
+    request: HttpRequest, store_id: int, with_stats: bool = False
+) -> StoreSchema:
     """
     Get the store details.
 
     Args:
         request (HttpRequest): The HTTP request.
         store_id (int): The store ID.
+        with_stats (bool): Whether to include the item count, total price and average price.
 
     Returns:
         StoreSchema: The store details.
     """
     log.info(f"User requested store detail for store: {store_id}.")
-    store = await store_service.get_store_detail(store_id)
+    store = await store_service.get_store_detail(store_id, with_stats=with_stats)
     return store
 
 
@@ -107,7 +111,13 @@ async def get_store_aggregation_by_user(request: HttpRequest) -> StoreAggregatio
 
 
 @store_router.get("", response={200: StorePaginationSchema})
-async def get_stores(request: HttpRequest, limit: int = 10, page: int = 1) -> StorePaginationSchema:
+async def get_stores(
+    request: HttpRequest,
+    limit: QueryEx[int, P(ge=1)] = 10,
+    page: int = 1,
+    include_total: bool = True,
+    with_stats: bool = False,
+) -> StorePaginationSchema:
     """
     Get the stores.
 
@@ -115,31 +125,49 @@ async def get_stores(request: HttpRequest, limit: int = 10, page: int = 1) -> St
         request (HttpRequest): The HTTP request.
         limit (int): The limit of stores to get per page.
         page (int): The page number.
+        include_total (bool): Whether to count the total number of stores, total and total_pages
+            are null when disabled.
+        with_stats (bool): Whether to include the item count, total price and average price of
+            every store.
 
     Returns:
         StorePaginationSchema: The stores.
     """
     log.info(f"User requested stores with limit ({limit}) for page: {page}.")
-    result = await store_service.get_stores(limit, page)
+    result = await store_service.get_stores(
+        limit, page, include_total=include_total, with_stats=with_stats
+    )
     return result
 
 
 @store_router.get("/me", response={200: StorePaginationSchema})
 async def get_personal_stores(
-    request: HttpRequest, limit: int = 10, page: int = 1
+    request: HttpRequest,
+    limit: QueryEx[int, P(ge=1)] = 10,
+    page: int = 1,
+    include_total: bool = True,
+    with_stats: bool = False,
 ) -> StorePaginationSchema:
     """
     Get the stores you have created.
 
     Args:
         request (HttpRequest): The HTTP request.
+        limit (int): The limit of stores to get per page.
+        page (int): The page number.
+        include_total (bool): Whether to count the total number of stores, total and total_pages
+            are null when disabled.
+        with_stats (bool): Whether to include the item count, total price and average price of
+            every store.
 
     Returns:
         StorePaginationSchema: The stores.
     """
     user = await request.auser()
     log.info(f"User requested personal stores with limit ({limit}) for page: {page}.")
-    result = await store_service.get_stores(limit, page, user)
+    result = await store_service.get_stores(
+        limit, page, user, include_total=include_total, with_stats=with_stats
+    )
     return result
 
 
@@ -209,9 +237,11 @@ async def search(
     request: HttpRequest,
     filters: StoreSearch,
     page: int = 1,
-    limit: int = 10,
+    limit: QueryEx[int, P(ge=1)] = 10,
     name: str | None = None,
     own: bool = False,
+    include_total: bool = True,
+    with_stats: bool = False,
 ) -> StorePaginationSchema:
     """
     Perform search for stores.
@@ -223,6 +253,10 @@ async def search(
         limit (int): The number of stores per page.
         name (str): Full or partial name to search for.
         own (bool): Flag indicating if you would like to see only your own stores.
+        include_total (bool): Whether to count the total number of stores, total and total_pages
+            are null when disabled.
+        with_stats (bool): Whether to include the item count, total price and average price of
+            every store.
 
     Returns:
         StorePaginationSchema: The stores in a paginated response.
@@ -246,6 +280,53 @@ async def search(
         updated_on=filters.updated_on,
         updated_before=filters.updated_before,
         updated_after=filters.updated_after,
+        include_total=include_total,
+        with_stats=with_stats,
+    )
+
+
+@store_router.post("/export")
+async def export(
+    request: HttpRequest,
+    filters: StoreSearch,
+    name: str | None = None,
+    own: bool = False,
+    format: ExportFormat = "ndjson",
+) -> StreamingHttpResponse:
+    """
+    Export every store that matches the search filters.
+
+    The stores are streamed from a database cursor, so the memory used does not depend on the
+    number of stores.
+
+    Args:
+        request (HttpRequest): The HTTP request to the API.
+        filters (StoreSearch): The body containing the filters.
+        name (str): Full or partial name to search for.
+        own (bool): Flag indicating if you would like to export only your own stores.
+        format (ExportFormat): Either ndjson or csv.
+
+    Returns:
+        StreamingHttpResponse: The streamed stores.
+    """
+    user = None
+    if own:
+        user = await request.auser()
+
+    log.info("User exporting stores...")
+
+    return await store_service.export_stores(
+        export_format=format,
+        name=name,
+        user=user,
+        ids=filters.ids,
+        store_types=filters.store_types,
+        created_on=filters.created_on,
+        created_before=filters.created_before,
+        created_after=filters.created_after,
+        updated_on=filters.updated_on,
+        updated_before=filters.updated_before,
+        updated_after=filters.updated_after,
     )
 
 
@@ -29,9 +29,16 @@ class StoreSchemaNoUser(ModelSchema):
 
 
 class StoreSchema(ModelSchema):
-    """Store model schema for outgoing data."""
+    """
+    Store model schema for outgoing data.
+
+    The item statistics are only provided when they are requested, they are null otherwise.
+    """
 
     user: UserSchema | None = None
+    item_count: int | None = None
+    total_price: float | None = None
+    avg_price: float | None = None
 
     class Meta:
         """Meta class for the StoreSchema."""
@@ -61,9 +68,9 @@ class StoreAggregationSchema(Schema):
 class StorePaginationSchema(Schema):
     """Pagination schema for outgoing data."""
 
-    total: int = 0
+    total: int | None = 0
     page_number: int = 1
-    total_pages: int = 1
+    total_pages: int | None = 1
     has_previous: bool = False
     previous_page: int | None = None
     has_next: bool = False
@@ -2,14 +2,18 @@
 
 import logging
 from datetime import date
+from functools import partial
 from typing import Any
 
 from asgiref.sync import sync_to_async
 from django.contrib.auth.models import AbstractBaseUser, AnonymousUser, User
+from django.http import StreamingHttpResponse
 
 from items.database import item_repo
 from items.schemas.output import ItemPaginationSchema
 from shoppingapp.schemas.shared import DeleteSchema
+from shoppingapp.utilities.concurrency import gather_reads
+from shoppingapp.utilities.streaming import ExportFormat, stream_rows
 from stores.constants import STORE_TYPE_MAPPING
 from stores.database import store_repo
 from stores.errors.api_exceptions import (
@@ -113,12 +117,13 @@ async def create(new_store: NewStore, user: User | AbstractBaseUser | AnonymousU
     return store_schema
 
 
-async def get_store_detail(store_id: int) -> StoreSchema:
+async def get_store_detail(store_id: int, with_stats: bool = False) -> StoreSchema:
     """
     Get the store detail.
 
     Args:
         store_id (int): The id of the store.
+        with_stats (bool): Whether to include the item statistics of the store.
 
     Returns:
         StoreSchema: The store detail.
@@ -128,7 +133,7 @@ async def get_store_detail(store_id: int) -> StoreSchema:
     """
     try:
         log.info("Getting store details...")
-        store = await store_repo.get_store(store_id)
+        store = await store_repo.get_store(store_id, with_stats=with_stats)
         store_schema = StoreSchema.from_orm(store)
         return store_schema
     except Store.DoesNotExist:
@@ -140,24 +145,33 @@ async def get_store_detail_with_items(
     store_id: int, page_number: int = 1, items_per_page: int = 10
 ) -> tuple[StoreSchema, ItemPaginationSchema]:
     """
-    Get the store detail.
+    Get the store detail along with a page of its items.
+
+    The items are filtered on the store id, so both are fetched at the same time.
 
     Args:
         store_id (int): The id of the store.
+        page_number (int): The page of items.
+        items_per_page (int): The number of items per page.
 
     Returns:
-        StoreSchema: The store detail.
+        tuple[StoreSchema, ItemPaginationSchema]: The store detail and its items.
 
     Raises:
         StoreDoesNotExist: If the store does not exist.
     """
     try:
         log.info("Getting store details with related items...")
-        store = await store_repo.get_store(store_id)
-        store_schema = StoreSchema.from_orm(store)
-        related_items = await item_repo.get_items(
-            page=page_number, items_per_page=items_per_page, store=store
+        store, related_items = await gather_reads(
+            partial(store_repo.get_store, store_id),
+            partial(
+                item_repo.get_items,
+                page=page_number,
+                items_per_page=items_per_page,
+                store=store_id,
+            ),
         )
+        store_schema = StoreSchema.from_orm(store)
         return store_schema, related_items
     except Store.DoesNotExist:
         log.warning(STORE_DOES_NOT_EXIST)
@@ -185,6 +199,8 @@ async def get_stores(
     limit: int = 10,
     page_number: int = 1,
     user: Any | None = None,
+    include_total: bool = True,
+    with_stats: bool = False,
 ) -> StorePaginationSchema:
     """
     Get the stores.
@@ -193,12 +209,16 @@ async def get_stores(
         limit (int): The limit of stores per page.
         page_number (int): The page number.
         user (User): User who created the stores.
+        include_total (bool): Whether to count the total number of stores.
+        with_stats (bool): Whether to include the item statistics of every store.
 
     Returns:
         StorePaginationSchema: The stores in a paginated format.
     """
     log.info(f"Retrieving stores for page {page_number} with limit {limit}...")
-    paginated_stores = await store_repo.get_stores(page_number, limit, user)
+    paginated_stores = await store_repo.get_stores(
+        page_number, limit, user, include_total, with_stats=with_stats
+    )
     return paginated_stores
 
 
@@ -294,6 +314,8 @@ async def search_stores(
     updated_on: date | None = None,
     updated_before: date | None = None,
     updated_after: date | None = None,
+    include_total: bool = True,
+    with_stats: bool = False,
 ) -> StorePaginationSchema:
     """
     Search for stores based on criteria.
@@ -311,6 +333,8 @@ async def search_stores(
         updated_on (date): Date the store was last updated.
         updated_before (date): Date the store was last updated before.
         updated_after (date): Date the store was last updated after.
+        include_total (bool): Whether to count the total number of stores.
+        with_stats (bool): Whether to include the item statistics of every store.
 
     Returns:
         StorePaginationSchema: The schema result which contains the stores that were searched for.
@@ -338,7 +362,56 @@ async def search_stores(
         updated_before=updated_before,
         updated_after=updated_after,
         ids=ids,
+        include_total=include_total,
+        with_stats=with_stats,
+    )
+
+
+async def export_stores(
+    export_format: ExportFormat = "ndjson",
+    name: str | None = None,
+    user: Any | None = None,
+    ids: list[int] | None = None,
+    store_types: list[int] | None = None,
+    created_on: date | None = None,
+    created_before: date | None = None,
+    created_after: date | None = None,
+    updated_on: date | None = None,
+    updated_before: date | None = None,
+    updated_after: date | None = None,
+) -> StreamingHttpResponse:
+    """
+    Export every store that matches the search criteria as a stream.
+
+    Args:
+        export_format (ExportFormat): Either ndjson or csv.
+        name (str): Partial or full name of store.
+        user (User): The user that owns the store.
+        ids (list[int]): List of ids to filter from.
+        store_types (list[int]): List of store types to filter from.
+        created_on (date): The date the store was created.
+        created_before (date): Date the store was created before.
+        created_after (date): Date the store was created after.
+        updated_on (date): Date the store was last updated.
+        updated_before (date): Date the store was last updated before.
+        updated_after (date): Date the store was last updated after.
+
+    Returns:
+        StreamingHttpResponse: The streamed stores.
+    """
+    rows = store_repo.export_stores(
+        name=name,
+        user=user,
+        store_types=store_types,
+        created_on=created_on,
+        created_before=created_before,
+        created_after=created_after,
+        updated_on=updated_on,
+        updated_before=updated_before,
+        updated_after=updated_after,
+        ids=ids,
     )
+    return stream_rows(rows, store_repo.EXPORT_FIELDS, export_format, filename="stores")
 
 
 log.info("Store service loaded.")
@@ -0,0 +1,45 @@
+"""Contains tests for the store search date filters."""
+
+from datetime import date, datetime, timezone
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from stores.database import store_repo
+from stores.models import ShoppingStore as Store
+
+
+class TestStoreDateFilter(TestCase):
+    """Test that store date filters compile to timestamp ranges."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.user = User.objects.create(username="testuser", email="testuser@gmail.com")
+        self.store = Store.objects.create(name="Date Store", store_type=3, user=self.user)
+        Store.objects.filter(id=self.store.id).update(
+            updated_at=datetime(2024, 3, 10, 23, 59, tzinfo=timezone.utc)
+        )
+        return super().setUp()
+
+    def _search(self, **filters: Any) -> set[int]:
+        """Get the ids of the user's stores that match the date filters."""
+        stores = store_repo._build_query(user=self.user, **filters)
+        return set(stores.values_list("id", flat=True))
+
+    def test_updated_before_and_after_are_inclusive(self) -> None:
+        """Test that the before and after dates themselves match."""
+        self.assertEqual(self._search(updated_before=date(2024, 3, 10)), {self.store.id})
+        self.assertEqual(self._search(updated_after=date(2024, 3, 10)), {self.store.id})
+        self.assertEqual(self._search(updated_on=date(2024, 3, 10)), {self.store.id})
+        self.assertEqual(self._search(updated_before=date(2024, 3, 9)), set())
+        self.assertEqual(self._search(updated_after=date(2024, 3, 11)), set())
+
+    def test_updated_on_uses_index(self) -> None:
+        """Test that a date filter is answered with an index range scan."""
+        stores = store_repo._build_query(user=self.user, updated_on=date(2024, 3, 10))
+
+        plan = stores.explain()
+        self.assertIn("store_user_updated_idx", plan)
+        self.assertIn("updated_at>", plan)
+        self.assertIn("updated_at<", plan)
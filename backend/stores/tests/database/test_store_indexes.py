@@ -0,0 +1,51 @@
+"""Contains tests that check the store indexes are used by the repository queries."""
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.testcases import TestCase
+
+from stores.models import ShoppingStore as Store
+
+
+class TestStoreIndexes(TestCase):
+    """Test that the planner uses the store indexes for the repository access paths."""
+
+    def setUp(self) -> None:
+        """Seed a dataset large enough for the planner to prefer the indexes."""
+        self.users = [
+            User.objects.create(username=f"indexuser{index}", email=f"index{index}@gmail.com")
+            for index in range(10)
+        ]
+        Store.objects.bulk_create(
+            Store(
+                name=f"Index Store {index}",
+                store_type=(index % 3) + 1,
+                description="",
+                user=self.users[index % 10],
+            )
+            for index in range(2000)
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+            if connection.vendor == "postgresql":
+                # Only for the transaction of this test, so later tests plan as usual.
+                cursor.execute("SET LOCAL enable_seqscan = off")
+
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        """Tear down the tests."""
+        User.objects.all().delete()
+        Store.objects.all().delete()
+        return super().tearDown()
+
+    def test_user_listing_uses_index(self) -> None:
+        """Test that listing a user's stores uses the (user, -updated_at) index."""
+        queryset = Store.objects.filter(user=self.users[0]).order_by("-updated_at")
+        self.assertIn("store_user_updated_idx", queryset.explain())
+
+    def test_store_type_filter_uses_index(self) -> None:
+        """Test that filtering stores by type uses the store type index."""
+        queryset = Store.objects.filter(store_type__in=[1])
+        self.assertIn("store_type_idx", queryset.explain())
@@ -1,11 +1,22 @@
 """Test the aggregate function of the store repository."""
 
-from django.contrib.auth.models import User
-from django.test import TestCase
+from typing import Any
 
-from stores.database.store_repo import aggregate_stores
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from stores.database.store_repo import (
+    aggregate_stores,
+    create_store,
+    delete_store,
+    edit_store,
+)
 from stores.models import ShoppingStore as Store
 
+LOCAL_MEMORY_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
 
 class TestStoreRepoAggregate(TestCase):
     """Test the aggregate function of the store repository."""
@@ -69,3 +80,70 @@ class TestStoreRepoAggregate(TestCase):
         self.assertEqual(result["online_stores"], 0)
         self.assertEqual(result["in_store_stores"], 0)
         self.assertEqual(result["combined_stores"], 0)
+
+
+@override_settings(CACHES=LOCAL_MEMORY_CACHE)
+class TestStoreRepoAggregateCache(TestCase):
+    """Test the caching of the store aggregations."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        cache.clear()
+        self.user = User.objects.create(username="cacheuser", email="cacheuser@gmail.com")
+        self.store = Store.objects.create(name="Cached Store", store_type=1, user=self.user)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        """Tear down the tests."""
+        cache.clear()
+        return super().tearDown()
+
+    def _aggregate(self, user: User | AnonymousUser | None = None) -> dict[str, Any]:
+        """Aggregate the stores."""
+        return async_to_sync(aggregate_stores)(user=user)
+
+    def test_aggregate_single_query_then_cached(self) -> None:
+        """Test that the aggregation runs one query and is then served from the cache."""
+        with self.assertNumQueries(1):
+            self._aggregate(user=self.user)
+        with self.assertNumQueries(0):
+            result = self._aggregate(user=self.user)
+
+        self.assertEqual(result["online_stores"], 1)
+        self.assertEqual(result["total_stores"], 1)
+
+    def test_anonymous_user_aggregates_all_stores(self) -> None:
+        """Test that an anonymous user gets, and does not overwrite, the global aggregation."""
+        anonymous = self._aggregate(user=AnonymousUser())
+
+        self.assertEqual(anonymous["total_stores"], 1)
+        self.assertEqual(self._aggregate(), anonymous)
+
+    def test_create_invalidates(self) -> None:
+        """Test that creating a store invalidates the user and global aggregations."""
+        self._aggregate()
+        self._aggregate(user=self.user)
+
+        async_to_sync(create_store)("New Store", 2, "", self.user)
+
+        self.assertEqual(self._aggregate()["in_store_stores"], 1)
+        self.assertEqual(self._aggregate(user=self.user)["total_stores"], 2)
+
+    def test_edit_invalidates(self) -> None:
+        """Test that changing the type of a store invalidates the aggregations."""
+        self._aggregate(user=self.user)
+
+        async_to_sync(edit_store)(self.store.id, self.user, store_type=3)
+
+        result = self._aggregate(user=self.user)
+        self.assertEqual(result["online_stores"], 0)
+        self.assertEqual(result["combined_stores"], 1)
+
+    def test_delete_invalidates_on_commit(self) -> None:
+        """Test that deleting a store invalidates the aggregations once committed."""
+        self._aggregate()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            async_to_sync(delete_store)(self.store.id, self.user)
+
+        self.assertEqual(self._aggregate()["total_stores"], 0)
@@ -0,0 +1,102 @@
+"""Test the local store cache of the store repository."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+
+from stores.database import store_repo
+from stores.models import ShoppingStore as Store
+
+
+class TestStoreRepoCache(TestCase):
+    """Test the local store cache of the store repository."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.user = User.objects.create(username="cacheuser", email="cacheuser@gmail.com")
+        self.store = Store.objects.create(name="Cached Store", store_type=1, user=self.user)
+        return super().setUp()
+
+    def _get_store(self, store_id: int) -> Store:
+        """Get a store."""
+        return async_to_sync(store_repo.get_store)(store_id)
+
+    def test_get_store_cached(self) -> None:
+        """Test that a store is loaded once and then served from the cache."""
+        with self.assertNumQueries(1):
+            self._get_store(self.store.id)
+        with self.assertNumQueries(0):
+            store = self._get_store(self.store.id)
+
+        self.assertEqual(store.name, "Cached Store")
+        self.assertEqual(store.user.username, "cacheuser")
+        self.assertEqual(store_repo._store_cache.stats()["hits"], 1)
+
+    def test_get_store_returns_copies(self) -> None:
+        """Test that changing a returned store does not change the cached store."""
+        store = self._get_store(self.store.id)
+        store.name = "Changed"
+
+        self.assertEqual(self._get_store(self.store.id).name, "Cached Store")
+
+    def test_get_store_with_stats_not_cached(self) -> None:
+        """Test that stores with statistics are always read from the database."""
+        self._get_store(self.store.id)
+        with self.assertNumQueries(1):
+            async_to_sync(store_repo.get_store)(self.store.id, with_stats=True)
+
+    def test_expired_store_revalidated(self) -> None:
+        """Test that an expired store that did not change is revalidated with one query."""
+        self._get_store(self.store.id)
+        with patch("shoppingapp.utilities.cache.time.monotonic", return_value=10**9):
+            with self.assertNumQueries(1):
+                self._get_store(self.store.id)
+            with self.assertNumQueries(0):
+                self._get_store(self.store.id)
+
+    def test_expired_store_reloaded_when_changed(self) -> None:
+        """Test that an expired store is reloaded when it was changed by another worker."""
+        self._get_store(self.store.id)
+        Store.objects.filter(id=self.store.id).update(
+            name="Renamed", updated_at=timezone.now() + timedelta(seconds=1)
+        )
+
+        with patch("shoppingapp.utilities.cache.time.monotonic", return_value=10**9):
+            with self.assertNumQueries(2):
+                store = self._get_store(self.store.id)
+
+        self.assertEqual(store.name, "Renamed")
+
+    def test_edit_invalidates(self) -> None:
+        """Test that editing a store invalidates its cached row."""
+        self._get_store(self.store.id)
+        async_to_sync(store_repo.edit_store)(self.store.id, self.user, store_name="Edited")
+
+        self.assertEqual(self._get_store(self.store.id).name, "Edited")
+
+    def test_delete_invalidates_on_commit(self) -> None:
+        """Test that deleting a store invalidates its cached row once committed."""
+        self._get_store(self.store.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            async_to_sync(store_repo.delete_store)(self.store.id, self.user)
+
+        with self.assertRaises(Store.DoesNotExist):
+            self._get_store(self.store.id)
+
+    def test_existing_store_ids_skip_cached(self) -> None:
+        """Test that cached stores are not queried when checking which stores exist."""
+        other = Store.objects.create(name="Other Store", store_type=2, user=self.user)
+        self._get_store(self.store.id)
+        self._get_store(other.id)
+
+        with self.assertNumQueries(0):
+            existing = async_to_sync(store_repo.get_existing_store_ids)([self.store.id, other.id])
+        self.assertEqual(existing, {self.store.id, other.id})
+
+        with self.assertNumQueries(1):
+            existing = async_to_sync(store_repo.get_existing_store_ids)([self.store.id, 99999])
+        self.assertEqual(existing, {self.store.id})
@@ -1,8 +1,12 @@
 """Contains tests for the store repository functions."""
 
+from asgiref.sync import async_to_sync
 from django.contrib.auth.models import User
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
+from items.models import ShoppingItem, ShoppingItemAggregate
 from stores.database.store_repo import delete_store
 from stores.models import ShoppingStore
 
@@ -69,3 +73,74 @@ class TestStoreRepoCreate(TestCase):
 
         store_exists = await ShoppingStore.objects.filter(id=self.store.id).aexists()
         self.assertTrue(store_exists)
+
+    def test_delete_store_removes_items(self) -> None:
+        """Test delete_store removes the items at the store with a fixed number of queries."""
+        query_counts = []
+        for index, item_count in enumerate((5, 50)):
+            store = ShoppingStore.objects.create(
+                name=f"Cascade Store {index}", store_type=3, user=self.user
+            )
+            ShoppingItem.objects.bulk_create(
+                ShoppingItem(name=f"Item {number}", price=1, store=store, user=self.user)
+                for number in range(item_count)
+            )
+            # The items were created without the repository, rebuild the aggregate on delete
+            ShoppingItemAggregate.objects.all().delete()
+
+            with CaptureQueriesContext(connection) as queries:
+                async_to_sync(delete_store)(store.id, self.user)
+            query_counts.append(len(queries))
+
+            self.assertFalse(ShoppingItem.objects.filter(store_id=store.id).exists())
+
+        self.assertEqual(query_counts[0], query_counts[1])
+
+    def _stock_other_user_items(self) -> User:
+        """Stock items of another user at the store, with an up to date aggregate."""
+        other_user = User.objects.create(username="otheruser", email="otheruser@gmail.com")
+        ShoppingItem.objects.bulk_create(
+            [
+                ShoppingItem(name="Other Item", price=10, store=self.store, user=other_user),
+                ShoppingItem(name="Kept Item", price=5, store=self.other_store, user=other_user),
+            ]
+        )
+        ShoppingItemAggregate.objects.create(
+            user=other_user, total_items=2, total_price=15, max_price=10, min_price=5
+        )
+        return other_user
+
+    def test_delete_owner_with_other_users_items(self) -> None:
+        """Test deleting a user whose store holds items of another user."""
+        owner = User.objects.create(username="storeowner", email="storeowner@gmail.com")
+        self.store.user = owner
+        self.store.save()
+        self.other_store = ShoppingStore.objects.create(
+            name="Other Store", store_type=1, user=self.user
+        )
+        other_user = self._stock_other_user_items()
+
+        owner.delete()
+
+        self.assertFalse(ShoppingStore.objects.filter(id=self.store.id).exists())
+        self.assertEqual(
+            list(ShoppingItem.objects.filter(user=other_user).values_list("name", flat=True)),
+            ["Kept Item"],
+        )
+        aggregate = ShoppingItemAggregate.objects.get(user=other_user)
+        self.assertEqual(aggregate.total_items, 1)
+        self.assertEqual(aggregate.total_price, 5)
+
+    def test_delete_store_through_orm(self) -> None:
+        """Test deleting a store through the ORM, as the admin does, updates the aggregates."""
+        self.other_store = ShoppingStore.objects.create(
+            name="Other Store", store_type=1, user=self.user
+        )
+        other_user = self._stock_other_user_items()
+
+        self.store.delete()
+
+        self.assertFalse(ShoppingItem.objects.filter(store_id=self.store.id).exists())
+        aggregate = ShoppingItemAggregate.objects.get(user=other_user)
+        self.assertEqual(aggregate.total_items, 1)
+        self.assertEqual(aggregate.total_price, 5)
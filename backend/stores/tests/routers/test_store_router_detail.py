@@ -3,6 +3,7 @@
 from django.contrib.auth.models import User
 from django.test import Client, TestCase
 
+from items.models import ShoppingItem as Item
 from stores.models import ShoppingStore as Store
 
 TEST_STORE = "Test Store"
@@ -68,3 +69,19 @@ class TestStoreRouter(TestCase):
 
         self.assertEqual(response.status_code, 404)
         self.assertEqual(response.json()["detail"], "Store with id '100' does not exist.")
+
+    def test_get_store_detail_with_stats(self) -> None:
+        """Test getting a store detail with the item statistics."""
+        Item.objects.create(name="Stats Item", price=25, store=self.store, user=self.user)
+
+        response = self.client.get(
+            f"{DETAIL_ENDPOINT}/{self.store.id}?with_stats=true",
+            content_type=CONTENT_TYPE,
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+        response_json = response.json()
+        self.assertEqual(response_json["item_count"], 1)
+        self.assertEqual(response_json["total_price"], 25)
+        self.assertEqual(response_json["avg_price"], 25)
@@ -0,0 +1,77 @@
+"""Contains tests for the store router export endpoint."""
+
+import csv
+import json
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.http import StreamingHttpResponse
+from django.test import TestCase
+from django.test.client import AsyncClient
+
+from stores.database import store_repo
+from stores.models import ShoppingStore as Store
+
+CONTENT_TYPE = "application/json"
+
+
+class TestExportStoresEndpoint(TestCase):
+    """Test the export stores endpoint."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.async_client = AsyncClient()
+        self.user = User.objects.create_user(username="exporter", password="testing123")
+        self.alt_user = User.objects.create_user(username="altexporter", password="testing123")
+        self.store = Store.objects.create(
+            name="Export Store", store_type=1, description="Online", user=self.user
+        )
+        self.alt_store = Store.objects.create(
+            name="Other Store", store_type=2, description="In store", user=self.alt_user
+        )
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        """Tear down the tests."""
+        User.objects.all().delete()
+        Store.objects.all().delete()
+        return super().tearDown()
+
+    async def _export(self, query: str, body: dict[str, object] | None = None) -> str:
+        """Call the export endpoint and return the body."""
+        response = await self.async_client.post(
+            f"/api/v1/stores/export{query}", body or {}, CONTENT_TYPE
+        )
+        self.assertEqual(response.status_code, 200)
+        assert isinstance(response, StreamingHttpResponse)
+        chunks = [chunk async for chunk in response]
+        return b"".join(chunks).decode()
+
+    async def test_export_ndjson(self) -> None:
+        """Test exporting the stores as newline delimited JSON."""
+        body = await self._export("")
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([row["name"] for row in rows], ["Other Store", "Export Store"])
+        self.assertEqual(list(rows[0]), list(store_repo.EXPORT_FIELDS))
+
+    async def test_export_csv_with_filters(self) -> None:
+        """Test exporting the stores as CSV with the search filters."""
+        body = await self._export("?format=csv", {"store_types": [1]})
+        rows = list(csv.DictReader(StringIO(body)))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["name"], "Export Store")
+        self.assertEqual(rows[0]["user_id"], str(self.user.id))
+
+    async def test_export_own(self) -> None:
+        """Test exporting only your own stores."""
+        await self.async_client.aforce_login(self.alt_user)
+        body = await self._export("?own=true")
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([row["id"] for row in rows], [self.alt_store.id])
+
+    async def test_export_invalid_format(self) -> None:
+        """Test that an unknown format is rejected."""
+        response = await self.async_client.post(
+            "/api/v1/stores/export?format=xml", {}, CONTENT_TYPE
+        )
+        self.assertEqual(response.status_code, 422)
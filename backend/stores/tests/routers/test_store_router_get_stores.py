@@ -3,6 +3,7 @@
 from django.contrib.auth.models import User
 from django.test import Client, TestCase
 
+from items.models import ShoppingItem as Item
 from stores.models import ShoppingStore as Store
 
 TEST_STORE = "Test Store"
@@ -91,6 +92,12 @@ class TestGetStores(TestCase):
         self.assertEqual(result_json["stores"][0]["description"], TEST_DESCRIPTION)
         self.assertEqual(result_json["stores"][0]["user"]["username"], self.user.username)
 
+    def test_get_stores_with_invalid_limit(self) -> None:
+        """Test the get stores endpoint rejects a limit below 1."""
+        for limit in [0, -1]:
+            result = self.client.get(f"/api/v1/stores?limit={limit}")
+            self.assertEqual(result.status_code, 422)
+
     def test_get_personal_stores(self) -> None:
         """Test the personal stores endpoint."""
         self.client.force_login(self.user)
@@ -104,3 +111,32 @@ class TestGetStores(TestCase):
         self.assertEqual(result_json["stores"][0]["store_type"], TEST_STORE_TYPE)
         self.assertEqual(result_json["stores"][0]["description"], TEST_DESCRIPTION)
         self.assertEqual(result_json["stores"][0]["user"]["username"], self.user.username)
+
+    def test_get_stores_with_stats(self) -> None:
+        """Test the get stores endpoint annotates the item statistics in one query."""
+        Item.objects.bulk_create(
+            Item(name=f"Item {price}", price=price, store=self.store, user=self.user)
+            for price in (10, 20, 60)
+        )
+
+        with self.assertNumQueries(2):
+            result = self.client.get("/api/v1/stores?with_stats=true")
+        self.assertEqual(result.status_code, 200)
+
+        stores = {store["name"]: store for store in result.json()["stores"]}
+        self.assertEqual(stores[TEST_STORE]["item_count"], 3)
+        self.assertEqual(stores[TEST_STORE]["total_price"], 90)
+        self.assertEqual(stores[TEST_STORE]["avg_price"], 30)
+        self.assertEqual(stores["Alt Store"]["item_count"], 0)
+        self.assertEqual(stores["Alt Store"]["total_price"], 0)
+        self.assertIsNone(stores["Alt Store"]["avg_price"])
+        self.assertEqual(result.json()["total"], 2)
+
+    def test_get_stores_without_stats(self) -> None:
+        """Test the item statistics are only provided when requested."""
+        result = self.client.get("/api/v1/stores")
+
+        for store in result.json()["stores"]:
+            self.assertIsNone(store["item_count"])
+            self.assertIsNone(store["total_price"])
+            self.assertIsNone(store["avg_price"])
@@ -73,3 +73,17 @@ class TestSearch(TestCase):
         result_json = result.json()
         self.assertEqual(result_json["total"], 1)
         self.assertEqual(len(result_json["stores"]), 1)
+
+    def test_search_without_total(self) -> None:
+        """Test the search endpoint without counting the total."""
+        result = self.client.post(
+            "/api/v1/stores/search?name=Store&limit=1&include_total=false",
+            {},
+            content_type=CONTENT_TYPE,
+        )
+        self.assertEqual(result.status_code, 200)
+        result_json = result.json()
+        self.assertIsNone(result_json["total"])
+        self.assertIsNone(result_json["total_pages"])
+        self.assertTrue(result_json["has_next"])
+        self.assertEqual(len(result_json["stores"]), 1)
@@ -1,9 +1,17 @@
 """Contains tests for api store service."""
 
+import threading
+from unittest.mock import patch
+
 import pytest
+from asgiref.sync import async_to_sync, sync_to_async
 from django.contrib.auth.models import User
-from django.test import TestCase
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase, override_settings
 
+from items.database import item_repo
+from items.models import ShoppingItem as Item
+from stores.database import store_repo
 from stores.errors.api_exceptions import StoreDoesNotExist
 from stores.models import ShoppingStore as Store
 from stores.services.store_service import get_store_detail, get_store_detail_with_items
@@ -79,3 +87,62 @@ class TestStoreService(TestCase):
         """Test the get store detail service function with items."""
         with pytest.raises(StoreDoesNotExist):
             await get_store_detail_with_items(999999)
+
+
+@override_settings(PARALLEL_DB_READS=True)
+class TestStoreServiceParallelReads(TransactionTestCase):
+    """Test the store detail service with reads on separate connections."""
+
+    def setUp(self) -> None:
+        """Set up the tests."""
+        self.user = User.objects.create_user(username="testuser", password="testing123")
+        self.store = Store.objects.create(
+            name=TEST_STORE,
+            store_type=TEST_STORE_TYPE,
+            description=TEST_DESCRIPTION,
+            user=self.user,
+        )
+        self.item = Item.objects.create(
+            name="Test Item", price=2.5, description="", store=self.store, user=self.user
+        )
+        return super().setUp()
+
+    async def test_get_store_detail_with_items(self) -> None:
+        """Test that the store and its items are read on separate connections."""
+        threads: dict[str, int] = {}
+        get_store = store_repo.get_store
+        get_items = item_repo.get_items
+
+        async def record_store(*args: object, **kwargs: object) -> Store:
+            threads["store"] = await sync_to_async(threading.get_ident)()
+            return await get_store(*args, **kwargs)  # type: ignore
+
+        async def record_items(*args: object, **kwargs: object) -> object:
+            threads["items"] = await sync_to_async(threading.get_ident)()
+            return await get_items(*args, **kwargs)  # type: ignore
+
+        with (
+            patch.object(store_repo, "get_store", record_store),
+            patch.object(item_repo, "get_items", record_items),
+        ):
+            store, items = await get_store_detail_with_items(self.store.id)
+
+        self.assertEqual(store.model_dump().get("id"), self.store.id)
+        self.assertEqual(items.total, 1)
+        self.assertEqual(items.items[0].model_dump().get("id"), self.item.id)
+        self.assertNotEqual(threads["store"], threads["items"])
+
+    async def test_get_store_detail_with_items_with_invalid_id(self) -> None:
+        """Test that a missing store is still reported when the reads run concurrently."""
+        with pytest.raises(StoreDoesNotExist):
+            await get_store_detail_with_items(999999)
+
+    def test_get_store_detail_with_items_in_transaction(self) -> None:
+        """Test that reads inside a transaction share its connection and see its writes."""
+        with transaction.atomic():
+            Item.objects.create(
+                name="Uncommitted Item", price=1, description="", store=self.store, user=self.user
+            )
+            _, items = async_to_sync(get_store_detail_with_items)(self.store.id)
+
+        self.assertEqual(items.total, 2)
@@ -1,6 +1,7 @@
 """Contains the views for the stores app."""
 
 import logging
+from functools import partial
 
 from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
 from django.shortcuts import render
@@ -8,6 +9,7 @@ from django.views.decorators.http import require_http_methods
 
 from authentication.decorators import async_login_required
 from shoppingapp.schemas.shared import BaseContext
+from shoppingapp.utilities.concurrency import gather_reads
 from shoppingapp.utilities.utils import get_overview_params
 from stores.errors.api_exceptions import (
     InvalidStoreType,
@@ -152,8 +154,10 @@ async def _get_overview_context(
         (await request.auser(), "Your Stores") if is_personalized else (None, "All Stores")
     )
 
-    pagination = await store_service.get_stores(limit=limit, page_number=page, user=user)
-    aggregation = await store_service.aggregate(user=user)
+    pagination, aggregation = await gather_reads(
+        partial(store_service.get_stores, limit=limit, page_number=page, user=user),
+        partial(store_service.aggregate, user=user),
+    )
     context = StoreOverviewContext(
         pagination=pagination,
         aggregation=aggregation,
@@ -59,11 +59,13 @@ class TestCase(FastHttpUser):
     @task
     @tag("api")
     def types_mapping(self):
-        """Get store types mapping."""
-        self.client.get(
-            "/api/v1/stores/types/mapping",
-            headers={"Content-Type": "application/json", "X-API-Key": KEY},
-        )
+        """Get store types mapping, revalidating it like a caching client would."""
+        headers = {"Content-Type": "application/json", "X-API-Key": KEY}
+        etag = getattr(self, "mapping_etag", None)
+        if etag:
+            headers["If-None-Match"] = etag
+        response = self.client.get("/api/v1/stores/types/mapping", headers=headers)
+        self.mapping_etag = response.headers.get("ETag") or etag
 
     @task
     @tag("api")
@@ -162,6 +164,16 @@ class TestCase(FastHttpUser):
             )
             data = response.json()
 
+    @task
+    @tag("api")
+    def export_stores(self):
+        """Export stores."""
+        self.client.post(
+            "/api/v1/stores/export",
+            json={},
+            headers={"Content-Type": "application/json", "X-API-Key": KEY},
+        )
+
     @task
     @tag("api")
     def get_aggregations(self):